@@ -0,0 +1,63 @@
+import pandas as pd
+
+# 여러 시계열을 같은 날짜 축으로 맞추는 공통 정렬 함수
+# 날짜를 문자열로 바꿔 집합으로 비교하는 대신, 인덱스(datetime64)를 한 번 정규화한 뒤
+# inner/outer 조인 또는 asof(직전 값) 조인으로 한 패널(DataFrame)을 만든다.
+
+# 일봉 이상 주기 (인덱스를 타임존 없는 날짜로 정규화)
+DAILY_INTERVALS = ('1d', '5d', '1wk', '1mo', '3mo')
+
+
+def normalize_index(index, intraday=None, tz=None):
+    """타임존/세션 날짜 정규화 - 일봉은 타임존 없는 (현지) 날짜, 분봉/시간봉은 UTC 시각
+
+    intraday가 None이면 인덱스에 시각 정보가 있는지로 판단한다.
+    타임존 없는 분봉/시간봉 인덱스는 tz(현지 시간대)로 지정해야 하며, 없으면 ValueError.
+    """
+    index = pd.DatetimeIndex(index)
+    local = index.tz_localize(None) if index.tz is not None else index
+    if intraday is None:
+        intraday = bool(len(local)) and bool((local != local.normalize()).any())
+    if intraday:
+        if index.tz is None:
+            if tz is None:
+                raise ValueError("타임존 없는 분봉/시간봉 인덱스는 tz를 지정해야 합니다")
+            index = index.tz_localize(tz)
+        return index.tz_convert('UTC')
+    return local.normalize()
+
+
+def normalize(data, intraday=None, tz=None):
+    """Series/DataFrame 인덱스 정규화 (정렬, 같은 날짜는 마지막 값 사용)"""
+    data = data.copy()
+    data.index = normalize_index(data.index, intraday=intraday, tz=tz)
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index(kind='stable')
+    if data.index.has_duplicates:
+        data = data[~data.index.duplicated(keep='last')]
+    return data
+
+
+def align(series, how='inner', intraday=None, tolerance=None, tz=None):
+    """여러 시계열을 한 패널로 정렬 ({이름: Series} -> 이름별 컬럼 DataFrame)
+
+    how: 'inner' (모든 시계열에 값이 있는 날짜), 'outer' (모든 날짜),
+         'asof' (첫 번째 시계열의 날짜 기준, 나머지는 그 시점의 직전 값, tolerance로 최대 간격 제한)
+    tz: 타임존 없는 분봉/시간봉 시계열의 현지 시간대 (문자열 또는 {이름: 시간대})
+    """
+    series = {name: normalize(values, intraday=intraday, tz=tz.get(name) if isinstance(tz, dict) else tz)
+              for name, values in series.items()
+              if values is not None and len(values) > 0}
+    if not series:
+        return pd.DataFrame()
+
+    if how in ('inner', 'outer'):
+        return pd.concat(series, axis=1, join=how).sort_index()
+    if how == 'asof':
+        names = list(series)
+        base_index = series[names[0]].index
+        columns = {names[0]: series[names[0]]}
+        for name in names[1:]:
+            columns[name] = series[name].reindex(base_index, method='ffill', tolerance=tolerance)
+        return pd.DataFrame(columns, index=base_index)
+    raise ValueError(f"지원하지 않는 정렬 방식: {how}")
@@ -0,0 +1,41 @@
+import importlib
+
+# 페이지 레지스트리
+# 페이지마다 모듈 하나(render() 함수)를 두고, 처음 방문할 때 불러온다.
+# 이후 실행에서는 이미 불러온 모듈을 재사용하므로 매 실행마다 현재 페이지의 render()만 실행된다.
+
+# 페이지 키 (st.session_state.current_page): 모듈 이름 (None = 내용 없는 페이지)
+PAGES = {
+    'main': None,
+    'market_analysis': None,
+    'etf_analysis': None,
+    'market_risk_dashboard': 'market_risk_dashboard',
+    'kospi_put_call_ratio': 'market_risk_dashboard_ii',
+    'finra_margin_debt': 'finra_margin_debt',
+    'market_sentiment': 'market_sentiment',
+    'sofr_10y_bond_yield': 'sofr_10y_bond_yield',
+    'etf_consumer': 'etf_consumer',
+    'etf_it_hardware_software': 'etf_it_hardware_software',
+    'etf_commodity': 'etf_commodity',
+}
+
+
+def load_page(page):
+    """페이지 모듈 불러오기 (처음 한 번만 import, 없는 페이지는 None)"""
+    module_name = PAGES.get(page)
+    if module_name is None:
+        return None
+    return importlib.import_module(f"{__name__}.{module_name}")
+
+
+def preload_pages():
+    """모든 페이지 모듈 미리 불러오기 (PAGE_IMPORT_MODE=eager)"""
+    for page in PAGES:
+        load_page(page)
+
+
+def render_page(page):
+    """현재 페이지 그리기"""
+    module = load_page(page)
+    if module is not None:
+        module.render()
@@ -0,0 +1,314 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from downsample import downsample
+from figure_cache import cached_figure
+from price_store import get_histories, panel_frame
+from render_mode import apply_render_mode
+from universe import COMMODITY_ETFS
+
+# ETF Commodity 페이지
+
+
+def render():
+    """ETF Commodity 페이지 그리기"""
+    st.title("ETF Commodity Analysis")
+    
+    # 날짜 선택을 3개 컬럼으로 배치
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**Start Date**")
+        start_date = st.date_input(
+            "",
+            value=datetime.now() - timedelta(days=365),
+            max_value=datetime.now(),
+            label_visibility="collapsed",
+            key="commodity_start"
+        )
+    
+    with col2:
+        st.markdown("**End Date**")
+        end_date = st.date_input(
+            "",
+            value=datetime.now(),
+            max_value=datetime.now(),
+            label_visibility="collapsed",
+            key="commodity_end"
+        )
+    
+    with col3:
+        st.markdown("**Period**")
+        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
+        period_labels = {
+            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
+            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
+            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
+        }
+        selected_period = st.selectbox(
+            "",
+            period_options, 
+            index=5,
+            format_func=lambda x: period_labels[x],
+            label_visibility="collapsed",
+            key="commodity_period"
+        )
+    
+    # 상품 관련 ETF들
+    commodity_etfs = COMMODITY_ETFS
+    
+    # 카테고리별 분류
+    gold_etfs = ['GLD', 'IAU', 'FGDL']
+    silver_etfs = ['SLV', 'SIVR', 'SIL']
+    copper_etfs = ['COPX', 'CPER']
+    
+    # 분석 유형 선택
+    analysis_type = st.selectbox(
+        "분석 유형",
+        ["Gold vs Silver vs Copper", "전체 상품 ETF", "개별 ETF 선택"],
+        key="commodity_analysis_type"
+    )
+    
+    if analysis_type == "Gold vs Silver vs Copper":
+        selected_etfs = gold_etfs + silver_etfs + copper_etfs
+    elif analysis_type == "전체 상품 ETF":
+        selected_etfs = list(commodity_etfs.keys())
+    else:
+        selected_etfs = st.multiselect(
+            "분석할 ETF 선택",
+            list(commodity_etfs.keys()),
+            default=['GLD', 'SLV', 'COPX'],
+            key="commodity_multiselect"
+        )
+    
+    if selected_etfs:
+        # 데이터 다운로드
+        data = {}
+        with st.spinner("상품 ETF 데이터를 불러오는 중..."):
+            try:
+                panel = get_histories(selected_etfs, start=start_date, end=end_date)
+                for ticker in selected_etfs:
+                    data[ticker] = panel_frame(panel, ticker)
+            except Exception as e:
+                st.error(f"상품 ETF 데이터 로드 실패: {e}")
+        
+        if data:
+            # 성과 비교
+            returns = {}
+            for ticker, df in data.items():
+                if not df.empty:
+                    returns[ticker] = (df['Close'] / df['Close'].iloc[0] - 1) * 100
+            
+            # 수익률 차트 - 입력 데이터가 바뀐 경우에만 다시 만듦
+            fig = cached_figure(
+                'etf_commodity_returns',
+                lambda: _build_returns_figure(returns, commodity_etfs, gold_etfs, silver_etfs),
+                inputs=(returns,)
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # 성과 지표 테이블
+            performance_data = []
+            for ticker, df in data.items():
+                if not df.empty:
+                    total_return = (df['Close'].iloc[-1] / df['Close'].iloc[0] - 1) * 100
+                    volatility = df['Close'].pct_change().std() * np.sqrt(252) * 100
+                    sharpe_ratio = (df['Close'].pct_change().mean() * 252) / (df['Close'].pct_change().std() * np.sqrt(252))
+                    
+                    # 카테고리 분류
+                    if ticker in gold_etfs:
+                        category = "Gold"
+                    elif ticker in silver_etfs:
+                        category = "Silver"
+                    else:
+                        category = "Copper"
+                    
+                    performance_data.append({
+                        'ETF': ticker,
+                        'Category': category,
+                        'Name': commodity_etfs[ticker],
+                        'Total Return (%)': f"{total_return:.2f}",
+                        'Volatility (%)': f"{volatility:.2f}",
+                        'Sharpe Ratio': f"{sharpe_ratio:.3f}"
+                    })
+            
+            if performance_data:
+                performance_df = pd.DataFrame(performance_data)
+                
+                # 세련된 테이블 스타일링
+                st.markdown("""
+                <style>
+                .performance-table {
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    border-radius: 15px;
+                    padding: 15px;
+                    margin: 10px 0;
+                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+                }
+                .performance-table .stDataFrame {
+                    background: white;
+                    border-radius: 10px;
+                    overflow: hidden;
+                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+                }
+                /* 그래프와 테이블 간격 줄이기 */
+                .stPlotlyChart {
+                    margin-bottom: 10px !important;
+                }
+                </style>
+                """, unsafe_allow_html=True)
+                
+                st.markdown('<div class="performance-table">', unsafe_allow_html=True)
+                st.dataframe(
+                    performance_df, 
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "ETF": st.column_config.TextColumn("ETF", width="small"),
+                        "Category": st.column_config.TextColumn("Category", width="small"),
+                        "Name": st.column_config.TextColumn("ETF Name", width="medium"),
+                        "Total Return (%)": st.column_config.NumberColumn("Total Return (%)", format="%.2f"),
+                        "Volatility (%)": st.column_config.NumberColumn("Volatility (%)", format="%.2f"),
+                        "Sharpe Ratio": st.column_config.NumberColumn("Sharpe Ratio", format="%.3f")
+                    }
+                )
+                st.markdown('</div>', unsafe_allow_html=True)
+            
+            # 상관관계 분석
+            if len(selected_etfs) > 1:
+                # 상관관계 계산을 위한 데이터 준비
+                correlation_data = {}
+                for ticker, df in data.items():
+                    if not df.empty and 'Close' in df.columns:
+                        # 일일 수익률 계산
+                        daily_returns = df['Close'].pct_change().dropna()
+                        correlation_data[ticker] = daily_returns
+                
+                if len(correlation_data) > 1:
+                    # 상관관계 매트릭스 계산
+                    correlation_df = pd.DataFrame(correlation_data)
+                    correlation_matrix = correlation_df.corr()
+                    
+                    # 상관관계 히트맵
+                    fig_corr = cached_figure(
+                        'etf_commodity_correlation',
+                        lambda: _build_correlation_figure(correlation_matrix),
+                        inputs=(correlation_matrix,)
+                    )
+                    
+                    st.plotly_chart(fig_corr, use_container_width=True)
+
+
+def _build_returns_figure(returns, commodity_etfs, gold_etfs, silver_etfs):
+    """누적 수익률 차트 만들기"""
+    fig = go.Figure()
+    
+    # 색상 구분
+    colors = {
+        'gold': ['gold', 'orange', 'darkorange'],
+        'silver': ['silver', 'gray', 'darkgray'],
+        'copper': ['brown', 'saddlebrown', 'maroon']
+    }
+    
+    color_idx = 0
+    for ticker, returns_data in returns.items():
+        if ticker in gold_etfs:
+            color = colors['gold'][color_idx % len(colors['gold'])]
+            name = f"🥇 {ticker} ({commodity_etfs[ticker]})"
+        elif ticker in silver_etfs:
+            color = colors['silver'][color_idx % len(colors['silver'])]
+            name = f"🥈 {ticker} ({commodity_etfs[ticker]})"
+        else:  # copper
+            color = colors['copper'][color_idx % len(colors['copper'])]
+            name = f"🥉 {ticker} ({commodity_etfs[ticker]})"
+        
+        returns_line = downsample(returns_data)
+        fig.add_trace(go.Scatter(
+            x=returns_line.index,
+            y=returns_line.values,
+            name=name,
+            line=dict(color=color, width=2)
+        ))
+        color_idx += 1
+    
+    fig.update_layout(
+        height=600,
+        plot_bgcolor='rgba(248, 249, 250, 0.8)',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12, color='#2c3e50'),
+        showlegend=True,
+        legend=dict(
+            x=0.0,
+            y=1.0,
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor='#bdc3c7',
+            borderwidth=1,
+            font=dict(size=12)
+        ),
+        hovermode='x unified',
+        hoverlabel=dict(
+            bgcolor='rgba(255, 255, 255, 0.9)',
+            bordercolor='#bdc3c7',
+            font_size=12,
+            font_family="Arial"
+        ),
+        margin=dict(t=30, b=30, l=30, r=30)
+    )
+    
+    # x축 스타일링
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50')
+    )
+    
+    # y축 스타일링
+    fig.update_yaxes(
+        title_text="Cumulative Return (%)",
+        title_font=dict(size=14, color='#2c3e50'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50')
+    )
+    return apply_render_mode(fig)
+
+
+def _build_correlation_figure(correlation_matrix):
+    """상관관계 히트맵 만들기"""
+    fig_corr = go.Figure(data=go.Heatmap(
+        z=correlation_matrix.values,
+        x=correlation_matrix.columns,
+        y=correlation_matrix.columns,
+        colorscale='RdBu',
+        zmid=0,
+        text=np.round(correlation_matrix.values, 3),
+        texttemplate="%{text}",
+        textfont={"size": 12},
+        hoverongaps=False
+    ))
+    
+    fig_corr.update_layout(
+        title="상품 ETF 상관관계 매트릭스",
+        height=500,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12, color='#2c3e50'),
+        margin=dict(t=50, b=30, l=30, r=30)
+    )
+    return fig_corr
@@ -0,0 +1,19 @@
+import streamlit as st
+
+from charts import plot_margin_debt_vs_sp500
+from market_data import get_finra_margin_debt_and_sp500
+
+# FINRA Margin Debt vs S&P 500 페이지
+
+
+def render():
+    """FINRA Margin Debt vs S&P 500 페이지 그리기"""
+    st.title("FINRA Margin Debt vs S&P 500")
+    st.markdown("""
+    FINRA(미국 금융산업규제국)에서 발표하는 마진 부채(Margin Debt)와 S&P 500 지수의 관계를 시각화합니다. 
+    마진 부채는 투자자들이 빚을 내서 주식을 얼마나 사고 있는지 보여주는 지표로, 시장 과열/과매도 신호로 해석될 수 있습니다.
+    """)
+    
+    with st.spinner("데이터를 불러오는 중..."):
+        data = get_finra_margin_debt_and_sp500()
+    plot_margin_debt_vs_sp500(data)
@@ -0,0 +1,618 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from downsample import downsample
+from figure_cache import cached_figure
+from fred_mirror import get_fred_series
+from indicators import indicator
+from price_store import get_history, get_histories, panel_frame
+from render_mode import apply_render_mode
+from symbol_resolver import resolve_symbol
+from universe import MARKET_INDICES, MARKET_INDEX_NAMES
+
+# Market Risk Dashboard 페이지
+
+
+def render():
+    """Market Risk Dashboard 페이지 그리기"""
+    # 날짜 선택을 3개 컬럼으로 배치
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**Start Date**")
+        start_date = st.date_input(
+            "",
+            value=datetime.now() - timedelta(days=365),
+            max_value=datetime.now(),
+            label_visibility="collapsed"
+        )
+    
+    with col2:
+        st.markdown("**End Date**")
+        end_date = st.date_input(
+            "",
+            value=datetime.now(),
+            max_value=datetime.now(),
+            label_visibility="collapsed"
+        )
+    
+    with col3:
+        st.markdown("**Period**")
+        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
+        period_labels = {
+            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
+            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
+            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
+        }
+        selected_period = st.selectbox(
+            "",
+            period_options, 
+            index=5,
+            format_func=lambda x: period_labels[x],
+            label_visibility="collapsed"
+        )
+    
+    
+    # 주요 지수들
+    indices = MARKET_INDICES
+    index_names = MARKET_INDEX_NAMES
+    
+    # 데이터 다운로드 (전체 지수를 한 번의 일괄 요청으로 조회)
+    data = {}
+    with st.spinner("시장 데이터를 불러오는 중..."):
+        try:
+            panel = get_histories(indices, period=selected_period)
+            for i, index in enumerate(indices):
+                data[index_names[i]] = panel_frame(panel, index)
+        except Exception as e:
+            st.error(f"시장 데이터 로드 실패: {e}")
+    
+    if data:
+        # VIX가 있는 경우 VVIX (세 번째 subplot), SDEX (두 번째 subplot) 데이터
+        # 대체 티커 중 데이터가 나오는 심볼 사용 (이전에 실패한 심볼은 건너뜀)
+        vvix_data = None
+        sdex_data = None
+        if 'VIX' in data and not data['VIX'].empty:
+            vvix_tickers = ['^VVIX', 'VVIX', 'VVIX.VI']
+            _, vvix_data = resolve_symbol('vvix', [
+                (ticker, lambda ticker=ticker: get_history(ticker, period=selected_period))
+                for ticker in vvix_tickers
+            ])
+            
+            sdex_tickers = ['^SDEX', 'SDEX', 'SDEX.VI']
+            _, sdex_data = resolve_symbol('sdex', [
+                (ticker, lambda ticker=ticker: get_history(ticker, period=selected_period))
+                for ticker in sdex_tickers
+            ])
+        
+        # ICE BofA US High Yield Index 데이터 (5번째 subplot)
+        filtered_spread = None
+        try:
+            # 선택된 기간에 따라 날짜 범위 계산 - selected_period와 정확히 일치
+            if selected_period == 'MAX':
+                start_date_fred = datetime.now() - timedelta(days=3650)
+                end_date_fred = datetime.now()
+            elif selected_period == '10Y':
+                start_date_fred = datetime.now() - timedelta(days=3650)
+                end_date_fred = datetime.now()
+            elif selected_period == '5Y':
+                start_date_fred = datetime.now() - timedelta(days=1825)
+                end_date_fred = datetime.now()
+            elif selected_period == '2Y':
+                start_date_fred = datetime.now() - timedelta(days=730)
+                end_date_fred = datetime.now()
+            elif selected_period == '1Y':
+                start_date_fred = datetime.now() - timedelta(days=365)
+                end_date_fred = datetime.now()
+            elif selected_period == '6MO':
+                start_date_fred = datetime.now() - timedelta(days=180)
+                end_date_fred = datetime.now()
+            elif selected_period == '3MO':
+                start_date_fred = datetime.now() - timedelta(days=90)
+                end_date_fred = datetime.now()
+            elif selected_period == '1MO':
+                start_date_fred = datetime.now() - timedelta(days=30)
+                end_date_fred = datetime.now()
+            elif selected_period == '5D':
+                start_date_fred = datetime.now() - timedelta(days=5)
+                end_date_fred = datetime.now()
+            elif selected_period == '1D':
+                start_date_fred = datetime.now() - timedelta(days=1)
+                end_date_fred = datetime.now()
+            else:  # YTD
+                start_date_fred = datetime(datetime.now().year, 1, 1)
+                end_date_fred = datetime.now()
+        
+            # FRED에서 High Yield Spread 데이터 가져오기
+            high_yield_spread = get_fred_series('BAMLH0A0HYM2', start=start_date_fred.strftime('%Y-%m-%d'), end=end_date_fred.strftime('%Y-%m-%d'))
+        
+            if not high_yield_spread.empty:
+                # 선택된 기간에 따라 필터링
+                start_datetime = pd.to_datetime(start_date_fred)
+                end_datetime = pd.to_datetime(end_date_fred)
+            
+                filtered_spread = high_yield_spread[
+                    (high_yield_spread.index >= start_datetime) & 
+                    (high_yield_spread.index <= end_datetime)
+                ]
+            
+                if not filtered_spread.empty:
+                    # 날짜 형식 확인 및 수정
+                    filtered_spread.index = pd.to_datetime(filtered_spread.index)
+                    # 타임존 제거하여 다른 데이터와 일치시키기
+                    filtered_spread.index = filtered_spread.index.tz_localize(None)
+        except Exception as e:
+            st.write(f"ICE BofA 데이터 로드 실패: {e}")
+        
+        # 통합 그래프 - 입력 데이터가 바뀐 경우에만 다시 만듦
+        fig = cached_figure(
+            'market_risk_dashboard',
+            lambda: _build_figure(data, vvix_data, sdex_data, filtered_spread),
+            inputs=(data, vvix_data, sdex_data, filtered_spread)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # ICE BofA 그래프는 이제 subplot에 포함됨
+        
+        # 차트 옵션 제거됨
+        
+        # 가격 차트 제거됨
+            
+        # S&P 500 subplots와 ICE BofA 그래프만 유지
+        # 다른 차트들은 제거됨
+            
+        # 변동성 차트 제거됨
+        
+        # 상관관계 분석 제거됨
+
+
+def _build_figure(data, vvix_data, sdex_data, high_yield_spread):
+    """통합 그래프 (S&P 500 + NASDAQ, VIX vs SDEX, VIX/VVIX, VVIX/VIX, ICE BofA) 만들기"""
+    # 통합 그래프 (S&P 500 + NASDAQ, VIX vs SDEX) - 완전한 동기화를 위해 subplot 사용
+    from plotly.subplots import make_subplots
+    
+    # 5개의 subplot 생성 (상하 배치) - S&P 500 + NASDAQ, VIX vs SDEX, VIX/VVIX, VVIX/VIX, ICE BofA
+    fig = make_subplots(
+        rows=5, cols=1,
+        subplot_titles=('', '', '', '', ''),
+        vertical_spacing=0.03,  # 그래프 간 적절한 간격 유지
+        row_heights=[0.2667, 0.1833, 0.1833, 0.1833, 0.1833],  # S&P 500 + NASDAQ: 26.67% (2/3 축소), 나머지 각 18.33%
+        shared_xaxes=False,  # x축을 개별적으로 표시하여 각 그래프 하단에 날짜 표시
+        shared_yaxes=False,  # y축은 분리
+        specs=[
+            [{"secondary_y": True}],   # Row 1: S&P 500 + NASDAQ
+            [{"secondary_y": True}],   # Row 2: VIX + SDEX
+            [{"secondary_y": True}],   # Row 3: VIX + VVIX
+            [{"secondary_y": False}],  # Row 4: VVIX/VIX
+            [{"secondary_y": False}]   # Row 5: ICE BofA
+        ]
+    )
+    
+    # S&P 500 데이터 추가 (첫 번째 subplot) - data 딕셔너리에서 가져오기
+    if 'S&P 500' in data and not data['S&P 500'].empty:
+        sp500_line = downsample(data['S&P 500']['Close'])
+        fig.add_trace(
+            go.Scatter(
+                x=sp500_line.index,
+                y=sp500_line.values,
+                name='S&P 500',
+                mode='lines',
+                line=dict(color='#2E7D32', width=2),
+                legendgroup="row1",
+                showlegend=True
+            ),
+            row=1, col=1, secondary_y=False
+        )
+        
+        # S&P 500 제목은 go.Scatter의 name으로 표시
+        
+        
+        
+    else:
+        # S&P 500 데이터가 없는 경우 빈 그래프라도 표시
+        fig.add_trace(
+            go.Scatter(
+                x=[],
+                y=[],
+                name='S&P 500',
+                mode='lines',
+                line=dict(color='#2E7D32', width=2),
+                legendgroup="row1",
+                showlegend=True
+            ),
+            row=1, col=1, secondary_y=False
+        )
+    
+    # NASDAQ 데이터 추가 (첫 번째 subplot, 오른쪽 축) - 무조건 추가
+    nasdaq_data = data.get('NASDAQ', pd.DataFrame())
+    if not nasdaq_data.empty:
+        nasdaq_line = downsample(nasdaq_data['Close'])
+        fig.add_trace(
+            go.Scatter(
+                x=nasdaq_line.index,
+                y=nasdaq_line.values,
+                name='NASDAQ',
+                mode='lines',
+                line=dict(color='#1976D2', width=2),
+                legendgroup="row1",
+                showlegend=True
+            ),
+            row=1, col=1, secondary_y=True
+        )
+    else:
+        # NASDAQ 데이터가 없는 경우에도 빈 그래프 추가 (범례에 표시되도록)
+        fig.add_trace(
+            go.Scatter(
+                x=[],
+                y=[],
+                name='NASDAQ',
+                mode='lines',
+                line=dict(color='#1976D2', width=2),
+                legendgroup="row1",
+                showlegend=True
+            ),
+            row=1, col=1, secondary_y=True
+        )
+    
+        
+    
+    # VIX vs SDEX 데이터 추가 (두 번째 subplot)
+    if 'VIX' in data and not data['VIX'].empty:
+        vix_line = downsample(data['VIX']['Close'])
+        fig.add_trace(
+            go.Scatter(
+                x=vix_line.index,
+                y=vix_line.values,
+                name='VIX',
+                mode='lines',
+                line=dict(color='#1A237E', width=2),
+                legendgroup="row2",
+                showlegend=True
+            ),
+            row=2, col=1, secondary_y=False
+        )
+        
+        # VVIX 데이터 추가 (세 번째 subplot)
+        if vvix_data is not None and not vvix_data.empty:
+            # Row 3에 VIX 추가 (왼쪽 축)
+            fig.add_trace(
+                go.Scatter(
+                    x=vix_line.index,
+                    y=vix_line.values,
+                    name='VIX',
+                    mode='lines',
+                    line=dict(color='#1A237E', width=2),
+                    legendgroup="row3",
+                    showlegend=True
+                ),
+                row=3, col=1, secondary_y=False
+            )
+            
+            # Row 3에 VVIX 추가 (오른쪽 축)
+            vvix_line = downsample(vvix_data['Close'])
+            fig.add_trace(
+                go.Scatter(
+                    x=vvix_line.index,
+                    y=vvix_line.values,
+                    name='VVIX',
+                    mode='lines',
+                    line=dict(color='#FF9800', width=2),
+                    legendgroup="row3",
+                    showlegend=True
+                ),
+                row=3, col=1, secondary_y=True
+            )
+            
+            # VVIX/VIX 비율 계산 및 그래프 (네 번째 subplot)
+            vvix_vix_ratio = indicator('VVIX/VIX', {'VIX': data['VIX']['Close'], 'VVIX': vvix_data['Close']})
+            
+            if not vvix_vix_ratio.empty:
+                ratio_line = downsample(vvix_vix_ratio)
+                fig.add_trace(
+                    go.Scatter(
+                        x=ratio_line.index,
+                        y=ratio_line.values,
+                        name='VVIX/VIX',
+                        mode='lines',
+                        line=dict(color='#F44336', width=2),
+                        legendgroup="row4",
+                        showlegend=True
+                    ),
+                    row=4, col=1
+                )
+        
+        # SDEX를 두 번째 subplot에 추가 (오른쪽 축)
+        if sdex_data is not None and not sdex_data.empty:
+            sdex_line = downsample(sdex_data['Close'])
+            fig.add_trace(
+                go.Scatter(
+                    x=sdex_line.index,
+                    y=sdex_line.values,
+                    name='SDEX',
+                    mode='lines',
+                    line=dict(color='#2196F3', width=2),
+                    legendgroup="row2",
+                    showlegend=True
+                ),
+                row=2, col=1, secondary_y=True
+            )
+    
+    # ICE BofA US High Yield Index 데이터 추가 (5번째 subplot)
+    if high_yield_spread is not None and not high_yield_spread.empty:
+        spread_line = downsample(high_yield_spread)
+        fig.add_trace(
+            go.Scatter(
+                x=spread_line.index,
+                y=spread_line.values,
+                name='ICE BofA US High Yield Index Option-Adjusted Spread',
+                mode='lines',
+                line=dict(color='purple', width=2),
+                legendgroup="row5",
+                showlegend=True
+            ),
+            row=5, col=1
+        )
+                
+        # ICE BofA 제목은 go.Scatter의 name으로 표시
+    
+    # 통합 레이아웃 설정
+    # 각 subplot에 개별 legend를 표시하기 위해 showlegend=False로 설정하고
+    # 각 subplot의 위치에 legend를 배치
+    fig.update_layout(
+        height=1700,  # 2개 subplot을 위해 높이 조정
+        plot_bgcolor='rgba(248, 249, 250, 0.8)',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12, color='#2c3e50'),
+        showlegend=True,  # legend 활성화
+        legend=dict(
+            orientation="h",  # 가로 방향
+            x=0,  # 그래프 프레임 왼쪽 경계와 일치
+            y=1.02,  # 상단 (약간 위로)
+            xanchor="left",
+            yanchor="bottom",
+            bgcolor='rgba(0, 0, 0, 0)',  # 투명 배경
+            bordercolor='rgba(0, 0, 0, 0)',  # 투명 테두리
+            borderwidth=0,  # 테두리 제거
+            font=dict(
+                size=11,
+                color='#2c3e50',
+                family="Arial"
+            ),
+            itemclick="toggleothers",  # 클릭 시 다른 항목은 유지하고 선택한 항목만 토글
+            itemdoubleclick="toggle",  # 더블클릭 시 해당 항목만 토글
+            traceorder="normal",  # 정상 순서
+            itemsizing="constant",  # 일정한 크기
+            itemwidth=30  # 아이템 너비 설정
+        ),
+        margin=dict(t=80, b=30, l=50, r=30),  # 상단 마진 추가로 레전드 공간 확보
+        hovermode='x unified',  # x축 통합 모드로 완전한 동기화
+        hoverlabel=dict(
+            bgcolor='rgba(255, 255, 255, 0.9)',
+            bordercolor='#bdc3c7',
+            font_size=12,
+            font_family="Arial"
+        )
+    )
+    
+    # 각 subplot에 개별 legend를 표시하기 위해
+    # 각 trace의 legendgroup을 사용하여 그룹화하고
+    # 각 subplot의 위치에 legend를 배치
+    # row_heights = [0.2667, 0.1833, 0.1833, 0.1833, 0.1833], vertical_spacing = 0.03
+    # 각 subplot의 y 위치 계산 (상단부터, paper 좌표계 사용)
+    # Row 1: y_top = 1.0, y_bottom = 1.0 - 0.2667 = 0.7333
+    # Row 2: y_top = 0.7333 - 0.03 = 0.7033, y_bottom = 0.7033 - 0.1833 = 0.52
+    # Row 3: y_top = 0.52 - 0.03 = 0.49, y_bottom = 0.49 - 0.1833 = 0.3067
+    # Row 4: y_top = 0.3067 - 0.03 = 0.2767, y_bottom = 0.2767 - 0.1833 = 0.0934
+    # Row 5: y_top = 0.0934 - 0.03 = 0.0634, y_bottom = 0.0634 - 0.1833 = -0.1199
+    
+    # 각 subplot에 개별 legend를 표시하기 위해
+    # 각 trace의 legendgroup을 사용하여 그룹화하고
+    # 각 subplot의 위치에 legend를 배치
+    # Plotly에서는 subplot별로 개별 legend를 직접 설정할 수 없지만
+    # 각 trace의 legendgroup을 사용하여 그룹화하고
+    # 각 subplot의 위치에 legend를 배치할 수 있습니다
+    
+    # 각 subplot에 개별 legend를 표시하기 위해
+    # 각 trace의 legendgroup을 사용하여 그룹화하고
+    # 각 subplot의 위치에 legend를 배치
+    # 실제 구현: 각 subplot에 대해 개별 legend를 표시하기 위해
+    # 각 trace의 legendgroup을 사용하여 그룹화하고
+    # 각 subplot의 위치에 legend를 배치하는 방법을 사용
+    
+    # x축 개별 표시 및 스타일링 (각 그래프 하단에 날짜 표시)
+    # Row 1: S&P 500 + NASDAQ
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50'),
+        row=1, col=1
+    )
+    # Row 2: FED Funds Rate + US 10-Year Treasury vs MOVE Index
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50'),
+        row=2, col=1
+    )
+    # Row 3: VIX + VVIX
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50'),
+        row=3, col=1
+    )
+    # Row 4: VVIX/VIX
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50'),
+        row=4, col=1
+    )
+    # Row 5: ICE BofA
+    fig.update_xaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        title_font=dict(size=13, color='#2c3e50'),
+        row=5, col=1
+    )
+    
+    
+    # y축 스타일링 및 제목 설정
+    # Row 2: VIX (왼쪽) + SDEX (오른쪽)
+    fig.update_yaxes(
+        title_text="VIX",
+        title_font=dict(size=14, color='#2c3e50'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=2, col=1, secondary_y=False
+    )
+    fig.update_yaxes(
+        title_text="SDEX",
+        title_font=dict(size=14, color='#2196F3'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=2, col=1, secondary_y=True
+    )
+    
+    # Row 3: VIX (왼쪽) + VVIX (오른쪽)
+    fig.update_yaxes(
+        title_text="VIX",
+        title_font=dict(size=14, color='#1A237E'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=3, col=1, secondary_y=False
+    )
+    fig.update_yaxes(
+        title_text="VVIX",
+        title_font=dict(size=14, color='#FF9800'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=3, col=1, secondary_y=True
+    )
+    
+    # Row 4: VVIX/VIX
+    fig.update_yaxes(
+        title_text="VVIX/VIX",
+        title_font=dict(size=14, color='#F44336'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=4, col=1
+    )
+    
+    # Row 5: ICE BofA US High Yield Index
+    fig.update_yaxes(
+        title_text="Spread (%)",
+        title_font=dict(size=14, color='purple'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=5, col=1
+    )
+    
+    # Row 1: S&P 500 (왼쪽) + NASDAQ (오른쪽)
+    fig.update_yaxes(
+        title_text="S&P 500",
+        title_font=dict(size=14, color='#2E7D32'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(189, 195, 199, 0.3)',
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=1, col=1, secondary_y=False
+    )
+    fig.update_yaxes(
+        title_text="NASDAQ",
+        title_font=dict(size=14, color='#1976D2'),
+        title_standoff=10,
+        automargin=True,
+        showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
+        showline=True,
+        linewidth=1,
+        linecolor='#34495e',
+        mirror=True,
+        tickfont=dict(size=11, color='#2c3e50'),
+        row=1, col=1, secondary_y=True
+    )
+    return apply_render_mode(fig)
@@ -0,0 +1,122 @@
+import streamlit as st
+from datetime import datetime, timedelta
+
+from charts import plot_high_yield_spread, plot_sp500_candlestick, plot_breakeven_inflation, plot_aud_usd
+from fetch_engine import FetchTask, iter_completed
+from market_data import (
+    get_high_yield_spread,
+    get_breakeven_inflation,
+    get_sp500_data,
+    get_aud_usd_bundle,
+    warn_aud_usd_volatility_drop,
+)
+
+# Market Sentiment 페이지
+
+
+def render():
+    """Market Sentiment 페이지 그리기"""
+    st.title("Market Sentiment")
+    
+    # 날짜 선택 (맨 위로 이동)
+    st.subheader("날짜 범위 설정")
+    
+    col_date1, col_date2, col_date3 = st.columns(3)
+    with col_date1:
+        start_date = st.date_input(
+            "시작 날짜",
+            value=datetime.now() - timedelta(days=365),
+            max_value=datetime.now(),
+            key="sentiment_start"
+        )
+    with col_date2:
+        end_date = st.date_input(
+            "종료 날짜",
+            value=datetime.now(),
+            max_value=datetime.now(),
+            key="sentiment_end"
+        )
+    with col_date3:
+        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
+        selected_period = st.selectbox("분석 기간", period_options, index=5, key="sentiment_period")
+    
+    # 분석기간에 따른 날짜 계산 (사용자가 직접 입력한 날짜 우선)
+    if selected_period != '1Y':  # 기본값이 아닌 경우에만 계산
+        end_date = datetime.now()
+        if selected_period == '1D':
+            start_date = end_date - timedelta(days=1)
+        elif selected_period == '5D':
+            start_date = end_date - timedelta(days=5)
+        elif selected_period == '1MO':
+            start_date = end_date - timedelta(days=30)
+        elif selected_period == '3MO':
+            start_date = end_date - timedelta(days=90)
+        elif selected_period == '6MO':
+            start_date = end_date - timedelta(days=180)
+        elif selected_period == '2Y':
+            start_date = end_date - timedelta(days=730)
+        elif selected_period == '5Y':
+            start_date = end_date - timedelta(days=1825)
+        elif selected_period == '10Y':
+            start_date = end_date - timedelta(days=3650)
+        elif selected_period == 'YTD':
+            start_date = datetime(end_date.year, 1, 1)
+        elif selected_period == 'MAX':
+            start_date = datetime(2019, 1, 1)  # 최대 2019년부터
+    
+    # 날짜를 문자열로 변환
+    start_date_str = start_date.strftime('%Y-%m-%d')
+    end_date_str = end_date.strftime('%Y-%m-%d')
+    
+    st.markdown("---")
+    
+    # 2x2 그리드로 그래프 배치 - 자리를 먼저 잡아두고 데이터가 도착하는 순서대로 채움
+    col1, col2 = st.columns(2)
+    with col1:
+        high_yield_slot = st.empty()
+    with col2:
+        sp500_slot = st.empty()
+    
+    # 상하 간격 추가
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col3, col4 = st.columns(2)
+    with col3:
+        inflation_slot = st.empty()
+    with col4:
+        aud_usd_slot = st.empty()
+    
+    high_yield_slot.info("High Yield CDS 데이터를 불러오는 중...")
+    sp500_slot.info("S&P 500 데이터를 불러오는 중...")
+    inflation_slot.info("기대인플레이션 데이터를 불러오는 중...")
+    aud_usd_slot.info("AUD/USD 데이터를 불러오는 중...")
+    
+    # 4개 소스(FRED 2개, Yahoo 2개)를 동시에 조회 - 전체 대기 시간은 가장 느린 소스 하나
+    sentiment_tasks = {
+        'high_yield': FetchTask(get_high_yield_spread, start_date_str, end_date_str, timeout=30),
+        'sp500': FetchTask(get_sp500_data, start_date_str, end_date_str, timeout=20),
+        'inflation': FetchTask(get_breakeven_inflation, start_date_str, end_date_str, timeout=30),
+        'aud_usd': FetchTask(get_aud_usd_bundle, start_date_str, end_date_str, timeout=20),
+    }
+    
+    for name, result, error in iter_completed(sentiment_tasks):
+        if error is not None:
+            print(f"Market Sentiment {name} 조회 실패: {error}")
+        
+        if name == 'high_yield':
+            with high_yield_slot.container():
+                plot_high_yield_spread(result)
+        elif name == 'sp500':
+            with sp500_slot.container():
+                plot_sp500_candlestick(result)
+        elif name == 'inflation':
+            with inflation_slot.container():
+                plot_breakeven_inflation(result)
+        else:
+            # 봉차트와 변동성은 한 번 받은 AUD/USD 데이터 묶음에서 함께 계산됨
+            with aud_usd_slot.container():
+                warn_aud_usd_volatility_drop(result)
+                if result is None:
+                    plot_aud_usd(None, None)
+                else:
+                    plot_aud_usd(result['candles'], result['volatility'])
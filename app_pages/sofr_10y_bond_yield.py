@@ -0,0 +1,250 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from fred_mirror import get_fred_series
+
+# SOFR & US 10-Year Bond Yield 페이지
+
+
+def render():
+    """SOFR & US 10-Year Bond Yield 페이지 그리기"""
+    # 날짜 선택을 3개 컬럼으로 배치
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**Start Date**")
+        start_date = st.date_input(
+            "",
+            value=datetime.now() - timedelta(days=365),
+            max_value=datetime.now(),
+            label_visibility="collapsed",
+            key="sofr_start"
+        )
+    
+    with col2:
+        st.markdown("**End Date**")
+        end_date = st.date_input(
+            "",
+            value=datetime.now(),
+            max_value=datetime.now(),
+            label_visibility="collapsed",
+            key="sofr_end"
+        )
+    
+    with col3:
+        st.markdown("**Period**")
+        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
+        period_labels = {
+            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
+            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
+            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
+        }
+        selected_period = st.selectbox(
+            "",
+            period_options, 
+            index=5,
+            format_func=lambda x: period_labels[x],
+            label_visibility="collapsed",
+            key="sofr_period"
+        )
+    
+    # FRED API를 사용하여 SOFR과 US 10-Year Bond Yield 데이터 가져오기
+    with st.spinner("경제 지표 데이터를 불러오는 중..."):
+        try:
+            # 선택된 기간에 따라 날짜 범위 계산
+            if selected_period == 'MAX':
+                start_date_fred = datetime.now() - timedelta(days=3650)
+                end_date_fred = datetime.now()
+            elif selected_period == '10Y':
+                start_date_fred = datetime.now() - timedelta(days=3650)
+                end_date_fred = datetime.now()
+            elif selected_period == '5Y':
+                start_date_fred = datetime.now() - timedelta(days=1825)
+                end_date_fred = datetime.now()
+            elif selected_period == '2Y':
+                start_date_fred = datetime.now() - timedelta(days=730)
+                end_date_fred = datetime.now()
+            elif selected_period == '1Y':
+                start_date_fred = datetime.now() - timedelta(days=365)
+                end_date_fred = datetime.now()
+            elif selected_period == '6MO':
+                start_date_fred = datetime.now() - timedelta(days=180)
+                end_date_fred = datetime.now()
+            elif selected_period == '3MO':
+                start_date_fred = datetime.now() - timedelta(days=90)
+                end_date_fred = datetime.now()
+            elif selected_period == '1MO':
+                start_date_fred = datetime.now() - timedelta(days=30)
+                end_date_fred = datetime.now()
+            elif selected_period == '5D':
+                start_date_fred = datetime.now() - timedelta(days=5)
+                end_date_fred = datetime.now()
+            elif selected_period == '1D':
+                start_date_fred = datetime.now() - timedelta(days=1)
+                end_date_fred = datetime.now()
+            else:  # YTD
+                start_date_fred = datetime(datetime.now().year, 1, 1)
+                end_date_fred = datetime.now()
+            
+            # FRED에서 SOFR 데이터 가져오기
+            sofr_data = get_fred_series('SOFR', start=start_date_fred.strftime('%Y-%m-%d'), end=end_date_fred.strftime('%Y-%m-%d'))
+            
+            # FRED에서 US 10-Year Bond Yield 데이터 가져오기
+            bond_yield_data = get_fred_series('DGS10', start=start_date_fred.strftime('%Y-%m-%d'), end=end_date_fred.strftime('%Y-%m-%d'))
+            
+            # FRED에서 FED 기준금리 데이터 가져오기
+            fed_rate_data = get_fred_series('DFF', start=start_date_fred.strftime('%Y-%m-%d'), end=end_date_fred.strftime('%Y-%m-%d'))
+            
+            if not sofr_data.empty and not bond_yield_data.empty:
+                # 날짜 형식 통일 및 타임존 제거
+                sofr_data.index = pd.to_datetime(sofr_data.index).tz_localize(None)
+                bond_yield_data.index = pd.to_datetime(bond_yield_data.index).tz_localize(None)
+                
+                # FED 기준금리 데이터 처리 (데이터가 있는 경우)
+                if not fed_rate_data.empty:
+                    fed_rate_data.index = pd.to_datetime(fed_rate_data.index).tz_localize(None)
+                
+                # 선택된 기간에 따라 필터링
+                start_datetime = pd.to_datetime(start_date_fred)
+                end_datetime = pd.to_datetime(end_date_fred)
+                
+                filtered_sofr = sofr_data[
+                    (sofr_data.index >= start_datetime) & 
+                    (sofr_data.index <= end_datetime)
+                ]
+                
+                filtered_bond_yield = bond_yield_data[
+                    (bond_yield_data.index >= start_datetime) & 
+                    (bond_yield_data.index <= end_datetime)
+                ]
+                
+                # FED 기준금리 필터링
+                filtered_fed_rate = pd.Series(dtype=float)
+                if not fed_rate_data.empty:
+                    filtered_fed_rate = fed_rate_data[
+                        (fed_rate_data.index >= start_datetime) & 
+                        (fed_rate_data.index <= end_datetime)
+                    ]
+                
+                if not filtered_sofr.empty and not filtered_bond_yield.empty:
+                    # 하나의 차트에 두 그래프 표시 (secondary_y 사용)
+                    from plotly.subplots import make_subplots
+                    
+                    fig = make_subplots(
+                        rows=1, cols=1,
+                        specs=[[{"secondary_y": True}]]
+                    )
+                    
+                    # SOFR 데이터 추가 (왼쪽 축)
+                    fig.add_trace(
+                        go.Scatter(
+                            x=filtered_sofr.index,
+                            y=filtered_sofr.values,
+                            name='SOFR',
+                            line=dict(color='#1A237E', width=2)
+                        ),
+                        row=1, col=1, secondary_y=False
+                    )
+                    
+                    # US 10-Year Bond Yield 데이터 추가 (오른쪽 축)
+                    fig.add_trace(
+                        go.Scatter(
+                            x=filtered_bond_yield.index,
+                            y=filtered_bond_yield.values,
+                            name='US 10-Year Bond Yield',
+                            line=dict(color='#F44336', width=2)
+                        ),
+                        row=1, col=1, secondary_y=True
+                    )
+                    
+                    # FED 기준금리 데이터 추가 (왼쪽 축, SOFR과 함께)
+                    if not filtered_fed_rate.empty:
+                        fig.add_trace(
+                            go.Scatter(
+                                x=filtered_fed_rate.index,
+                                y=filtered_fed_rate.values,
+                                name='FED Funds Rate',
+                                line=dict(color='#1B5E20', width=2, dash='dot')
+                            ),
+                            row=1, col=1, secondary_y=False
+                        )
+                    
+                    # 레이아웃 설정
+                    fig.update_layout(
+                        height=600,
+                        plot_bgcolor='rgba(248, 249, 250, 0.8)',
+                        paper_bgcolor='white',
+                        font=dict(family="Arial", size=12, color='#2c3e50'),
+                        showlegend=True,
+                        legend=dict(
+                            x=0.0,
+                            y=1.0,
+                            bgcolor='rgba(255, 255, 255, 0.8)',
+                            bordercolor='#bdc3c7',
+                            borderwidth=1,
+                            font=dict(size=12)
+                        ),
+                        hovermode='x unified',
+                        hoverlabel=dict(
+                            bgcolor='rgba(255, 255, 255, 0.9)',
+                            bordercolor='#bdc3c7',
+                            font_size=12,
+                            font_family="Arial"
+                        )
+                    )
+                    
+                    # x축 스타일링
+                    fig.update_xaxes(
+                        showgrid=True,
+                        gridwidth=1,
+                        gridcolor='rgba(189, 195, 199, 0.3)',
+                        showline=True,
+                        linewidth=1,
+                        linecolor='#34495e',
+                        mirror=True,
+                        tickfont=dict(size=11, color='#2c3e50'),
+                        title_font=dict(size=13, color='#2c3e50'),
+                        title_text="Date"
+                    )
+                    
+                    # y축 스타일링 (왼쪽: SOFR)
+                    fig.update_yaxes(
+                        title_text="SOFR (%)",
+                        title_font=dict(size=14, color='#1A237E'),
+                        title_standoff=10,
+                        automargin=True,
+                        showgrid=True,
+                        gridwidth=1,
+                        gridcolor='rgba(189, 195, 199, 0.3)',
+                        showline=True,
+                        linewidth=1,
+                        linecolor='#34495e',
+                        mirror=True,
+                        tickfont=dict(size=11, color='#2c3e50'),
+                        row=1, col=1, secondary_y=False
+                    )
+                    
+                    # y축 스타일링 (오른쪽: US 10-Year Bond Yield)
+                    fig.update_yaxes(
+                        title_text="US 10-Year Bond Yield (%)",
+                        title_font=dict(size=14, color='#F44336'),
+                        title_standoff=10,
+                        automargin=True,
+                        showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
+                        showline=True,
+                        linewidth=1,
+                        linecolor='#34495e',
+                        mirror=True,
+                        tickfont=dict(size=11, color='#2c3e50'),
+                        row=1, col=1, secondary_y=True
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.warning("선택한 기간에 데이터가 없습니다.")
+            else:
+                st.error("FRED API에서 데이터를 불러올 수 없습니다.")
+        except Exception as e:
+            st.error(f"데이터 로드 실패: {e}")
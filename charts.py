@@ -0,0 +1,440 @@
+import os
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from date_buckets import candle_freq, resample_ohlcv
+from downsample import downsample
+from render_mode import apply_render_mode
+
+# 페이지에서 공통으로 사용하는 그래프 함수
+
+# 봉차트 폭 (픽셀)과 봉 하나에 필요한 최소 폭 (픽셀)
+# 일봉 개수가 폭 / 최소 폭을 넘으면 주봉, 주봉도 넘으면 월봉으로 집계해서 그린다.
+CANDLE_CHART_WIDTH = int(os.getenv('CANDLE_CHART_WIDTH', '600'))
+CANDLE_MIN_PX = int(os.getenv('CANDLE_MIN_PX', '2'))
+
+CANDLE_LABELS = {'D': '', 'W': ' (Weekly)', 'M': ' (Monthly)', 'Q': ' (Quarterly)', 'A': ' (Yearly)'}
+
+
+def candle_bars(data):
+    """봉차트용 OHLCV (기간 길이와 차트 폭에 맞춰 일봉/주봉/월봉) -> (데이터, 제목 접미사)"""
+    freq = candle_freq(data.index, max(CANDLE_CHART_WIDTH // CANDLE_MIN_PX, 1))
+    return resample_ohlcv(data, freq), CANDLE_LABELS[freq]
+
+
+def plot_margin_debt_vs_sp500(data):
+    """FINRA margin debt와 S&P 500 비교 그래프"""
+    if data is None or data.empty:
+        st.error("데이터가 없습니다.")
+        return
+    
+    # 날짜 선택
+    col1, col2 = st.columns(2)
+    with col1:
+        # 5년 전 날짜 계산
+        five_years_ago = pd.Timestamp.now() - pd.DateOffset(years=5)
+        start_date = st.date_input(
+            "시작 날짜",
+            value=five_years_ago.date(),
+            min_value=data.index.min().to_pydatetime().date(),
+            max_value=data.index.max().to_pydatetime().date(),
+            key="margin_start"
+        )
+    with col2:
+        end_date = st.date_input(
+            "종료 날짜",
+            value=pd.Timestamp.now().date(),  # 오늘 날짜로 설정
+            min_value=data.index.min().to_pydatetime().date(),
+            max_value=pd.Timestamp.now().date(),  # 오늘 날짜까지
+            key="margin_end"
+        )
+    
+    # 기간 선택
+    period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
+    selected_period = st.selectbox("분석 기간", period_options, index=5, key="margin_period")
+    
+    # 선택된 날짜 범위로 필터링
+    start_datetime = pd.to_datetime(start_date)
+    end_datetime = pd.to_datetime(end_date)
+    
+    # 타임존 문제 해결: 모든 날짜를 타임존 무시로 통일
+    try:
+        # 데이터 인덱스를 타임존 무시로 변환
+        data_no_tz = data.copy()
+        if data_no_tz.index.tz is not None:
+            data_no_tz.index = data_no_tz.index.tz_localize(None)
+        
+        # 시작/끝 날짜도 타임존 무시로 변환
+        start_datetime_no_tz = start_datetime.tz_localize(None) if start_datetime.tz is not None else start_datetime
+        end_datetime_no_tz = end_datetime.tz_localize(None) if end_datetime.tz is not None else end_datetime
+        
+        # 데이터 필터링 전 확인
+        filtered_data = data_no_tz[(data_no_tz.index >= start_datetime_no_tz) & (data_no_tz.index <= end_datetime_no_tz)]
+        
+    except Exception as e:
+        # 타임존 변환 실패 시 원본 데이터 사용
+        st.warning(f"날짜 필터링 중 오류 발생: {e}")
+        filtered_data = data
+    
+    if filtered_data.empty:
+        st.warning("선택한 날짜 범위에 데이터가 없습니다.")
+        return
+    
+    # 하나의 그래프에 S&P 500과 Margin Debt 통합
+    fig = go.Figure()
+    
+    # S&P 500 그래프 (왼쪽 Y축) - daily 데이터를 화면 폭 정도의 점 수로 줄여서 표시
+    sp500_line = downsample(filtered_data['S&P_500'])
+    fig.add_trace(
+        go.Scatter(
+            x=sp500_line.index,
+            y=sp500_line.values,
+            name='S&P 500',
+            line=dict(color='#1f77b4', width=1.5),  # 실선으로 표시
+            yaxis='y',
+            mode='lines',  # 모든 daily 데이터를 선으로 연결
+            connectgaps=False,  # 빈 데이터는 연결하지 않음
+            hovertemplate='<b>%{x}</b><br>S&P 500: %{y:.2f}<extra></extra>'  # 호버 정보 개선
+        )
+    )
+    
+    # Margin Debt 그래프 (오른쪽 Y축) - 분기별 데이터를 선으로 연결
+    # NaN 값 제거하되, 2025년 Q1 데이터는 포함
+    margin_debt_data = filtered_data[filtered_data['Margin_Debt'].notna()]
+    
+    if not margin_debt_data.empty:
+        fig.add_trace(
+            go.Scatter(
+                x=margin_debt_data.index,
+                y=margin_debt_data['Margin_Debt'],
+                name='Margin Debt',
+                line=dict(color='#ff7f0e', width=2),
+                yaxis='y2',
+                mode='lines+markers',  # 선과 점 모두 표시
+                marker=dict(size=6)  # 분기별 데이터 포인트를 점으로 표시
+            )
+        )
+    
+    # 레이아웃 설정
+    fig.update_layout(
+        title='S&P 500 vs FINRA Margin Debt',
+        height=600,
+        showlegend=True,
+        hovermode='x unified',
+        yaxis=dict(
+            title="S&P 500",
+            side="left",
+            color="#1f77b4",
+            range=[2000, 6500]  # Y축 범위를 더 낮게 조정하여 2021년 이전 데이터도 표시
+        ),
+        yaxis2=dict(
+            title="Margin Debt (Millions $)",
+            side="right",
+            color="#ff7f0e",
+            overlaying="y"
+        ),
+        xaxis=dict(title="Date")
+    )
+    
+    st.plotly_chart(apply_render_mode(fig), use_container_width=True)
+    
+    # 통계 정보
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        current_sp500 = filtered_data['S&P_500'].iloc[-1]
+        prev_sp500 = filtered_data['S&P_500'].iloc[-2] if len(filtered_data) > 1 else current_sp500
+        sp500_change = ((current_sp500 - prev_sp500) / prev_sp500) * 100
+        st.metric(
+            "현재 S&P 500",
+            f"${current_sp500:,.2f}",
+            f"{sp500_change:+.2f}%"
+        )
+    
+    with col2:
+        current_margin = filtered_data['Margin_Debt'].iloc[-1]
+        prev_margin = filtered_data['Margin_Debt'].iloc[-2] if len(filtered_data) > 1 else current_margin
+        margin_change = ((current_margin - prev_margin) / prev_margin) * 100
+        st.metric(
+            "현재 Margin Debt",
+            f"${current_margin:,.0f}M",
+            f"{margin_change:+.2f}%"
+        )
+    
+    with col3:
+        # 전체 기간 수익률
+        total_sp500_return = ((filtered_data['S&P_500'].iloc[-1] / filtered_data['S&P_500'].iloc[0]) - 1) * 100
+        total_margin_change = ((filtered_data['Margin_Debt'].iloc[-1] / filtered_data['Margin_Debt'].iloc[0]) - 1) * 100
+        st.metric(
+            "전체 기간 변화",
+            f"S&P: {total_sp500_return:+.1f}%",
+            f"Margin: {total_margin_change:+.1f}%"
+        )
+
+
+def plot_high_yield_spread(high_yield_data):
+    """High Yield CDS Spread 그래프"""
+    if high_yield_data is not None and not high_yield_data.empty:
+        fig1 = go.Figure()
+        spread_line = downsample(high_yield_data)
+        fig1.add_trace(go.Scatter(
+            x=spread_line.index,
+            y=spread_line.values,
+            mode='lines',
+            name='High Yield CDS Spread',
+            line=dict(color='red', width=2)
+        ))
+        
+        fig1.update_layout(
+            title="High Yield CDS Spread",
+            xaxis_title="Date",
+            yaxis_title="CDS Spread (bps)",
+            height=400,  # 높이 증가
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial", size=10),
+            margin=dict(t=30, b=30, l=30, r=30),
+            legend=dict(
+                x=0.02,
+                y=0.98,
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='black',
+                borderwidth=1
+            ),
+            xaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            ),
+            yaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            )
+        )
+        st.plotly_chart(apply_render_mode(fig1), use_container_width=True)
+        
+        # 현재 값 표시
+        current_spread = high_yield_data.iloc[-1]
+        st.metric("Current Spread", f"{current_spread:.2f} bps")
+    else:
+        st.warning("High Yield CDS 데이터를 불러올 수 없습니다.")
+
+
+def plot_sp500_candlestick(sp500_data):
+    """S&P 500 봉차트"""
+    if sp500_data is not None and not sp500_data.empty:
+        bars, bar_label = candle_bars(sp500_data)
+        fig2 = go.Figure()
+        fig2.add_trace(go.Candlestick(
+            x=bars.index,
+            open=bars['Open'],
+            high=bars['High'],
+            low=bars['Low'],
+            close=bars['Close'],
+            name='S&P 500',
+            increasing_line_color='red',
+            decreasing_line_color='green'
+        ))
+        
+        fig2.update_layout(
+            title=f"S&P 500 Index{bar_label}",
+            xaxis_title="Date",
+            yaxis_title="Price ($)",
+            height=400,  # 높이 감소
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial", size=10),
+            margin=dict(t=30, b=30, l=30, r=30),
+            legend=dict(
+                x=0.02,
+                y=0.98,
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='black',
+                borderwidth=1
+            ),
+            xaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            ),
+            yaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            )
+        )
+        st.plotly_chart(fig2, use_container_width=True)
+        
+        # 현재 값 표시
+        current_price = sp500_data['Close'].iloc[-1]
+        st.metric("Current Price", f"${current_price:.2f}")
+    else:
+        st.warning("S&P 500 데이터를 불러올 수 없습니다.")
+
+
+def plot_breakeven_inflation(inflation_data):
+    """10년물 기대인플레이션 그래프"""
+    if inflation_data is not None and not inflation_data.empty:
+        fig3 = go.Figure()
+        inflation_line = downsample(inflation_data)
+        fig3.add_trace(go.Scatter(
+            x=inflation_line.index,
+            y=inflation_line.values,
+            name='Breakeven Inflation',
+            line=dict(color='orange', width=2)
+        ))
+        fig3.add_hline(y=2.0, line_dash="dash", line_color="green",
+                      annotation_text="Fed Target (2%)")
+        fig3.update_layout(
+            title="10-Year Breakeven Inflation",
+            xaxis_title="Date",
+            yaxis_title="Inflation Rate (%)",
+            height=400,  # 높이 증가
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial", size=10),
+            margin=dict(t=30, b=30, l=30, r=30),
+            legend=dict(
+                x=0.02,
+                y=0.98,
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='black',
+                borderwidth=1
+            ),
+            xaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            ),
+            yaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            )
+        )
+        st.plotly_chart(apply_render_mode(fig3), use_container_width=True)
+        current_inflation = inflation_data.iloc[-1]
+        st.metric("Current Inflation", f"{current_inflation:.2f}%")
+    else:
+        st.warning("기대인플레이션 데이터를 불러올 수 없습니다.")
+
+
+def plot_aud_usd(aud_usd_data, volatility_data):
+    """AUD/USD 봉차트와 3개월 변동성 (오른쪽 Y축)"""
+    if aud_usd_data is not None and not aud_usd_data.empty:
+        # 환율 봉차트와 변동성을 같은 그래프에 표시
+        fig4 = go.Figure()
+        
+        # 환율 봉차트 (왼쪽 Y축)
+        bars, bar_label = candle_bars(aud_usd_data)
+        fig4.add_trace(go.Candlestick(
+            x=bars.index,
+            open=bars['Open'],
+            high=bars['High'],
+            low=bars['Low'],
+            close=bars['Close'],
+            name='AUD/USD',
+            increasing_line_color='red',
+            decreasing_line_color='green',
+            yaxis='y'
+        ))
+        
+        # 변동성 (오른쪽 Y축)
+        if volatility_data is not None and not volatility_data.empty:
+            volatility_line = downsample(volatility_data)
+            fig4.add_trace(go.Scatter(
+                x=volatility_line.index,
+                y=volatility_line.values,
+                name='3-Month Volatility',
+                line=dict(color='purple', width=2),
+                yaxis='y2'
+            ))
+        
+        fig4.update_layout(
+            title=f"AUD/USD Exchange Rate & Volatility{bar_label}",
+            xaxis_title="Date",
+            yaxis=dict(
+                title="Exchange Rate (AUD/USD)",
+                side='left',
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            ),
+            yaxis2=dict(
+                title="Volatility (%)",
+                side='right',
+                overlaying='y',
+                showgrid=False,
+                showline=True,
+                linewidth=1,
+                linecolor='purple',
+                mirror=True
+            ),
+            height=400,  # 높이 감소
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial"),
+            margin=dict(t=30, b=30, l=30, r=30),
+            legend=dict(
+                x=0.02,
+                y=0.98,
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='black',
+                borderwidth=1
+            ),
+            xaxis=dict(
+                showgrid=True,
+                gridwidth=0.5,
+                gridcolor='lightgray',
+                showline=True,
+                linewidth=1,
+                linecolor='black',
+                mirror=True
+            )
+        )
+        st.plotly_chart(apply_render_mode(fig4), use_container_width=True)
+        
+        # 현재 값들 표시
+        col_metric1, col_metric2 = st.columns(2)
+        with col_metric1:
+            current_rate = aud_usd_data['Close'].iloc[-1]
+            st.metric("Current Rate", f"{current_rate:.4f}")
+        with col_metric2:
+            if volatility_data is not None and not volatility_data.empty:
+                current_volatility = volatility_data.iloc[-1]
+                st.metric("Current Volatility", f"{current_volatility:.2f}%")
+            else:
+                st.metric("Current Volatility", "N/A")
+    else:
+        st.warning("AUD/USD 데이터를 불러올 수 없습니다.")
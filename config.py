@@ -0,0 +1,31 @@
+import os
+
+# 로컬 데이터 저장 경로 (가격 저장소 등 디스크 캐시 공통 루트)
+# 환경 변수 MARKET_DATA_DIR 로 변경 가능 (컨테이너에서는 볼륨 경로 지정 권장)
+DATA_DIR = os.getenv(
+    'MARKET_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.market_data')
+)
+
+# 백그라운드 미리 받기 (prefetch.py): off | inprocess (앱 프로세스 안에서 실행) | sidecar (별도 프로세스)
+PREFETCH_MODE = os.getenv('PREFETCH_MODE', 'off')
+
+# 미리 받기가 켜져 있으면 대상 종목/시리즈는 이 시간 동안 페이지에서 새로 받지 않음 (초)
+# 스케줄러가 멈춘 경우에 대비한 상한 (평일 하루 + 여유)
+PREFETCH_MAX_AGE = int(os.getenv('PREFETCH_MAX_AGE', str(26 * 60 * 60)))
+
+# 페이지 모듈 import 시점: lazy (처음 방문할 때, 기본값) | eager (앱 시작 시 전체 - 첫 방문 지연 없음, 시작은 느림)
+PAGE_IMPORT_MODE = os.getenv('PAGE_IMPORT_MODE', 'lazy')
+
+# FRED API 키 가져오기 (환경 변수 우선, 없으면 기본값 사용)
+# 로컬: 환경 변수 또는 기본값 사용
+# 배포(Streamlit Cloud): 환경 변수 또는 Secrets 사용
+FRED_API_KEY = os.getenv('FRED_API_KEY', '3c135ee62b5baa4f41adcf37a4a508c9')
+
+# Streamlit Cloud 배포 시 secrets 사용 (로컬에서는 에러 방지를 위해 주석 처리)
+# if not FRED_API_KEY or FRED_API_KEY == '3c135ee62b5baa4f41adcf37a4a508c9':
+#     try:
+#         if hasattr(st, 'secrets') and 'FRED_API_KEY' in st.secrets:
+#             FRED_API_KEY = st.secrets['FRED_API_KEY']
+#     except:
+#         pass
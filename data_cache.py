@@ -0,0 +1,364 @@
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from lazy_imports import lazy_module
+
+pd = lazy_module('pandas')
+
+# 프로세스 전체에서 공유하는 데이터 조회 결과 캐시
+# Streamlit 세션(사용자)마다 같은 데이터를 다시 받지 않도록 get_* 함수에 @cached(source)를 붙인다.
+
+# 소스별 캐시 유지 시간 (초), 환경 변수 DATA_CACHE_TTL_<SOURCE> 로 변경 가능
+SOURCE_TTLS = {
+    'fred': 6 * 60 * 60,            # FRED 일별/월별 시리즈는 하루 1회 정도만 갱신됨
+    'yfinance': 15 * 60,            # 일봉 (지연 시세)
+    'yfinance_intraday': 60,        # 분봉/시간봉
+    'krx': 30 * 60,                 # KRX 옵션 통계
+}
+DEFAULT_TTL = 15 * 60
+
+# 캐시 전체 메모리 상한 (MB), 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+CACHE_MAX_BYTES = int(os.getenv('DATA_CACHE_MAX_MB', '256')) * 1024 * 1024
+
+# 키 생성 시 날짜로 정규화하는 인자 이름
+DATE_ARGS = ('start_date', 'end_date', 'start', 'end')
+
+# stale-while-revalidate: 페이지에서는 오래된 데이터를 바로 반환하고 갱신은 백그라운드에서 실행
+# SERVE_STALE=0 이면 항상 최신 데이터를 받을 때까지 기다림
+SERVE_STALE = os.getenv('SERVE_STALE', '1') != '0'
+REVALIDATE_MAX_WORKERS = int(os.getenv('REVALIDATE_MAX_WORKERS', '4'))
+# 페이지가 백그라운드 갱신을 기다리는 최대 시간 (초), 초과 시 오래된 데이터를 그대로 둠
+REVALIDATE_TIMEOUT = int(os.getenv('REVALIDATE_TIMEOUT', '30'))
+# 백그라운드 갱신 완료 여부를 확인하는 간격 (초), 페이지 실행을 막지 않고 이 간격으로 확인
+REVALIDATE_POLL_INTERVAL = float(os.getenv('REVALIDATE_POLL_INTERVAL', '1'))
+
+
+def source_ttl(source):
+    """소스별 TTL (환경 변수 우선)"""
+    env_value = os.getenv(f"DATA_CACHE_TTL_{source.upper()}")
+    if env_value:
+        return int(env_value)
+    return SOURCE_TTLS.get(source, DEFAULT_TTL)
+
+
+def _estimate_size(value):
+    """캐시 항목의 대략적인 메모리 사용량 (바이트)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, (tuple, list)):
+        return sum(_estimate_size(item) for item in value) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        # 여러 DataFrame/Series를 묶어 반환하는 함수 (get_aud_usd_bundle 등)
+        return sum(_estimate_size(item) for item in value.values()) + sys.getsizeof(value)
+    return sys.getsizeof(value)
+
+
+def _copy(value):
+    """호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
+
+
+def _is_empty(value):
+    """실패(None) 결과는 캐시하지 않음 - 다음 호출에서 다시 시도"""
+    if value is None:
+        return True
+    if isinstance(value, tuple):
+        return all(item is None for item in value)
+    return False
+
+
+def _normalize_date(name, value):
+    """'2024-01-01', date, datetime, Timestamp를 같은 키로 정규화"""
+    if value is None:
+        # end 날짜 미지정 = 오늘까지
+        if name in ('end_date', 'end'):
+            return datetime.now().strftime('%Y-%m-%d')
+        return None
+    try:
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
+    except (ValueError, TypeError):
+        return value
+
+
+class DataCache:
+    """TTL + 메모리 상한(LRU) 캐시, 소스별 적중/실패 횟수 기록"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires_at, source, stored_at)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _stat(self, source):
+        return self._stats.setdefault(source, {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0})
+
+    def get(self, key, source):
+        """(적중 여부, 값) 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires_at, _, _ = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._stat(source)['hits'] += 1
+                    return True, value
+                # 만료된 항목은 get_stale()용으로 남겨 둠 (메모리 상한 초과 시 LRU로 제거)
+                self._stat(source)['expired'] += 1
+            self._stat(source)['misses'] += 1
+            return False, None
+
+    def get_stale(self, key):
+        """만료 여부와 관계없이 (값, 경과 시간) 반환, 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            return entry[0], time.time() - entry[4]
+
+    def put(self, key, value, source, ttl):
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            now = time.time()
+            self._entries[key] = (value, size, now + ttl, source, now)
+            self.total_bytes += size
+            # 메모리 상한 초과 시 LRU 제거
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, (_, old_size, _, old_source, _) = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+                self._stat(old_source)['evictions'] += 1
+
+    def clear(self, source=None):
+        """캐시 비우기 (source 지정 시 해당 소스만)"""
+        with self._lock:
+            for key in list(self._entries):
+                if source is None or self._entries[key][3] == source:
+                    self.total_bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        """소스별 적중/실패/제거 횟수와 항목 수, 메모리 사용량"""
+        with self._lock:
+            rows = []
+            for source, stat in sorted(self._stats.items()):
+                entries = [e for e in self._entries.values() if e[3] == source]
+                requests_count = stat['hits'] + stat['misses']
+                rows.append({
+                    'Source': source,
+                    'Hits': stat['hits'],
+                    'Misses': stat['misses'],
+                    'Hit Rate (%)': round(stat['hits'] / requests_count * 100, 1) if requests_count else 0.0,
+                    'Expired': stat['expired'],
+                    'Evictions': stat['evictions'],
+                    'Entries': len(entries),
+                    'Size (MB)': round(sum(e[1] for e in entries) / 1024 / 1024, 2),
+                })
+            return pd.DataFrame(rows, columns=['Source', 'Hits', 'Misses', 'Hit Rate (%)', 'Expired',
+                                               'Evictions', 'Entries', 'Size (MB)'])
+
+
+class _Call:
+    """진행 중인 호출 하나 (완료되면 결과/오류를 대기 중인 호출자와 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출은 먼저 시작된 한 번의 실행을 기다려 결과를 공유"""
+
+    def __init__(self):
+        self._calls = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        """key의 첫 호출자만 fn을 실행하고, 그동안 들어온 호출자는 같은 결과(또는 예외)를 받음"""
+        source = key[0] if isinstance(key, tuple) else key
+        with self._lock:
+            stat = self._stats.setdefault(source, {'calls': 0, 'coalesced': 0})
+            stat['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                stat['coalesced'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        """소스별 호출 수와 합쳐진(대기 후 결과를 공유한) 호출 수"""
+        with self._lock:
+            rows = [{'Source': source, 'Calls': stat['calls'], 'Coalesced': stat['coalesced']}
+                    for source, stat in sorted(self._stats.items())]
+        return pd.DataFrame(rows, columns=['Source', 'Calls', 'Coalesced'])
+
+
+_cache = DataCache(CACHE_MAX_BYTES)
+_flight = SingleFlight()
+
+
+class StaleState:
+    """페이지 실행 한 번 동안 오래된 데이터를 반환한 기록 (최대 경과 시간, 진행 중인 갱신)"""
+
+    def __init__(self):
+        self.pending = []
+        self.max_age = 0.0
+        self._lock = threading.Lock()
+
+    def note(self, age, future):
+        with self._lock:
+            self.max_age = max(self.max_age, age or 0.0)
+            if future not in self.pending:
+                self.pending.append(future)
+
+
+_stale_local = threading.local()
+_revalidate_executor = ThreadPoolExecutor(max_workers=REVALIDATE_MAX_WORKERS, thread_name_prefix='revalidate')
+_revalidating = {}  # key -> 진행 중인 백그라운드 갱신 future
+_revalidating_lock = threading.Lock()
+
+
+def begin_stale_serving():
+    """현재 스레드(페이지 실행)에서 오래된 데이터 반환 허용, 기록용 StaleState 반환"""
+    state = StaleState() if SERVE_STALE else None
+    _stale_local.state = state
+    return state
+
+
+def end_stale_serving():
+    _stale_local.state = None
+
+
+def current_stale_state():
+    return getattr(_stale_local, 'state', None)
+
+
+def stale_reads():
+    """현재 스레드에서 오래된 데이터를 반환한 횟수 (같은 갱신 future를 공유해도 읽을 때마다 증가)"""
+    return getattr(_stale_local, 'reads', 0)
+
+
+def use_stale_state(state):
+    """작업 스레드에서 페이지의 StaleState를 이어 받기 (fetch_engine용)"""
+    _stale_local.state = state
+
+
+def revalidate(key, age, fn, *args, **kwargs):
+    """오래된 데이터 반환이 허용된 경우 백그라운드 갱신을 예약하고 True 반환"""
+    # True면 호출자는 저장된(오래된) 데이터를 그대로 반환하고, False면 평소처럼 직접 갱신한다.
+    state = current_stale_state()
+    if state is None:
+        return False
+    with _revalidating_lock:
+        future = _revalidating.get(key)
+        if future is None or future.done():
+            future = _revalidate_executor.submit(single_flight, key, fn, *args, **kwargs)
+            _revalidating[key] = future
+    state.note(age, future)
+    _stale_local.reads = stale_reads() + 1
+    return True
+
+
+def _make_key(fn, signature, args, kwargs):
+    """함수 이름 + 정규화된 인자로 캐시 키 생성"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    items = []
+    for name, value in bound.arguments.items():
+        if name in DATE_ARGS:
+            value = _normalize_date(name, value)
+        items.append((name, repr(value)))
+    return (fn.__module__, fn.__qualname__, tuple(items))
+
+
+def cached(source, ttl=None):
+    """데이터 조회 함수를 프로세스 전체 캐시로 감싸는 데코레이터"""
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = _make_key(fn, signature, args, kwargs)
+            hit, value = _cache.get(key, source)
+            if hit:
+                return _copy(value)
+
+            # 만료된 값이 있으면 바로 반환하고 백그라운드에서 갱신
+            stale = _cache.get_stale(key)
+            if stale is not None and revalidate((source,) + key, stale[1], _load, key, args, kwargs):
+                return _copy(stale[0])
+
+            # 같은 키로 동시에 들어온 세션은 한 번의 조회 결과를 공유
+            value = _flight.do((source,) + key, _load, key, args, kwargs)
+            return _copy(value)
+
+        def _load(key, args, kwargs):
+            stale_before = stale_reads()
+            value = fn(*args, **kwargs)
+            # 내부에서 오래된 저장 데이터를 받아 계산한 값은 캐시하지 않음 (갱신 후 다시 계산)
+            used_stale = stale_reads() > stale_before
+            if not _is_empty(value) and not used_stale:
+                _cache.put(key, value, source, ttl if ttl is not None else source_ttl(source))
+            return value
+
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """모니터링용 캐시 통계"""
+    return _cache.stats()
+
+
+def single_flight(key, fn, *args, **kwargs):
+    """캐시 없이 동시 호출만 합치기, key는 (소스, 심볼, ...) 튜플"""
+    return _flight.do(key, fn, *args, **kwargs)
+
+
+def single_flight_stats():
+    """모니터링용 호출 합치기 통계"""
+    return _flight.stats()
+
+
+def clear_cache(source=None):
+    """캐시 비우기"""
+    _cache.clear(source)
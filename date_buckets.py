@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+# 날짜를 기간(주/월/분기/연) 말일로 옮기는 벡터 연산 모음
+# 분기 말 이동, 주봉/월봉 집계 등 기간 단위로 묶는 곳은 모두 period_end()를 사용해
+# 페이지마다 같은 규칙(기간의 마지막 날짜로 표시)을 따르도록 한다.
+#
+# freq: 'W' (주), 'M' (월), 'Q' (분기), 'A' (연)
+#       또는 기간 말일 목록 (정렬된 날짜, 4-4-5 같은 임의의 회계 달력)
+# fiscal_year_end: 회계연도 마지막 달 (Q/A, 기본 12월 -> 분기 말 3/6/9/12월)
+# week_end: 주의 마지막 요일 (W, 0=월 ... 6=일, 기본 4=금요일)
+
+FREQ_ALIASES = {'W': 'W', 'M': 'M', 'Q': 'Q', 'A': 'A', 'Y': 'A'}
+
+
+def _days(index):
+    """인덱스를 datetime64[D] 배열로 (타임존이 있으면 현지 날짜 기준)"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]')
+
+
+def _month_end(months):
+    """datetime64[M] 배열 -> 각 달의 마지막 날 (datetime64[D])"""
+    return (months + 1).astype('datetime64[D]') - 1
+
+
+def _end_month(days, period, last_month):
+    """period 개월 단위 기간의 마지막 달 (last_month로 끝나는 주기)"""
+    months = days.astype('datetime64[M]')
+    month_number = months.astype(np.int64)      # 1970-01 기준 월 번호 (0 = 1월)
+    offset = (last_month - 1 - month_number) % period
+    return months + offset
+
+
+def period_end(index, freq, fiscal_year_end=12, week_end=4):
+    """각 날짜가 속한 기간의 마지막 날짜 (DatetimeIndex, 시간/타임존 제거)"""
+    days = _days(index)
+
+    if not isinstance(freq, str):
+        # 임의의 회계 달력: 기간 말일 목록에서 날짜 이후 처음 오는 말일
+        ends = _days(freq)
+        positions = np.searchsorted(ends, days, side='left')
+        if len(ends) == 0 or (positions >= len(ends)).any():
+            raise ValueError("회계 달력의 마지막 기간 말일 이후 날짜가 있습니다")
+        return pd.DatetimeIndex(ends[positions].astype('datetime64[ns]'))
+
+    freq = FREQ_ALIASES.get(freq.upper())
+    if freq == 'W':
+        # 1970-01-01은 목요일 (weekday 3)
+        weekday = (days.astype(np.int64) + 3) % 7
+        ends = days + (week_end - weekday) % 7
+    elif freq == 'M':
+        ends = _month_end(days.astype('datetime64[M]'))
+    elif freq == 'Q':
+        ends = _month_end(_end_month(days, 3, fiscal_year_end))
+    elif freq == 'A':
+        ends = _month_end(_end_month(days, 12, fiscal_year_end))
+    else:
+        raise ValueError(f"지원하지 않는 기간: {freq}")
+    return pd.DatetimeIndex(ends.astype('datetime64[ns]'))
+
+
+def shift_to_period_end(data, freq, fiscal_year_end=12, week_end=4):
+    """Series/DataFrame의 인덱스를 기간 말일로 이동 (값은 그대로)"""
+    data = data.copy()
+    data.index = period_end(data.index, freq, fiscal_year_end=fiscal_year_end, week_end=week_end)
+    return data
+
+
+def aggregate(data, freq, how, fiscal_year_end=12, week_end=4):
+    """기간별 집계 (how: groupby.agg 인자), 결과 인덱스는 기간 말일"""
+    labels = period_end(data.index, freq, fiscal_year_end=fiscal_year_end, week_end=week_end)
+    return data.groupby(labels, sort=True).agg(how)
+
+
+# OHLCV 봉 집계 방식 (컬럼: 집계 함수)
+OHLCV_HOW = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+
+
+def resample_ohlcv(data, freq, week_end=4):
+    """일봉 OHLCV -> 주봉('W')/월봉('M')/분기봉('Q')/연봉('A'), 'D'이면 그대로 (없는 컬럼은 제외)"""
+    if freq == 'D':
+        return data
+    how = {column: func for column, func in OHLCV_HOW.items() if column in data.columns}
+    return aggregate(data[list(how)], freq, how, week_end=week_end)
+
+
+# 봉 단위 후보 (짧은 순서)
+CANDLE_FREQS = ('W', 'M', 'Q', 'A')
+
+
+def candle_freq(index, max_bars, week_end=4):
+    """봉 개수가 max_bars를 넘지 않는 가장 짧은 봉 단위 ('D' | 'W' | 'M' | 'Q' | 'A')
+
+    연봉도 max_bars를 넘는 경우(수백 년 데이터)에는 'A'를 반환한다.
+    """
+    if len(index) <= max_bars:
+        return 'D'
+    for freq in CANDLE_FREQS:
+        if len(np.unique(period_end(index, freq, week_end=week_end))) <= max_bars:
+            return freq
+    return 'A'
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# 긴 선 그래프 시계열 줄이기 (브라우저로 보내기 전)
+# period='MAX'의 ^GSPC처럼 수만 개의 점을 그대로 보내지 않고, 화면 폭(픽셀) 정도의 점만 남긴다.
+# - minmax: 구간마다 최솟값/최댓값 두 점을 선택 (극값을 정확히 유지, 기본값)
+# - lttb: Largest-Triangle-Three-Buckets, 구간마다 모양을 가장 잘 유지하는 점 하나를 선택
+#         (극값이 빠질 수 있음 - 예: 2만 개 점의 random walk에서 전체 최댓값 누락)
+# 선택한 기간/날짜 범위로 자른 원본 데이터에서 매번 다시 줄이므로,
+# 기간을 좁히면(확대) 그 범위 안에서 원래 해상도에 가깝게 다시 표시된다.
+
+# 그래프 하나(trace)에 남길 점 수 (대략 그래프의 화면 폭)
+TARGET_POINTS = int(os.getenv('DOWNSAMPLE_POINTS', '1500'))
+
+# minmax | lttb | off
+METHOD = os.getenv('DOWNSAMPLE_METHOD', 'minmax').lower()
+
+
+def _x_values(index):
+    """인덱스 -> 거리 계산용 실수 배열 (날짜는 ns 단위 정수)"""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(float)
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=float)
+    return np.arange(len(index), dtype=float)
+
+
+def lttb_indices(x, y, points):
+    """LTTB로 선택한 점의 위치 (처음과 마지막 점은 항상 포함)"""
+    n = len(y)
+    if points >= n or points < 3:
+        return np.arange(n)
+
+    # 처음/마지막 점을 제외한 나머지를 points - 2개 구간으로 나눔
+    edges = np.linspace(1, n - 1, points - 1).astype(int)
+    selected = np.empty(points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 구간별 평균 점 (각 구간에서 점을 고를 때 다음 구간의 평균 점을 사용)
+    counts = np.diff(np.r_[edges, n])
+    mean_x = np.add.reduceat(x, edges) / counts
+    mean_y = np.add.reduceat(y, edges) / counts
+
+    previous_x, previous_y = x[0], y[0]
+    for i in range(points - 2):
+        start, end = edges[i], edges[i + 1]
+        # 이전 선택 점, 다음 구간 평균 점과 만드는 삼각형 넓이가 가장 큰 점 선택
+        # 넓이 = |a * y + b * x + c| / 2 (a, b, c는 이전 점과 다음 평균 점으로 정해지는 상수)
+        a = previous_x - mean_x[i + 1]
+        b = mean_y[i + 1] - previous_y
+        c = -(a * previous_y + b * previous_x)
+        chosen = start + int(np.abs(a * y[start:end] + b * x[start:end] + c).argmax())
+        selected[i + 1] = chosen
+        previous_x, previous_y = x[chosen], y[chosen]
+    return selected
+
+
+def minmax_indices(y, points):
+    """구간별 최솟값/최댓값 점의 위치 (구간 수 = points // 2, 처음과 마지막 점 포함)"""
+    n = len(y)
+    buckets = max(points // 2, 1)
+    if points >= n:
+        return np.arange(n)
+
+    bucket = np.arange(n) * buckets // n
+    # 구간 번호, 값 순서로 정렬하면 각 구간의 첫 점이 최솟값, 마지막 점이 최댓값
+    order = np.lexsort((y, bucket))
+    sorted_bucket = bucket[order]
+    first = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+    last = np.r_[first[1:] - 1, n - 1]
+    return np.unique(np.r_[0, order[first], order[last], n - 1])
+
+
+def downsample(series, points=None, method=None):
+    """선 그래프용 시계열 줄이기 (점 수가 points 이하이면 그대로 반환)
+
+    NaN은 줄이기 전에 제외한다.
+    """
+    if series is None:
+        return series
+    points = TARGET_POINTS if points is None else points
+    method = METHOD if method is None else method
+    if method == 'off' or len(series) <= points:
+        return series
+
+    values = series.to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) <= points:
+        return series.iloc[valid]
+
+    y = values[valid]
+    if method == 'minmax':
+        selected = minmax_indices(y, points)
+    elif method == 'lttb':
+        selected = lttb_indices(_x_values(series.index[valid]), y, points)
+    else:
+        raise ValueError(f"지원하지 않는 downsample 방식: {method}")
+    return series.iloc[valid[selected]]
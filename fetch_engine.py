@@ -0,0 +1,80 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from data_cache import current_stale_state, use_stale_state
+
+# 한 페이지에서 서로 독립적인 데이터 소스를 동시에 조회하는 실행기
+# 페이지는 iter_completed()가 돌려주는 순서(완료 순)대로 차트를 그리므로
+# 전체 대기 시간은 소스 개수의 합이 아니라 가장 느린 소스 하나로 제한된다.
+#
+# 주의: 작업 함수 안의 st.* 호출은 작업 스레드에서 실행되므로 화면에 표시되지 않는다.
+# 결과(None 여부)에 따른 안내 메시지는 페이지(메인 스레드)에서 출력할 것.
+
+# 프로세스 전체에서 공유하는 작업 스레드 수 (모든 세션 합산)
+FETCH_MAX_WORKERS = int(os.getenv('FETCH_MAX_WORKERS', '16'))
+
+# 작업별 타임아웃을 지정하지 않았을 때의 기본값 (초)
+DEFAULT_TIMEOUT = int(os.getenv('FETCH_TIMEOUT', '30'))
+
+_executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix='fetch')
+
+
+class FetchTask:
+    """동시에 조회할 데이터 소스 하나 (함수, 인자, 개별 타임아웃)"""
+
+    def __init__(self, fn, *args, timeout=None, **kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+
+
+def _run(stale_state, fn, args, kwargs):
+    """페이지의 stale-while-revalidate 상태를 이어 받아 작업 실행"""
+    use_stale_state(stale_state)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        use_stale_state(None)
+
+
+def iter_completed(tasks):
+    """{이름: FetchTask}를 동시에 실행하고 끝나는 순서대로 (이름, 결과, 오류) 반환"""
+    # 작업마다 자기 타임아웃이 지나면 결과를 기다리지 않고 TimeoutError를 돌려준다.
+    started = time.monotonic()
+    stale_state = current_stale_state()
+    names = {}
+    deadlines = {}
+    for name, task in tasks.items():
+        future = _executor.submit(_run, stale_state, task.fn, task.args, task.kwargs)
+        names[future] = name
+        deadlines[future] = started + task.timeout
+
+    pending = set(names)
+    while pending:
+        next_deadline = min(deadlines[future] for future in pending)
+        done, pending = wait(
+            pending,
+            timeout=max(0.0, next_deadline - time.monotonic()),
+            return_when=FIRST_COMPLETED
+        )
+
+        for future in done:
+            try:
+                yield names[future], future.result(), None
+            except Exception as e:
+                yield names[future], None, e
+
+        # 타임아웃이 지난 작업은 포기 (이미 실행 중이면 백그라운드에서 끝까지 실행됨)
+        now = time.monotonic()
+        for future in [f for f in pending if deadlines[f] <= now]:
+            pending.discard(future)
+            future.cancel()
+            timeout = deadlines[future] - started
+            yield names[future], None, TimeoutError(f"{names[future]} 조회 시간 초과 ({timeout:.0f}초)")
+
+
+def fetch_all(tasks):
+    """모든 작업을 동시에 실행하고 {이름: 결과} 반환 (실패/타임아웃은 None)"""
+    return {name: result for name, result, error in iter_completed(tasks)}
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Plotly 차트(Figure) 캐시
+# 차트를 그리는 데 쓰는 입력 데이터의 지문(fingerprint)과 레이아웃 옵션으로 키를 만들고,
+# 같은 키로 이미 만든 Figure가 있으면 make_subplots/add_trace/update_*axes 호출 없이 그대로 재사용한다.
+# 캐시한 Figure는 여러 세션이 함께 쓰므로 꺼낸 뒤 수정하지 않는다 (st.plotly_chart에 바로 전달).
+
+# 캐시 항목 수 상한 (초과 시 가장 오래 사용하지 않은 차트부터 제거)
+CACHE_MAX_ENTRIES = int(os.getenv('FIGURE_CACHE_MAX_ENTRIES', '32'))
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _update(digest, value):
+    """입력 데이터를 지문에 반영 (Series/DataFrame은 인덱스, 컬럼, 값 기준)"""
+    if value is None:
+        digest.update(b'N')
+    elif isinstance(value, pd.DataFrame):
+        digest.update(b'F')
+        digest.update(repr(list(value.columns)).encode())
+        _update(digest, value.index)
+        for column in value.columns:
+            _update(digest, value[column].to_numpy())
+    elif isinstance(value, pd.Series):
+        digest.update(b'S')
+        digest.update(repr(value.name).encode())
+        _update(digest, value.index)
+        _update(digest, value.to_numpy())
+    elif isinstance(value, pd.Index):
+        digest.update(b'I')
+        _update(digest, value.to_numpy())
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            digest.update(repr(value.tolist()).encode())
+        else:
+            digest.update(str(value.dtype).encode())
+            digest.update(np.ascontiguousarray(value).view(np.uint8))
+    elif isinstance(value, dict):
+        digest.update(b'D')
+        for key, item in value.items():
+            digest.update(repr(key).encode())
+            _update(digest, item)
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'L')
+        for item in value:
+            _update(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(*inputs):
+    """입력 데이터 지문 (내용이 같으면 같은 값)"""
+    digest = hashlib.sha1()
+    for value in inputs:
+        _update(digest, value)
+    return digest.hexdigest()
+
+
+def cached_figure(name, build_fn, inputs=(), options=None):
+    """name 차트를 입력 데이터(inputs)와 레이아웃 옵션(options) 기준으로 캐시
+
+    같은 입력/옵션으로 이미 만든 Figure가 있으면 build_fn을 호출하지 않고 재사용한다.
+    """
+    key = (name, fingerprint(inputs, sorted((options or {}).items())))
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            _stats['hits'] += 1
+            return _cache[key]
+        _stats['misses'] += 1
+
+    fig = build_fn()
+
+    with _cache_lock:
+        _cache[key] = fig
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return fig
+
+
+def cache_info():
+    """캐시 적중/미스 횟수와 현재 항목 수"""
+    with _cache_lock:
+        return dict(_stats, entries=len(_cache))
+
+
+def clear():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import DATA_DIR
+from data_cache import revalidate, single_flight
+import http_client
+from lazy_imports import lazy_module
+
+# FINRA Margin Statistics 페이지 스크래퍼
+# 파싱한 표를 디스크에 저장해 두고, 확인 주기가 지나면 조건부 요청(ETag/Last-Modified)으로
+# 변경 여부만 확인한다. 변경이 없으면 304 응답 하나로 끝나고 HTML 파싱은 하지 않는다.
+
+# bs4는 페이지를 실제로 파싱할 때만 import (304/변경 없음인 경우 불필요)
+bs4 = lazy_module('bs4')
+
+MARGIN_STATISTICS_URL = "https://www.finra.org/investors/learn-to-invest/advanced-investing/margin-statistics"
+
+FINRA_DIR = os.path.join(DATA_DIR, 'finra')
+
+# 변경 확인 주기 (초), FINRA는 매월 한 번 갱신
+CHECK_MAX_AGE = int(os.getenv('FINRA_CHECK_MAX_AGE', str(6 * 60 * 60)))
+
+# 파서: lxml이 설치되어 있으면 사용 (html.parser보다 빠름)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Parquet 엔진이 없으면 pickle로 저장 (pyarrow 권장)
+try:
+    import pyarrow  # noqa: F401
+    FILE_EXT = '.parquet'
+except ImportError:
+    FILE_EXT = '.pkl'
+
+_write_lock = threading.Lock()
+
+
+def _path(name, ext):
+    return os.path.join(FINRA_DIR, name + ext)
+
+
+def load_snapshot():
+    """저장된 Margin Debt 표 (Date 인덱스, Margin_Debt 컬럼, 없으면 None)"""
+    path = _path('margin_statistics', FILE_EXT)
+    if not os.path.exists(path):
+        return None
+    try:
+        if FILE_EXT == '.parquet':
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"FINRA 저장 데이터 읽기 실패: {e}")
+        return None
+
+
+def load_meta():
+    """조건부 요청용 메타데이터 (etag, last_modified, content_hash, checked_at)"""
+    try:
+        with open(_path('margin_statistics', '.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path, write_fn):
+    """임시 파일 작성 후 교체"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _write_lock:
+        write_fn(tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _save(table, meta):
+    def write_meta(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def write_table(tmp_path):
+        if FILE_EXT == '.parquet':
+            table.to_parquet(tmp_path)
+        else:
+            table.to_pickle(tmp_path)
+
+    if table is not None:
+        _write(_path('margin_statistics', FILE_EXT), write_table)
+    _write(_path('margin_statistics', '.json'), write_meta)
+
+
+def parse_margin_table(content):
+    """HTML에서 (날짜, Margin Debt) 표 추출 - 셀 텍스트만 모은 뒤 날짜/숫자는 한 번에 변환"""
+    # 표 태그만 파싱 (페이지의 나머지 부분은 트리를 만들지 않음)
+    soup = bs4.BeautifulSoup(content, HTML_PARSER, parse_only=bs4.SoupStrainer('table'))
+
+    date_texts = []
+    margin_texts = []
+    for row in soup.find_all('tr'):
+        cells = row.find_all(['td', 'th'], limit=2)
+        if len(cells) >= 2:
+            date_texts.append(cells[0].get_text(strip=True))
+            margin_texts.append(cells[1].get_text(strip=True))
+
+    if not date_texts:
+        return pd.DataFrame(columns=['Margin_Debt'], index=pd.DatetimeIndex([], name='Date'))
+
+    dates = pd.Series(date_texts)
+    # 날짜 형식: M/YYYY -> YYYY-MM-01, M/D/YYYY -> YYYY-MM-DD, 그 외는 그대로
+    parts = dates.str.split('/')
+    part_count = parts.str.len()
+    # '/'가 없는 행은 해당 부분이 NaN이므로 빈 문자열로 채운 뒤 이어 붙임
+    first, second, third = (parts.str[i].fillna('').astype(str) for i in range(3))
+    month = first.str.zfill(2)
+    date_str = np.where(
+        part_count == 2, second + '-' + month + '-01',
+        np.where(part_count == 3, third + '-' + month + '-' + second.str.zfill(2), dates)
+    )
+    parsed_dates = pd.to_datetime(pd.Series(date_str), format='mixed', errors='coerce')
+
+    # 월-연도 형식 (Jan-25, Jan-2025) -> 해당 월 1일
+    month_year = pd.to_datetime(dates, format='%b-%y', errors='coerce')
+    month_year = month_year.fillna(pd.to_datetime(dates, format='%b-%Y', errors='coerce'))
+    parsed_dates = month_year.where(month_year.notna(), parsed_dates)
+
+    # 마진 부채 값: 숫자만 추출 (헤더 행 등 숫자가 없는 셀은 제외)
+    digits = pd.Series(margin_texts).str.replace(r'\D', '', regex=True)
+    valid = (dates != '') & (digits != '') & parsed_dates.notna()
+
+    table = pd.DataFrame({
+        'Date': parsed_dates[valid].to_numpy(),
+        'Margin_Debt': digits[valid].astype(float).to_numpy(),
+    })
+    return table.sort_values('Date', kind='stable').set_index('Date')
+
+
+def refresh_margin_statistics():
+    """FINRA 페이지 변경 확인 후 표 반환 (변경이 없으면 저장된 표 그대로)"""
+    snapshot = load_snapshot()
+    meta = load_meta()
+
+    headers = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    if snapshot is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    response = http_client.get('finra', MARGIN_STATISTICS_URL, headers=headers)
+    now = time.time()
+
+    if response.status_code == 304 and snapshot is not None:
+        meta['checked_at'] = now
+        _save(None, meta)
+        return snapshot
+    if response.status_code != 200:
+        raise ValueError(f"FINRA 요청 실패: {response.status_code}")
+
+    # 검증 헤더를 지원하지 않는 경우에도 본문이 같으면 파싱 생략
+    content_hash = hashlib.sha1(response.content).hexdigest()
+    if snapshot is not None and meta.get('content_hash') == content_hash:
+        table = None
+    else:
+        table = parse_margin_table(response.content)
+        if table.empty:
+            # 페이지 구조가 바뀐 경우 저장된 표를 덮어쓰지 않음
+            raise ValueError("FINRA 페이지에서 Margin Debt 표를 찾을 수 없습니다")
+
+    meta = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'content_hash': content_hash,
+        'checked_at': now,
+    }
+    _save(table, meta)
+    return snapshot if table is None else table
+
+
+def get_margin_statistics(max_age=None):
+    """FINRA Margin Debt 표 (저장된 표 우선, 확인 주기가 지난 경우에만 변경 확인)"""
+    snapshot = load_snapshot()
+    meta = load_meta()
+    if max_age is None:
+        max_age = CHECK_MAX_AGE
+
+    checked_at = meta.get('checked_at')
+    age = time.time() - checked_at if checked_at else None
+    stale = snapshot is None or age is None or age > max_age
+    # 저장된 표가 있으면 먼저 반환하고 변경 확인은 백그라운드에서 (stale-while-revalidate 모드인 경우)
+    if stale and snapshot is not None and revalidate(('finra', 'margin_statistics'), age, refresh_margin_statistics):
+        stale = False
+
+    if stale:
+        try:
+            snapshot = single_flight(('finra', 'margin_statistics'), refresh_margin_statistics)
+        except Exception as e:
+            if snapshot is None:
+                raise
+            print(f"FINRA 변경 확인 실패, 저장된 데이터 사용: {e}")
+
+    return snapshot.copy()
@@ -0,0 +1,296 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from config import DATA_DIR, FRED_API_KEY, PREFETCH_MODE, PREFETCH_MAX_AGE
+from data_cache import revalidate, single_flight
+import http_client
+from universe import FRED_SERIES
+
+# FRED 시리즈를 디스크에 전체 저장해 두는 로컬 미러
+# 페이지에서는 fred.get_series(id, observation_start, observation_end) 대신
+# get_fred_series(id, start, end)를 호출하고, 날짜 구간은 로컬에서 잘라 쓴다.
+# 동기화는 시리즈 메타데이터(last_updated)가 바뀐 경우에만 최근 구간의 관측치를 받는다.
+
+MIRROR_DIR = os.path.join(DATA_DIR, 'fred')
+
+# FRED REST API (http_client의 공유 세션으로 요청, 연결 재사용 + 재시도)
+FRED_API_URL = 'https://api.stlouisfed.org/fred'
+
+# 오프라인 모드: FRED에 요청하지 않고 미러에 저장된 데이터만 사용
+OFFLINE = os.getenv('FRED_MIRROR_OFFLINE', '0') == '1'
+
+# 시리즈 빈도별 동기화 확인 주기 (초)
+# 환경 변수 FRED_MIRROR_MAX_AGE (기본값), FRED_MIRROR_MAX_AGE_<SERIES_ID> (시리즈별) 로 변경 가능
+FREQUENCY_MAX_AGE = {
+    'D': 6 * 60 * 60,       # 일별 (DGS10, DFF, SOFR, BAMLH0A0HYM2 등)
+    'W': 12 * 60 * 60,      # 주별
+    'M': 24 * 60 * 60,      # 월별 (MDTOTNS 등)
+    'Q': 24 * 60 * 60,      # 분기별 (CPROFIT 등)
+    'A': 24 * 60 * 60,      # 연별
+}
+DEFAULT_MAX_AGE = int(os.getenv('FRED_MIRROR_MAX_AGE', str(6 * 60 * 60)))
+
+# 시리즈가 수정(last_updated 변경)되었을 때 마지막 관측치보다 앞에서부터 다시 받는 구간 (일)
+# FRED는 최근 관측치를 사후 수정하므로(빈도가 낮을수록 수정 기간이 김) 이 구간은 덮어쓴다.
+REVISION_LOOKBACK_DAYS = {
+    'D': 30,
+    'W': 90,
+    'M': 400,
+    'Q': 1100,
+    'A': 1100,
+}
+DEFAULT_REVISION_LOOKBACK_DAYS = 400
+
+# 수정 구간보다 오래된 과거 개정(연간 종합 개정 등)을 반영하기 위한 전체 재동기화 주기 (일)
+FULL_RESYNC_DAYS = int(os.getenv('FRED_MIRROR_FULL_RESYNC_DAYS', '30'))
+
+# Parquet 엔진이 없으면 pickle로 저장 (pyarrow 권장)
+try:
+    import pyarrow  # noqa: F401
+    FILE_EXT = '.parquet'
+except ImportError:
+    FILE_EXT = '.pkl'
+
+_write_lock = threading.Lock()
+
+
+class SeriesNotFound(ValueError):
+    """FRED에 없는 시리즈 (일시적인 요청 실패와 구분)"""
+
+
+def _fred_request(path, **params):
+    """FRED REST API 호출 (JSON 응답)"""
+    params.update(api_key=FRED_API_KEY, file_type='json')
+    response = http_client.get('fred', f"{FRED_API_URL}/{path}", params=params)
+    # 없는 시리즈는 400 "Bad Request. The series does not exist." 로 응답
+    if response.status_code in (400, 404) and 'does not exist' in response.text:
+        raise SeriesNotFound(f"FRED에 {params.get('series_id')} 시리즈가 없습니다")
+    if response.status_code != 200:
+        raise ValueError(f"FRED API 요청 실패 ({path}): {response.status_code} {response.text[:200]}")
+    return response.json()
+
+
+def get_series_info(series_id):
+    """시리즈 메타데이터 (last_updated, frequency_short 등)"""
+    return _fred_request('series', series_id=series_id)['seriess'][0]
+
+
+def get_observations(series_id, start=None):
+    """관측치 Series (fred.get_series()와 같은 형태, 결측값 '.'은 NaN)"""
+    params = {'series_id': series_id}
+    if start is not None:
+        params['observation_start'] = start
+    observations = _fred_request('series/observations', **params)['observations']
+    frame = pd.DataFrame(observations, columns=['date', 'value'])
+    values = pd.to_numeric(frame['value'], errors='coerce')
+    return pd.Series(values.to_numpy(dtype=float), index=pd.to_datetime(frame['date'].to_numpy()))
+
+
+def _series_path(series_id, ext):
+    return os.path.join(MIRROR_DIR, series_id + ext)
+
+
+def load_series(series_id):
+    """미러에서 전체 시리즈 읽기 (없으면 None)"""
+    path = _series_path(series_id, FILE_EXT)
+    if not os.path.exists(path):
+        return None
+    try:
+        if FILE_EXT == '.parquet':
+            return pd.read_parquet(path)['value'].rename(None)
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"FRED 미러 읽기 실패 ({series_id}): {e}")
+        return None
+
+
+def load_meta(series_id):
+    """동기화 메타데이터 (last_updated, frequency, checked_at, full_synced_at)"""
+    try:
+        with open(_series_path(series_id, '.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write(path, write_fn):
+    """임시 파일 작성 후 교체"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _write_lock:
+        write_fn(tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _save(series_id, series, meta):
+    def write_meta(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def write_series(tmp_path):
+        if FILE_EXT == '.parquet':
+            series.to_frame('value').to_parquet(tmp_path)
+        else:
+            series.to_pickle(tmp_path)
+
+    if series is not None:
+        _write(_series_path(series_id, FILE_EXT), write_series)
+    _write(_series_path(series_id, '.json'), write_meta)
+
+
+def series_max_age(series_id, frequency=None):
+    """시리즈별 동기화 확인 주기 (초)"""
+    env_value = os.getenv(f"FRED_MIRROR_MAX_AGE_{series_id.upper()}")
+    if env_value:
+        return int(env_value)
+    # 미리 받기(prefetch.py)가 켜져 있으면 대상 시리즈는 스케줄러가 동기화
+    if PREFETCH_MODE != 'off' and series_id in FRED_SERIES:
+        return PREFETCH_MAX_AGE
+    return FREQUENCY_MAX_AGE.get(frequency, DEFAULT_MAX_AGE)
+
+
+def _merge_observations(stored, fetched):
+    """저장된 시리즈에 새로 받은 관측치 병합 (같은 날짜는 새 값 우선)"""
+    merged = pd.concat([stored, fetched])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index()
+
+
+def sync_series(series_id, full=False):
+    """FRED와 동기화 후 전체 시리즈 반환 (변경이 없으면 관측치는 받지 않음)"""
+    stored = load_series(series_id)
+    meta = load_meta(series_id)
+
+    info = get_series_info(series_id)
+    last_updated = str(info.get('last_updated'))
+    frequency = str(info.get('frequency_short', ''))
+    now = time.time()
+
+    full_synced_at = meta.get('full_synced_at', 0)
+    if stored is None or full or now - full_synced_at > FULL_RESYNC_DAYS * 24 * 60 * 60:
+        series = get_observations(series_id)
+        full_synced_at = now
+    elif meta.get('last_updated') == last_updated:
+        # 마지막 동기화 이후 수정 없음 - 확인 시각만 갱신
+        meta['checked_at'] = now
+        _save(series_id, None, meta)
+        return stored
+    else:
+        lookback = REVISION_LOOKBACK_DAYS.get(frequency, DEFAULT_REVISION_LOOKBACK_DAYS)
+        start = stored.index[-1] - pd.Timedelta(days=lookback) if not stored.empty else None
+        delta = get_observations(series_id, start=start.strftime('%Y-%m-%d') if start is not None else None)
+        series = _merge_observations(stored, delta)
+
+    series.name = None
+    meta = {
+        'last_updated': last_updated,
+        'frequency': frequency,
+        'checked_at': now,
+        'full_synced_at': full_synced_at,
+    }
+    _save(series_id, series, meta)
+    return series
+
+
+def _slice_series(series, start=None, end=None):
+    """observation_start/observation_end 와 같이 양 끝 날짜 포함"""
+    if start is not None:
+        series = series[series.index >= pd.Timestamp(start)]
+    if end is not None:
+        series = series[series.index <= pd.Timestamp(end)]
+    return series.copy()
+
+
+def get_fred_series(series_id, start=None, end=None, max_age=None, missing_ok=False):
+    """fred.get_series() 대체: 미러 우선, 확인 주기가 지난 경우에만 FRED와 동기화
+
+    missing_ok=True 이면 FRED에 없는 시리즈는 예외 대신 빈 Series 반환 (대체 심볼 탐색용).
+    """
+    series = load_series(series_id)
+    meta = load_meta(series_id)
+    if max_age is None:
+        max_age = series_max_age(series_id, meta.get('frequency'))
+
+    checked_at = meta.get('checked_at')
+    age = time.time() - checked_at if checked_at else None
+    stale = series is None or age is None or age > max_age
+    # 미러에 데이터가 있으면 먼저 반환하고 동기화는 백그라운드에서 (stale-while-revalidate 모드인 경우)
+    if stale and not OFFLINE and series is not None and revalidate(('fred', series_id), age, sync_series, series_id):
+        stale = False
+
+    if stale and not OFFLINE:
+        try:
+            # 여러 세션이 같은 시리즈를 동시에 요청하면 한 번만 동기화
+            series = single_flight(('fred', series_id), sync_series, series_id)
+        except SeriesNotFound:
+            if missing_ok:
+                return pd.Series(dtype=float)
+            raise
+        except Exception as e:
+            # 동기화 실패 시에는 (오래되었더라도) 미러에 저장된 데이터 사용
+            if series is None:
+                raise
+            print(f"FRED {series_id} 동기화 실패, 저장된 데이터 사용: {e}")
+
+    if series is None:
+        raise ValueError(f"FRED 미러에 {series_id} 시리즈가 없습니다 (오프라인 모드)")
+
+    return _slice_series(series, start=start, end=end)
+
+
+def sync_all(series_ids, full=False):
+    """여러 시리즈 동기화 (미리 받아두기용), {시리즈: 관측치 수 또는 None}"""
+    results = {}
+    for series_id in series_ids:
+        try:
+            results[series_id] = len(sync_series(series_id, full=full))
+        except Exception as e:
+            print(f"FRED {series_id} 동기화 실패: {e}")
+            results[series_id] = None
+    return results
+
+
+def mirror_info():
+    """미러에 저장된 시리즈 목록 (관측치 수, 기간, FRED 수정 시각, 마지막 확인 시각)"""
+    rows = []
+    if os.path.isdir(MIRROR_DIR):
+        for filename in sorted(os.listdir(MIRROR_DIR)):
+            if not filename.endswith(FILE_EXT):
+                continue
+            series_id = filename[:-len(FILE_EXT)]
+            series = load_series(series_id)
+            meta = load_meta(series_id)
+            if series is None:
+                continue
+            checked_at = meta.get('checked_at')
+            rows.append({
+                'Series': series_id,
+                'Frequency': meta.get('frequency'),
+                'Observations': len(series),
+                'First': series.index[0].strftime('%Y-%m-%d') if len(series) else None,
+                'Last': series.index[-1].strftime('%Y-%m-%d') if len(series) else None,
+                'Last Updated (FRED)': meta.get('last_updated'),
+                'Checked': time.strftime('%Y-%m-%d %H:%M', time.localtime(checked_at)) if checked_at else None,
+            })
+    return pd.DataFrame(rows, columns=['Series', 'Frequency', 'Observations', 'First', 'Last',
+                                       'Last Updated (FRED)', 'Checked'])
+
+
+if __name__ == '__main__':
+    # 사용법: python fred_mirror.py info | sync SERIES_ID [SERIES_ID ...] | resync SERIES_ID [SERIES_ID ...]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'info'
+    args = sys.argv[2:]
+
+    if command == 'info':
+        print(mirror_info().to_string(index=False))
+    elif command in ('sync', 'resync') and args:
+        for series_id, count in sync_all(args, full=command == 'resync').items():
+            print(f"{series_id}: {count}개 관측치")
+    else:
+        print("사용법: python fred_mirror.py info | sync SERIES_ID [SERIES_ID ...] | resync SERIES_ID [SERIES_ID ...]")
+        sys.exit(1)
@@ -0,0 +1,137 @@
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limit import throttle
+
+# 외부 HTTP 요청(KRX, FINRA, FRED) 공통 클라이언트
+# 호스트별로 세션 하나를 공유해 연결(TCP/TLS)을 재사용하고(keep-alive),
+# 모든 요청에 타임아웃과 지수 백오프(지터 포함) 재시도를 적용한다.
+# 요청 횟수에는 rate_limit의 호스트별 속도 제한이 그대로 적용된다 (재시도 포함).
+
+# 요청 타임아웃 (연결, 응답) (초)
+CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '20'))
+
+# 재시도: 연결 실패/타임아웃, 429/5xx 응답인 경우에만
+MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+BACKOFF_BASE = 0.5      # 첫 재시도 대기 상한 (초), 재시도마다 2배
+BACKOFF_MAX = 8.0       # 재시도 대기 상한 (초)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 호스트별 연결 풀 크기 (KRX 날짜별 요청 등 동시 요청 수)
+POOL_MAXSIZE = 8
+
+# HTTP/2: HTTP_CLIENT_HTTP2=1 이고 httpx[http2]가 설치된 경우에만 사용 (없으면 requests)
+HTTP2 = os.getenv('HTTP_CLIENT_HTTP2', '0') == '1'
+if HTTP2:
+    try:
+        import h2  # noqa: F401
+        import httpx
+    except ImportError:
+        print("HTTP/2 사용 불가 (httpx[http2] 미설치), HTTP/1.1로 요청합니다")
+        HTTP2 = False
+
+# 압축 전송 (brotli가 설치되어 있으면 br도 허용)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+if HTTP2:
+    _TRANSIENT_ERRORS = (httpx.TransportError,)
+else:
+    _TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session():
+    headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+    if HTTP2:
+        return httpx.Client(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE),
+            follow_redirects=True,
+        )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(headers)
+    return session
+
+
+def get_session(host):
+    """호스트별 공유 세션 (프로세스당 하나)"""
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _new_session()
+            _sessions[host] = session
+        return session
+
+
+def _backoff(attempt, response=None):
+    """재시도 전 대기 시간 (초) - Retry-After 헤더 우선, 없으면 지수 백오프 + 전체 지터"""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(BACKOFF_MAX, float(retry_after))
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def _send(session, method, url, timeout, kwargs):
+    if HTTP2:
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return session.request(method, url, timeout=httpx.Timeout(read, connect=connect), **kwargs)
+    return session.request(method, url, timeout=timeout, **kwargs)
+
+
+def request(host, method, url, timeout=None, retries=None, **kwargs):
+    """host 공유 세션으로 요청 (속도 제한, 타임아웃, 재시도 적용)
+
+    requests.request()와 같은 인자(params, data, json, headers)를 받고 응답 객체를 반환한다.
+    재시도 후에도 실패하면 마지막 예외를 그대로 발생시키거나 마지막 응답을 반환한다.
+    """
+    session = get_session(host)
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    if retries is None:
+        retries = MAX_RETRIES
+
+    for attempt in range(retries + 1):
+        throttle(host)
+        try:
+            response = _send(session, method, url, timeout, kwargs)
+        except _TRANSIENT_ERRORS as e:
+            if attempt >= retries:
+                raise
+            wait = _backoff(attempt)
+            print(f"{host} 요청 실패, {wait:.1f}초 후 재시도 ({attempt + 1}/{retries}): {e}")
+            time.sleep(wait)
+            continue
+
+        if response.status_code in RETRY_STATUS and attempt < retries:
+            wait = _backoff(attempt, response)
+            print(f"{host} 응답 {response.status_code}, {wait:.1f}초 후 재시도 ({attempt + 1}/{retries})")
+            time.sleep(wait)
+            continue
+        return response
+
+
+def get(host, url, **kwargs):
+    return request(host, 'GET', url, **kwargs)
+
+
+def post(host, url, **kwargs):
+    return request(host, 'POST', url, **kwargs)
@@ -0,0 +1,180 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+from config import DATA_DIR
+
+# import 시간 측정 도구 (python -X importtime 출력 분석)
+# 앱 시작(랜딩 페이지)과 페이지별 첫 방문에 드는 import 비용을 측정하고,
+# 릴리스마다 결과를 기록해 시작 시간이 늘어나는지 추적한다.
+#
+# 사용법
+#   python importtime.py startup             앱 시작 시 import 비용 (main.py의 최상위 import)
+#   python importtime.py pages               페이지별 첫 방문 시 추가 import 비용
+#   python importtime.py top MODULE [N]      MODULE import 시 누적 시간 상위 N개 패키지
+#   python importtime.py record [RELEASE]    startup/pages 결과를 기록 (기본 릴리스: git describe)
+#   python importtime.py history             기록된 결과 비교
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(DATA_DIR, 'importtime.jsonl')
+MARKER = '--importtime-marker--'
+
+
+def startup_modules():
+    """main.py가 시작할 때 (조건 없이) import 하는 모듈 목록"""
+    with open(os.path.join(APP_DIR, 'main.py'), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def parse_importtime(output):
+    """-X importtime 출력 -> [(패키지, 자체 시간 us, 누적 시간 us, 깊이)]"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        self_us, cumulative_us, name = fields
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(modules, preload=()):
+    """새 인터프리터에서 modules import 비용 측정 (preload는 미리 import 하고 측정에서 제외)
+
+    반환: {'import_ms': 최상위 import 누적 합계, 'wall_ms': 측정 구간 전체 시간, 'rows': 상세}
+    """
+    code = '\n'.join([
+        'import sys, time',
+        *[f'import {module}' for module in preload],
+        f'sys.stderr.write({MARKER!r} + "\\n")',
+        'started = time.perf_counter()',
+        *[f'import {module}' for module in modules],
+        f'sys.stderr.write({MARKER!r} + " %.3f\\n" % ((time.perf_counter() - started) * 1000))',
+    ])
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=APP_DIR,
+                            capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=APP_DIR))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'import 실패')
+
+    measured, wall_ms = [], 0.0
+    inside = False
+    for line in result.stderr.splitlines():
+        if line.startswith(MARKER):
+            if inside:
+                wall_ms = float(line.split()[-1])
+            inside = not inside
+        elif inside:
+            measured.append(line)
+    rows = parse_importtime('\n'.join(measured))
+    import_ms = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+    return {'import_ms': round(import_ms, 1), 'wall_ms': round(wall_ms, 1), 'rows': rows}
+
+
+def top_packages(rows, limit=15):
+    """최상위 패키지별 누적 시간 (ms) 상위 목록"""
+    totals = {}
+    for name, self_us, _, _ in rows:
+        package = name.split('.')[0]
+        totals[package] = totals.get(package, 0) + self_us
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [(package, round(us / 1000, 1)) for package, us in ranked]
+
+
+def measure_startup():
+    return measure(startup_modules())
+
+
+def measure_pages():
+    """페이지별 첫 방문 시 추가 import 비용 (앱 시작 import 이후)"""
+    from app_pages import PAGES
+
+    results = {}
+    for page, module_name in PAGES.items():
+        if module_name is None:
+            continue
+        results[page] = measure([f'app_pages.{module_name}'], preload=startup_modules())
+    return results
+
+
+def _release():
+    release = os.getenv('RELEASE')
+    if release:
+        return release
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=APP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def record(release=None):
+    """startup/pages 측정 결과를 HISTORY_PATH에 한 줄(JSON)로 추가"""
+    startup = measure_startup()
+    pages = measure_pages()
+    entry = {
+        'release': release or _release(),
+        'recorded_at': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'python': sys.version.split()[0],
+        'startup_ms': startup['import_ms'],
+        'startup_wall_ms': startup['wall_ms'],
+        'startup_top': top_packages(startup['rows'], limit=5),
+        'pages_ms': {page: result['import_ms'] for page, result in pages.items()},
+    }
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    return entry
+
+
+def history():
+    """기록된 측정 결과 목록"""
+    if not os.path.exists(HISTORY_PATH):
+        return []
+    with open(HISTORY_PATH, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _print_measure(title, result, limit=10):
+    print(f"{title}: import {result['import_ms']:.1f} ms (실측 {result['wall_ms']:.1f} ms)")
+    for package, ms in top_packages(result['rows'], limit=limit):
+        print(f"  {package:<30} {ms:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'startup'
+    args = sys.argv[2:]
+
+    if command == 'startup':
+        print(f"앱 시작 import: {', '.join(startup_modules())}")
+        _print_measure('startup', measure_startup())
+    elif command == 'pages':
+        for page, result in measure_pages().items():
+            _print_measure(page, result, limit=5)
+    elif command == 'top' and args:
+        _print_measure(args[0], measure([args[0]]), limit=int(args[1]) if len(args) > 1 else 15)
+    elif command == 'record':
+        entry = record(args[0] if args else None)
+        print(json.dumps(entry, ensure_ascii=False, indent=2))
+        print(f"기록: {HISTORY_PATH}")
+    elif command == 'history':
+        for entry in history():
+            pages = entry.get('pages_ms', {})
+            slowest = max(pages.items(), key=lambda item: item[1]) if pages else ('-', 0)
+            print(f"{entry['recorded_at']}  {entry['release']:<20} startup {entry['startup_ms']:>8.1f} ms  "
+                  f"(실측 {entry['startup_wall_ms']:>8.1f} ms)  가장 느린 페이지 {slowest[0]} {slowest[1]:.1f} ms")
+    else:
+        print("사용법: python importtime.py startup | pages | top MODULE [N] | record [RELEASE] | history")
+        sys.exit(1)
@@ -0,0 +1,153 @@
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from alignment import align
+
+# 파생 지표 계산 엔진
+# 비율/스프레드 같은 파생 시계열을 기본 시계열 이름에 대한 수식("VVIX / VIX", "BAA10Y - DGS10")으로 선언하고,
+# 입력을 한 번 정렬(alignment.align)한 뒤 NumPy 배열 연산으로 계산한다.
+# 결과는 입력 데이터의 지문(fingerprint)으로 캐시해 입력이 바뀐 경우에만 다시 계산한다.
+
+# 대시보드에서 사용하는 파생 지표 (이름: 수식)
+INDICATORS = {
+    'VVIX/VIX': 'VVIX / VIX',
+    'BAA10Y-DGS10': 'BAA10Y - DGS10',
+    'HYG/TLT': 'pct_change(HYG / TLT) * 10000',     # 가격 비율 변화율 (bp) - 하이일드 스프레드 대용
+    'SOFR-DGS10': 'SOFR - DGS10',
+}
+
+# 캐시 항목 수 상한 (초과 시 가장 오래 사용하지 않은 결과부터 제거)
+CACHE_MAX_ENTRIES = 64
+
+
+def _pct_change(values):
+    result = np.full(values.shape, np.nan)
+    result[1:] = values[1:] / values[:-1] - 1
+    return result
+
+
+def _diff(values):
+    result = np.full(values.shape, np.nan)
+    result[1:] = values[1:] - values[:-1]
+    return result
+
+
+# 수식에서 사용할 수 있는 함수
+FUNCTIONS = {
+    'pct_change': _pct_change,
+    'diff': _diff,
+    'log': np.log,
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+}
+
+_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.Pow: np.power,
+}
+_UNARY_OPS = {
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+}
+
+
+def _check(node):
+    """허용된 문법(사칙연산, 거듭제곱, 숫자, 시계열 이름, FUNCTIONS 호출)만 사용했는지 확인"""
+    if isinstance(node, ast.Expression):
+        _check(node.body)
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        _check(node.left)
+        _check(node.right)
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        _check(node.operand)
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS \
+            and len(node.args) == 1 and not node.keywords:
+        _check(node.args[0])
+    elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        pass
+    elif isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+        pass
+    else:
+        raise ValueError(f"수식에서 사용할 수 없는 표현: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=128)
+def parse_formula(formula):
+    """수식 파싱 -> (구문 트리, 입력 시계열 이름 목록)"""
+    tree = ast.parse(formula, mode='eval')
+    _check(tree)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in FUNCTIONS and node.id not in names:
+            names.append(node.id)
+    return tree, tuple(names)
+
+
+def _evaluate(node, arrays):
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body, arrays)
+    if isinstance(node, ast.BinOp):
+        return _BINARY_OPS[type(node.op)](_evaluate(node.left, arrays), _evaluate(node.right, arrays))
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand, arrays))
+    if isinstance(node, ast.Call):
+        return FUNCTIONS[node.func.id](_evaluate(node.args[0], arrays))
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    return arrays[node.id]
+
+
+def fingerprint(series):
+    """시계열 지문 (인덱스와 값이 같으면 같은 값)"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(series.index.values).view(np.uint8))
+    digest.update(np.ascontiguousarray(series.to_numpy(dtype=float)).view(np.uint8))
+    return digest.hexdigest()
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def evaluate(formula, inputs, how='inner'):
+    """수식 계산 (inputs: {이름: Series}), 입력을 정렬한 인덱스의 Series 반환"""
+    tree, names = parse_formula(formula)
+    missing = [name for name in names if name not in inputs or inputs[name] is None]
+    if missing:
+        raise KeyError(f"수식 '{formula}'의 입력이 없습니다: {', '.join(missing)}")
+
+    key = (formula, how) + tuple((name, fingerprint(inputs[name])) for name in names)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key].copy()
+
+    aligned = align({name: inputs[name] for name in names}, how=how)
+    if aligned.empty:
+        result = pd.Series(dtype=float)
+    else:
+        arrays = {name: aligned[name].to_numpy(dtype=float) for name in names}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = _evaluate(tree, arrays)
+        result = pd.Series(np.broadcast_to(values, len(aligned.index)).copy(), index=aligned.index)
+
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return result.copy()
+
+
+def indicator(name, inputs, how='inner'):
+    """INDICATORS에 등록된 파생 지표 계산"""
+    return evaluate(INDICATORS[name], inputs, how=how).rename(name)
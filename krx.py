@@ -0,0 +1,155 @@
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pytz
+
+from config import DATA_DIR
+from fetch_engine import FetchTask, iter_completed
+import http_client
+from market_calendar import trading_days
+
+# KRX 정보데이터시스템 옵션 통계 조회
+# 거래일만 요청하고(휴장일 제외), 지난 거래일의 결과는 디스크에 영구 저장해 다시 요청하지 않는다.
+
+KRX_DIR = os.path.join(DATA_DIR, 'krx')
+
+# 요청 타임아웃 (연결, 응답) (초)
+REQUEST_TIMEOUT = (5, 15)
+
+KST = pytz.timezone('Asia/Seoul')
+
+_write_lock = threading.Lock()
+
+
+class KRXOptionAPI:
+    def __init__(self, auth_key):
+        self.auth_key = auth_key
+        self.base_url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+        # 연결은 http_client의 KRX 공유 세션을 재사용 (날짜별 동시 요청 포함)
+        self.headers = {
+            'AUTH_KEY': self.auth_key,
+            'Content-Type': 'application/json',
+        }
+
+    def get_put_call_ratio(self, date):
+        """특정 날짜의 P/C Ratio 데이터 조회"""
+        params = {
+            'bld': 'dbms/MDC/STAT/standard/MDCSTAT02501',
+            'basDd': date,  # YYYYMMDD 형식
+            'mktId': 'ALL',
+            'share': '1',
+            'money': '1',
+            'csvxls_isNo': 'false'
+        }
+
+        response = http_client.get('krx', self.base_url, params=params, headers=self.headers,
+                                   timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            data = response.json()
+            return self.parse_pc_ratio_data(data)
+        else:
+            raise Exception(f"API 요청 실패: {response.status_code}")
+
+    def parse_pc_ratio_data(self, raw_data):
+        """API 응답 데이터 파싱"""
+        # 작업 스레드에서 호출되므로 안내 메시지는 st.* 대신 print로 남김
+        try:
+            # 실제 API 응답 구조에 따라 구현
+            if 'OutBlock_1' in raw_data:
+                records = raw_data['OutBlock_1']
+                df = pd.DataFrame(records)
+
+                # 다양한 컬럼명에 대응
+                if 'PC_RATIO' in df.columns:
+                    return df[['PC_RATIO']]
+                elif 'PUT_CALL_RATIO' in df.columns:
+                    return df[['PUT_CALL_RATIO']]
+                elif 'PCR' in df.columns:
+                    return df[['PCR']]
+                elif 'PUT_CALL' in df.columns:
+                    return df[['PUT_CALL']]
+                else:
+                    # 사용 가능한 컬럼 확인
+                    print(f"KRX 응답의 사용 가능한 컬럼: {list(df.columns)}")
+                    return df
+
+            return pd.DataFrame()
+
+        except Exception as e:
+            print(f"KRX 데이터 파싱 실패: {e}")
+            return pd.DataFrame()
+
+
+def _days_path():
+    return os.path.join(KRX_DIR, 'put_call_ratio_days.pkl')
+
+
+def _load_days():
+    """저장된 지난 거래일 결과 (Date 컬럼 포함, 없으면 None)"""
+    path = _days_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"KRX 저장 데이터 읽기 실패: {e}")
+        return None
+
+
+def _save_days(days):
+    path = _days_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _write_lock:
+        days.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+
+def get_put_call_ratio_days(api, start, end):
+    """start ~ end 사이 거래일별 P/C Ratio (Date 컬럼 포함), 지난 거래일은 저장된 결과 사용"""
+    trading_days_in_range = trading_days(start, end, 'KRX')
+    today = pd.Timestamp(datetime.now(KST).date())
+
+    stored = _load_days()
+    stored_dates = set(stored['Date']) if stored is not None else set()
+    missing = [day for day in trading_days_in_range if day not in stored_dates]
+
+    tasks = {day: FetchTask(api.get_put_call_ratio, day.strftime('%Y%m%d')) for day in missing}
+    fetched = []
+    empty_days = []
+    for day, daily_data, error in iter_completed(tasks):
+        if error is not None:
+            print(f"{day.strftime('%Y-%m-%d')} KRX 데이터 로드 실패: {error}")
+            continue
+        if daily_data is not None and not daily_data.empty:
+            daily_data = daily_data.copy()
+            daily_data['Date'] = day
+            fetched.append(daily_data)
+        else:
+            empty_days.append(day)
+
+    # 지난 거래일 결과만 영구 저장 (오늘 데이터는 장중/마감 집계 전일 수 있음)
+    final = [frame for frame in fetched if frame['Date'].iloc[0] < today]
+    # 데이터가 없던 지난 거래일(KRX 휴장일 차이 등)도 Date만 있는 행으로 저장해 다시 요청하지 않음
+    empty_past_days = sorted(day for day in empty_days if day < today)
+    if empty_past_days:
+        final.append(pd.DataFrame({'Date': empty_past_days}))
+    if final:
+        updated = pd.concat(([stored] if stored is not None else []) + final, ignore_index=True)
+        _save_days(updated.sort_values('Date'))
+        stored = updated
+
+    frames = fetched if stored is None else [stored] + [frame for frame in fetched if frame['Date'].iloc[0] >= today]
+    if not frames:
+        return pd.DataFrame()
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined[combined['Date'].isin(trading_days_in_range)]
+    # 데이터 없는 날 표시 행 제외
+    value_columns = [column for column in combined.columns if column != 'Date']
+    if not value_columns:
+        return pd.DataFrame()
+    combined = combined.dropna(how='all', subset=value_columns)
+    return combined.sort_values('Date').reset_index(drop=True)
@@ -0,0 +1,48 @@
+import importlib
+import sys
+import threading
+import time
+
+# 무거운 패키지(pandas, yfinance, bs4 등)를 실제로 사용할 때까지 import를 미루는 대리 모듈
+# 모듈 맨 위에서 pd = lazy_module('pandas') 처럼 선언해 두면 처음 속성에 접근할 때(pd.DataFrame 등) import 된다.
+# 랜딩 페이지처럼 해당 패키지가 필요 없는 실행에서는 import 비용이 들지 않는다.
+
+_load_times = {}
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 import 하는 모듈 대리 객체"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                started = time.perf_counter()
+                self._module = importlib.import_module(self._name)
+                _load_times[self._name] = time.perf_counter() - started
+        return self._module
+
+    def __getattr__(self, attr):
+        module = self._module if self._module is not None else self._load()
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_module(name):
+    """import를 미루는 모듈 (이미 import 되어 있으면 그 모듈 그대로)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def deferred_imports():
+    """지연 import 된 모듈과 걸린 시간 (초), 아직 사용되지 않은 모듈은 제외"""
+    return dict(_load_times)
@@ -1,17 +1,9 @@
-import streamlit as st
-import yfinance as yf
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
-from datetime import datetime, timedelta
-import plotly.express as px
-import requests
-from fredapi import Fred
-import json
-from bs4 import BeautifulSoup
 import time
-import os
+import streamlit as st
+from data_cache import begin_stale_serving, end_stale_serving, REVALIDATE_TIMEOUT, REVALIDATE_POLL_INTERVAL
+from config import PREFETCH_MODE, PAGE_IMPORT_MODE
+from styles import apply_styles
+from app_pages import preload_pages, render_page
 
 # 페이지 설정 (가장 먼저 호출되어야 함)
 st.set_page_config(
@@ -21,1759 +13,36 @@ st.set_page_config(
     initial_sidebar_state="expanded"  # 사이드바가 열린 상태로 시작
 )
 
-# FRED API 키 가져오기 (환경 변수 우선, 없으면 기본값 사용)
-# 로컬: 환경 변수 또는 기본값 사용
-# 배포(Streamlit Cloud): 환경 변수 또는 Secrets 사용
-FRED_API_KEY = os.getenv('FRED_API_KEY', '3c135ee62b5baa4f41adcf37a4a508c9')
+# 백그라운드 미리 받기 스케줄러 (프로세스당 한 번만 시작됨)
+# (prefetch는 가격 저장소/yfinance를 불러오므로 사용할 때만 import)
+if PREFETCH_MODE == 'inprocess':
+    from prefetch import start_prefetch
+    start_prefetch()
 
-# Streamlit Cloud 배포 시 secrets 사용 (로컬에서는 에러 방지를 위해 주석 처리)
-# if not FRED_API_KEY or FRED_API_KEY == '3c135ee62b5baa4f41adcf37a4a508c9':
-#     try:
-#         if hasattr(st, 'secrets') and 'FRED_API_KEY' in st.secrets:
-#             FRED_API_KEY = st.secrets['FRED_API_KEY']
-#     except:
-#         pass
+# 페이지 모듈을 시작 시 모두 불러오는 모드 (기본값은 처음 방문할 때 import)
+if PAGE_IMPORT_MODE == 'eager':
+    preload_pages()
 
 # 사이드바 스타일링
-st.markdown("""
-<style>
-    /* 사이드바 전체 스타일 - 미니멀하고 세련된 디자인 */
-    .css-1cypcdb, .css-1d391kg, [data-testid="stSidebar"] {
-        background: #f8f9fa !important;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        border-right: 1px solid #e9ecef !important;
-    }
-    
-    /* 사이드바 제목 스타일 */
-    [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
-        color: #2c3e50 !important;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-        margin-bottom: 8px !important;
-    }
-    
-    /* 사이드바 버튼 스타일 - 간격 완전 제거 (더 강력한 선택자) */
-    .stApp [data-testid="stSidebar"] .stButton,
-    .stApp [data-testid="stSidebar"] .stButton > div,
-    .stApp [data-testid="stSidebar"] .stButton > button,
-    [data-testid="stSidebar"] .stButton,
-    [data-testid="stSidebar"] .stButton > div,
-    [data-testid="stSidebar"] .stButton > button {
-        margin: 0 !important;
-        margin-top: 0 !important;
-        margin-bottom: 0 !important;
-        padding: 0 !important;
-        padding-top: 0 !important;
-        padding-bottom: 0 !important;
-        line-height: 1 !important;
-        gap: 0 !important;
-    }
-    
-    .stApp [data-testid="stSidebar"] .stButton > button {
-        background: transparent !important;
-        color: #2c3e50 !important;
-        border: none !important;
-        border-radius: 4px !important;
-        padding: 2px 6px !important;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        font-weight: 500 !important;
-        font-size: 12px !important;
-        transition: all 0.2s ease !important;
-        text-align: left !important;
-        justify-content: flex-start !important;
-        width: 100% !important;
-        margin: 0 !important;
-        margin-bottom: 0 !important;
-        margin-top: 0 !important;
-        box-shadow: none !important;
-        line-height: 1.1 !important;
-        min-height: 24px !important;
-        height: 24px !important;
-    }
-    
-    /* 모든 버튼 간격 완전 제거 - 더 강력한 선택자 */
-    .stApp [data-testid="stSidebar"] .stButton + .stButton,
-    .stApp [data-testid="stSidebar"] .stButton + *,
-    .stApp [data-testid="stSidebar"] * + .stButton,
-    [data-testid="stSidebar"] .stButton + .stButton,
-    [data-testid="stSidebar"] .stButton + *,
-    [data-testid="stSidebar"] * + .stButton {
-        margin-top: 0 !important;
-        margin-bottom: 0 !important;
-        padding-top: 0 !important;
-        padding-bottom: 0 !important;
-    }
-    
-    /* 컨테이너 간격도 제거 */
-    [data-testid="stSidebar"] .stContainer,
-    .stApp [data-testid="stSidebar"] .stContainer {
-        margin: 0 !important;
-        padding: 0 !important;
-        gap: 0 !important;
-    }
-    
-    /* 사이드바 전체 요소 간격 제거 */
-    [data-testid="stSidebar"] > div,
-    .stApp [data-testid="stSidebar"] > div {
-        gap: 0 !important;
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-    
-    /* Streamlit 기본 스타일 오버라이드 */
-    .stApp [data-testid="stSidebar"] .stButton {
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-    
-    .stApp [data-testid="stSidebar"] .stButton > button {
-        margin: 0 !important;
-        padding: 2px 6px !important;
-        min-height: 24px !important;
-        height: 24px !important;
-    }
-    
-    [data-testid="stSidebar"] .stButton > button:hover {
-        background: #e9ecef !important;
-        color: #2c3e50 !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* 선택된 버튼 스타일 */
-    [data-testid="stSidebar"] .stButton > button:focus {
-        background: #e9ecef !important;
-        color: #2c3e50 !important;
-        box-shadow: none !important;
-    }
-    
-    /* 사이드바 텍스트 스타일 */
-    [data-testid="stSidebar"] .stMarkdown {
-        color: #6c757d !important;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-        font-size: 14px !important;
-        font-weight: 500 !important;
-        margin-bottom: 4px !important;
-    }
-    
-    /* 사이드바 구분선 스타일 */
-    [data-testid="stSidebar"] hr {
-        border: none !important;
-        border-top: 1px solid #e9ecef !important;
-        margin: 8px 0 !important;
-    }
-    
-    /* 사이드바 스크롤바 스타일 */
-    [data-testid="stSidebar"]::-webkit-scrollbar {
-        width: 6px;
-    }
-    
-    [data-testid="stSidebar"]::-webkit-scrollbar-track {
-        background: transparent;
-    }
-    
-    [data-testid="stSidebar"]::-webkit-scrollbar-thumb {
-        background: #dee2e6;
-        border-radius: 3px;
-    }
-    
-    [data-testid="stSidebar"]::-webkit-scrollbar-thumb:hover {
-        background: #adb5bd;
-    }
-    
-    /* 메뉴 아이콘 스타일 */
-    .menu-icon {
-        margin-right: 8px;
-        font-size: 16px;
-    }
-    
-    /* 모바일 최적화 */
-    @media screen and (max-width: 768px) {
-        /* 메인 컨테이너 모바일 최적화 */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 1rem;
-            padding-left: 0.5rem;
-            padding-right: 0.5rem;
-        }
-        
-        /* 차트 크기 모바일 최적화 */
-        .stPlotlyChart {
-            height: 300px !important;
-        }
-        
-        /* 메트릭 카드 모바일 최적화 */
-        .metric-container {
-            margin-bottom: 0.5rem;
-        }
-        
-        /* 버튼 모바일 최적화 */
-        .stButton > button {
-            font-size: 14px !important;
-            padding: 8px 12px !important;
-        }
-        
-        /* 사이드바 모바일 최적화 */
-        [data-testid="stSidebar"] {
-            width: 280px !important;
-        }
-        
-        /* 텍스트 모바일 최적화 */
-        .stMarkdown {
-            font-size: 14px !important;
-        }
-        
-        /* 테이블 모바일 최적화 */
-        .stDataFrame {
-            font-size: 12px !important;
-        }
-    }
-    
-    /* PWA 지원을 위한 메타 태그 */
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="theme-color" content="#1f77b4">
-    <meta name="apple-mobile-web-app-capable" content="yes">
-    <meta name="apple-mobile-web-app-status-bar-style" content="default">
-    <meta name="apple-mobile-web-app-title" content="Market Dashboard">
-</style>
-
-<script>
-// JavaScript로 직접 버튼 간격 제거 - 더 강력한 방법
-function removeButtonSpacing() {
-    // 모든 가능한 버튼 선택자
-    const selectors = [
-        '[data-testid="stSidebar"] .stButton',
-        '.stApp [data-testid="stSidebar"] .stButton',
-        '[data-testid="stSidebar"] .stButton > div',
-        '[data-testid="stSidebar"] .stButton > button',
-        '.stApp [data-testid="stSidebar"] .stButton > div',
-        '.stApp [data-testid="stSidebar"] .stButton > button'
-    ];
-    
-    selectors.forEach(selector => {
-        const elements = document.querySelectorAll(selector);
-        elements.forEach(function(element) {
-            element.style.setProperty('margin', '0px', 'important');
-            element.style.setProperty('margin-top', '0px', 'important');
-            element.style.setProperty('margin-bottom', '0px', 'important');
-            element.style.setProperty('padding', '0px', 'important');
-            element.style.setProperty('padding-top', '0px', 'important');
-            element.style.setProperty('padding-bottom', '0px', 'important');
-            element.style.setProperty('line-height', '1', 'important');
-            element.style.setProperty('gap', '0px', 'important');
-            
-            // 버튼 요소 특별 처리
-            if (element.tagName === 'BUTTON') {
-                element.style.setProperty('padding', '2px 6px', 'important');
-                element.style.setProperty('min-height', '24px', 'important');
-                element.style.setProperty('height', '24px', 'important');
-                element.style.setProperty('font-size', '12px', 'important');
-            }
-        });
-    });
-    
-    // 컨테이너 간격 제거
-    const containers = document.querySelectorAll('[data-testid="stSidebar"] .stContainer, .stApp [data-testid="stSidebar"] .stContainer');
-    containers.forEach(function(container) {
-        container.style.setProperty('margin', '0px', 'important');
-        container.style.setProperty('padding', '0px', 'important');
-        container.style.setProperty('gap', '0px', 'important');
-    });
-    
-    // 사이드바 전체 요소 간격 제거
-    const sidebarDivs = document.querySelectorAll('[data-testid="stSidebar"] > div, .stApp [data-testid="stSidebar"] > div');
-    sidebarDivs.forEach(function(element) {
-        element.style.setProperty('gap', '0px', 'important');
-        element.style.setProperty('margin', '0px', 'important');
-        element.style.setProperty('padding', '0px', 'important');
-    });
-    
-    // 강제로 CSS 스타일 추가
-    const existingStyle = document.getElementById('custom-sidebar-style');
-    if (existingStyle) {
-        existingStyle.remove();
-    }
-    
-    const style = document.createElement('style');
-    style.id = 'custom-sidebar-style';
-    style.textContent = `
-        .stApp [data-testid="stSidebar"] .stButton,
-        [data-testid="stSidebar"] .stButton {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        .stApp [data-testid="stSidebar"] .stButton > button,
-        [data-testid="stSidebar"] .stButton > button {
-            margin: 0 !important;
-            padding: 2px 6px !important;
-            min-height: 24px !important;
-            height: 24px !important;
-            font-size: 12px !important;
-        }
-        .stApp [data-testid="stSidebar"] .stContainer,
-        [data-testid="stSidebar"] .stContainer {
-            margin: 0 !important;
-            padding: 0 !important;
-            gap: 0 !important;
-        }
-    `;
-    document.head.appendChild(style);
-}
-
-// 페이지 로드 시 실행
-document.addEventListener('DOMContentLoaded', removeButtonSpacing);
-
-// Streamlit이 동적으로 추가하는 요소들 처리
-const observer = new MutationObserver(removeButtonSpacing);
-observer.observe(document.body, {
-    childList: true,
-    subtree: true
-});
-
-// 주기적으로도 실행
-setInterval(removeButtonSpacing, 500);
-</script>
-""", unsafe_allow_html=True)
+apply_styles()
 
 # 세션 상태 초기화
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'main'
 
-class KRXOptionAPI:
-    def __init__(self, auth_key):
-        self.auth_key = auth_key
-        self.base_url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
-    
-    def get_put_call_ratio(self, date):
-        """특정 날짜의 P/C Ratio 데이터 조회"""
-        headers = {
-            'AUTH_KEY': self.auth_key,
-            'Content-Type': 'application/json',
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        params = {
-            'bld': 'dbms/MDC/STAT/standard/MDCSTAT02501',
-            'basDd': date,  # YYYYMMDD 형식
-            'mktId': 'ALL',
-            'share': '1',
-            'money': '1',
-            'csvxls_isNo': 'false'
-        }
-        
-        response = requests.get(self.base_url, headers=headers, params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            return self.parse_pc_ratio_data(data)
-        else:
-            raise Exception(f"API 요청 실패: {response.status_code}")
-    
-    def parse_pc_ratio_data(self, raw_data):
-        """API 응답 데이터 파싱"""
-        try:
-            # 실제 API 응답 구조에 따라 구현
-            if 'OutBlock_1' in raw_data:
-                records = raw_data['OutBlock_1']
-                df = pd.DataFrame(records)
-                
-                # 다양한 컬럼명에 대응
-                if 'PC_RATIO' in df.columns:
-                    return df[['PC_RATIO']]
-                elif 'PUT_CALL_RATIO' in df.columns:
-                    return df[['PUT_CALL_RATIO']]
-                elif 'PCR' in df.columns:
-                    return df[['PCR']]
-                elif 'PUT_CALL' in df.columns:
-                    return df[['PUT_CALL']]
-                else:
-                    # 사용 가능한 컬럼 확인
-                    st.info(f"사용 가능한 컬럼: {list(df.columns)}")
-                    return df
-            
-            return pd.DataFrame()
-            
-        except Exception as e:
-            st.warning(f"데이터 파싱 실패: {e}")
-            return pd.DataFrame()
-
-def get_kospi_put_call_ratio():
-    """실제 KOSPI Put Call Ratio 데이터 가져오기"""
-    try:
-        # 방법 1: KRX OpenAPI 사용 (Perplexity 제안)
-        try:
-            auth_key = "365ADE7440DA44D0B6D2AD50B9DC7121F6EDEE01"  # 사용자 제공 API 키
-            api = KRXOptionAPI(auth_key)
-            
-            # 최근 30일간의 데이터 수집
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            
-            all_data = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                try:
-                    date_str = current_date.strftime('%Y%m%d')
-                    daily_data = api.get_put_call_ratio(date_str)
-                    
-                    if not daily_data.empty:
-                        # 날짜 컬럼 추가
-                        daily_data['Date'] = pd.to_datetime(current_date)
-                        all_data.append(daily_data)
-                    
-                    current_date += timedelta(days=1)
-                    
-                except Exception as daily_error:
-                    st.warning(f"{current_date.strftime('%Y-%m-%d')} 데이터 로드 실패: {daily_error}")
-                    current_date += timedelta(days=1)
-                    continue
-            
-            if all_data:
-                # 모든 데이터 합치기
-                combined_data = pd.concat(all_data, ignore_index=True)
-                
-                # Put/Call Ratio 컬럼이 있는지 확인
-                if 'PC_RATIO' in combined_data.columns:
-                    result_df = combined_data[['Date', 'PC_RATIO']].rename(columns={'PC_RATIO': 'Put_Call_Ratio'})
-                    result_df = result_df.set_index('Date')
-                    return result_df
-                elif 'PUT_CALL_RATIO' in combined_data.columns:
-                    result_df = combined_data[['Date', 'PUT_CALL_RATIO']].rename(columns={'PUT_CALL_RATIO': 'Put_Call_Ratio'})
-                    result_df = result_df.set_index('Date')
-                    return result_df
-        
-        except Exception as krx_api_error:
-            st.warning(f"KRX OpenAPI 데이터 로드 실패: {krx_api_error}")
-        
-        # 방법 2: 기존 KRX 웹 스크래핑 (대안)
-        try:
-            krx_url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
-            
-            session = requests.Session()
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Referer': 'http://data.krx.co.kr/contents/MDC/MDI/mdiLoader/index.cmd?menuId=MDC0201050403'
-            }
-            
-            # KRX 옵션 거래량 데이터 요청
-            params = {
-                'bld': 'dbms/MDC/STAT/standard/MDCSTAT01501',
-                'mktId': 'ALL',
-                'share': '1',
-                'money': '1',
-                'csvxls_isNo': 'false'
-            }
-            
-            response = session.post(krx_url, headers=headers, data=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if 'OutBlock_1' in data:
-                    records = data['OutBlock_1']
-                    df = pd.DataFrame(records)
-                    
-                    if 'TRD_DD' in df.columns and 'PC_RATIO' in df.columns:
-                        df['TRD_DD'] = pd.to_datetime(df['TRD_DD'])
-                        df = df.sort_values('TRD_DD')
-                        return df[['TRD_DD', 'PC_RATIO']].rename(columns={'TRD_DD': 'Date', 'PC_RATIO': 'Put_Call_Ratio'})
-        
-        except Exception as krx_error:
-            st.warning(f"KRX 웹 스크래핑 실패: {krx_error}")
-        
-        # 방법 3: Yahoo Finance에서 KOSPI 데이터 기반 실제적인 계산
-        try:
-            import time
-            time.sleep(1)  # 요청 간격 조정
-            kospi200 = yf.Ticker('^KS11')  # KOSPI
-            
-            # 최근 1년 데이터 가져오기
-            kospi_data = kospi200.history(period='1y')
-            
-            if not kospi_data.empty:
-                # 실제 옵션 거래량 데이터가 없는 경우, KOSPI 변동성을 기반으로 실제적인 Put Call Ratio 계산
-                kospi_returns = kospi_data['Close'].pct_change()
-                
-                # 변동성 계산 (20일 이동 표준편차)
-                volatility = kospi_returns.rolling(window=20).std()
-                
-                # 실제 Put Call Ratio 패턴 계산
-                # 변동성이 높을 때 Put Call Ratio가 높아지는 패턴
-                base_pcr = 1.0
-                volatility_factor = volatility * 15  # 변동성 영향
-                
-                # 시장 하락 시 Put Call Ratio 증가
-                market_direction = kospi_returns.rolling(window=10).mean()
-                direction_factor = np.where(market_direction < 0, 0.3, -0.1)
-                
-                # 실제적인 노이즈 추가
-                noise = np.random.randn(len(kospi_data)) * 0.05
-                
-                # 최종 Put Call Ratio 계산
-                put_call_ratio = base_pcr + volatility_factor + direction_factor + noise
-                put_call_ratio = np.clip(put_call_ratio, 0.3, 2.5)  # 범위 제한
-                
-                # 데이터프레임 생성
-                pcr_data = pd.DataFrame({
-                    'Date': kospi_data.index,
-                    'Put_Call_Ratio': put_call_ratio
-                }).set_index('Date')
-                
-                return pcr_data
-        
-        except Exception as yf_error:
-            st.warning(f"Yahoo Finance 데이터 로드 실패: {yf_error}")
-        
-        st.warning("모든 데이터 소스에서 데이터를 가져올 수 없습니다.")
-        return None
-        
-    except Exception as e:
-        st.error(f"데이터 로드 중 오류 발생: {e}")
-        return None
-
-def get_finra_margin_debt_and_sp500():
-    """FINRA margin debt와 S&P 500 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)  # 요청 간격 조정
-        # S&P 500 데이터 - 더 오래된 데이터 가져오기
-        sp500 = yf.Ticker('^GSPC')
-        sp500_data = sp500.history(period='max', interval='1d')  # 최대 기간의 daily data
-        
-        if sp500_data.empty:
-            return None
-        
-        # S&P 500 데이터를 그대로 유지 (필터링하지 않음)
-        sp500_df = pd.DataFrame({
-            'Date': sp500_data.index,
-            'S&P_500': sp500_data['Close']
-        }).set_index('Date')
-        
-        # 방법 1: FINRA 웹사이트에서 직접 스크래핑
-        try:
-            margin_debt = get_finra_margin_debt_from_website()
-            
-            if margin_debt is not None and not margin_debt.empty:
-                pass  # 성공적으로 데이터를 가져왔지만 메시지는 표시하지 않음
-            else:
-                margin_debt = None
-                
-        except Exception as website_error:
-            margin_debt = None
-        
-        # 방법 2: FRED API 사용 (대안)
-        if margin_debt is None or margin_debt.empty:
-            try:
-                # 실제 FRED API 키 사용
-                fred = Fred(api_key=FRED_API_KEY)
-                
-                # 월별 마진 부채 데이터 시도 (여러 시리즈 시도)
-                margin_series_list = [
-                    'MDTOTNS',  # FINRA Margin Debt Total
-                    'BOGZ1FL663067003Q',  # Security Brokers and Dealers
-                    'BOGZ1FL663067003A'   # 연간 데이터
-                ]
-                
-                margin_debt = None
-                for series_id in margin_series_list:
-                    try:
-                        temp_data = fred.get_series(series_id, observation_start='2019-01-01')
-                        if not temp_data.empty:
-                            # 간단한 로그로 데이터 확인
-                            print(f"FRED {series_id}: {len(temp_data)}개 데이터, 최근값: {temp_data.iloc[-1]:.0f}")
-                            print(f"FRED 데이터 샘플: {temp_data.tail()}")
-                            print(f"FRED 데이터 전체: {temp_data}")
-                            margin_debt = temp_data
-                            break
-                    except Exception as e:
-                        print(f"FRED {series_id} 실패: {e}")
-                        continue
-                
-                if margin_debt is None or margin_debt.empty:
-                    return None
-                else:
-                    pass  # 성공 메시지 제거
-                    
-            except Exception as fred_error:
-                return None
-        
-        # 데이터 정리
-        # margin_debt가 Series인 경우 DataFrame으로 변환
-        if isinstance(margin_debt, pd.Series):
-            # 분기 말로 shift (1월 1일 -> 3월 31일, 4월 1일 -> 6월 30일 등)
-            shifted_dates = []
-            for date in margin_debt.index:
-                year = date.year
-                quarter = (date.month - 1) // 3 + 1
-                if quarter == 1:
-                    new_date = pd.Timestamp(year, 3, 31)
-                elif quarter == 2:
-                    new_date = pd.Timestamp(year, 6, 30)
-                elif quarter == 3:
-                    new_date = pd.Timestamp(year, 9, 30)
-                else:  # quarter == 4
-                    new_date = pd.Timestamp(year, 12, 31)
-                shifted_dates.append(new_date)
-            
-            margin_debt_df = pd.DataFrame({
-                'Date': shifted_dates,
-                'Margin_Debt': margin_debt.values
-            }).set_index('Date')
-        else:
-            margin_debt_df = margin_debt
-        
-        # 공통 날짜로 병합 (더 안전한 방법)
-        try:
-            # 타임존 문제 해결
-            sp500_df.index = sp500_df.index.tz_localize(None)
-            margin_debt_df.index = margin_debt_df.index.tz_localize(None)
-            
-            # FRED 데이터가 올바르게 병합되는지 확인
-            print(f"S&P 500 데이터 범위: {sp500_df.index.min()} ~ {sp500_df.index.max()}")
-            print(f"Margin Debt 데이터 범위: {margin_debt_df.index.min()} ~ {margin_debt_df.index.max()}")
-            
-            # outer join으로 모든 데이터 포함
-            combined_df = sp500_df.join(margin_debt_df, how='outer')
-            
-        except Exception as merge_error:
-            print(f"데이터 병합 오류: {merge_error}")
-            return None
-        
-        if combined_df.empty:
-            return None
-        
-        return combined_df
-        
-    except Exception as e:
-        return None
+# 오래된 저장 데이터는 바로 표시하고 백그라운드에서 갱신 (stale-while-revalidate)
+# 페이지 맨 위에 데이터 기준 시점 안내 자리를 잡아 두고, 갱신이 끝나면 페이지를 다시 그림
+stale_state = begin_stale_serving()
+stale_notice = st.empty()
 
-def create_simulated_margin_debt(date_index):
-    """실제 FRED 데이터 패턴을 정확히 반영한 margin debt 시뮬레이션"""
-    # 실제 FRED 데이터 패턴 기반 (BOGZ1FL663067003Q)
-    margin_pattern = []
-    
-    for date in date_index:
-        year = date.year
-        quarter = (date.month - 1) // 3 + 1
-        
-        # 실제 FRED 데이터 값들
-        if year == 2019:
-            if quarter == 1:
-                value = 268079
-            elif quarter == 2:
-                value = 277823
-            elif quarter == 3:
-                value = 280339
-            else:  # Q4
-                value = 286260
-        elif year == 2020:
-            if quarter == 1:
-                value = 300621
-            elif quarter == 2:
-                value = 280000  # 실제 데이터
-            elif quarter == 3:
-                value = 320000
-            else:  # Q4
-                value = 350000
-        elif year == 2021:
-            if quarter == 1:
-                value = 380000
-            elif quarter == 2:
-                value = 420000
-            elif quarter == 3:
-                value = 450000
-            else:  # Q4
-                value = 480000
-        elif year == 2022:
-            if quarter == 1:
-                value = 519187  # 실제 피크
-            elif quarter == 2:
-                value = 500000
-            elif quarter == 3:
-                value = 480000
-            else:  # Q4
-                value = 460000
-        elif year == 2023:
-            if quarter == 1:
-                value = 360000  # 실제 급락
-            elif quarter == 2:
-                value = 380000
-            elif quarter == 3:
-                value = 400000
-            else:  # Q4
-                value = 420000
-        elif year == 2024:
-            if quarter == 1:
-                value = 440000
-            elif quarter == 2:
-                value = 460000
-            elif quarter == 3:
-                value = 480000
-            else:  # Q4
-                value = 490000
-        elif year == 2025:
-            if quarter == 1:
-                value = 477231  # 실제 최신 데이터
-            else:
-                value = 477231 + (quarter - 1) * 5000
-        else:
-            # 미래 데이터는 선형 추정
-            value = 477231 + (year - 2025) * 10000 + (quarter - 1) * 5000
-        
-        margin_pattern.append(value)
-    
-    # 노이즈 추가 (실제 데이터의 변동성 반영)
-    noise = np.random.randn(len(date_index)) * 2000
-    margin_debt = np.array(margin_pattern) + noise
-    
-    # 최소값 보장
-    margin_debt = np.maximum(margin_debt, 250000)
-    
-    return pd.Series(margin_debt, index=date_index)
-
-def plot_margin_debt_vs_sp500(data):
-    """FINRA margin debt와 S&P 500 비교 그래프"""
-    if data is None or data.empty:
-        st.error("데이터가 없습니다.")
-        return
-    
-    # 날짜 선택
-    col1, col2 = st.columns(2)
-    with col1:
-        # 5년 전 날짜 계산
-        five_years_ago = pd.Timestamp.now() - pd.DateOffset(years=5)
-        start_date = st.date_input(
-            "시작 날짜",
-            value=five_years_ago.date(),
-            min_value=data.index.min().to_pydatetime().date(),
-            max_value=data.index.max().to_pydatetime().date(),
-            key="margin_start"
-        )
-    with col2:
-        end_date = st.date_input(
-            "종료 날짜",
-            value=pd.Timestamp.now().date(),  # 오늘 날짜로 설정
-            min_value=data.index.min().to_pydatetime().date(),
-            max_value=pd.Timestamp.now().date(),  # 오늘 날짜까지
-            key="margin_end"
-        )
-    
-    # 기간 선택
-    period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-    selected_period = st.selectbox("분석 기간", period_options, index=5, key="margin_period")
-    
-    # 선택된 날짜 범위로 필터링
-    start_datetime = pd.to_datetime(start_date)
-    end_datetime = pd.to_datetime(end_date)
-    
-    # 타임존 문제 해결: 모든 날짜를 타임존 무시로 통일
-    try:
-        # 데이터 인덱스를 타임존 무시로 변환
-        data_no_tz = data.copy()
-        if data_no_tz.index.tz is not None:
-            data_no_tz.index = data_no_tz.index.tz_localize(None)
-        
-        # 시작/끝 날짜도 타임존 무시로 변환
-        start_datetime_no_tz = start_datetime.tz_localize(None) if start_datetime.tz is not None else start_datetime
-        end_datetime_no_tz = end_datetime.tz_localize(None) if end_datetime.tz is not None else end_datetime
-        
-        # 데이터 필터링 전 확인
-        filtered_data = data_no_tz[(data_no_tz.index >= start_datetime_no_tz) & (data_no_tz.index <= end_datetime_no_tz)]
-        
-    except Exception as e:
-        # 타임존 변환 실패 시 원본 데이터 사용
-        st.warning(f"날짜 필터링 중 오류 발생: {e}")
-        filtered_data = data
-    
-    if filtered_data.empty:
-        st.warning("선택한 날짜 범위에 데이터가 없습니다.")
-        return
-    
-    # 하나의 그래프에 S&P 500과 Margin Debt 통합
-    fig = go.Figure()
-    
-    # S&P 500 그래프 (왼쪽 Y축) - 모든 daily 데이터 표시
-    fig.add_trace(
-        go.Scatter(
-            x=filtered_data.index,
-            y=filtered_data['S&P_500'],
-            name='S&P 500',
-            line=dict(color='#1f77b4', width=1.5),  # 실선으로 표시
-            yaxis='y',
-            mode='lines',  # 모든 daily 데이터를 선으로 연결
-            connectgaps=False,  # 빈 데이터는 연결하지 않음
-            hovertemplate='<b>%{x}</b><br>S&P 500: %{y:.2f}<extra></extra>'  # 호버 정보 개선
-        )
-    )
-    
-    # Margin Debt 그래프 (오른쪽 Y축) - 분기별 데이터를 선으로 연결
-    # NaN 값 제거하되, 2025년 Q1 데이터는 포함
-    margin_debt_data = filtered_data[filtered_data['Margin_Debt'].notna()]
-    
-    if not margin_debt_data.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=margin_debt_data.index,
-                y=margin_debt_data['Margin_Debt'],
-                name='Margin Debt',
-                line=dict(color='#ff7f0e', width=2),
-                yaxis='y2',
-                mode='lines+markers',  # 선과 점 모두 표시
-                marker=dict(size=6)  # 분기별 데이터 포인트를 점으로 표시
-            )
-        )
-    
-    # 레이아웃 설정
-    fig.update_layout(
-        title='S&P 500 vs FINRA Margin Debt',
-        height=600,
-        showlegend=True,
-        hovermode='x unified',
-        yaxis=dict(
-            title="S&P 500",
-            side="left",
-            color="#1f77b4",
-            range=[2000, 6500]  # Y축 범위를 더 낮게 조정하여 2021년 이전 데이터도 표시
-        ),
-        yaxis2=dict(
-            title="Margin Debt (Millions $)",
-            side="right",
-            color="#ff7f0e",
-            overlaying="y"
-        ),
-        xaxis=dict(title="Date")
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # 통계 정보
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        current_sp500 = filtered_data['S&P_500'].iloc[-1]
-        prev_sp500 = filtered_data['S&P_500'].iloc[-2] if len(filtered_data) > 1 else current_sp500
-        sp500_change = ((current_sp500 - prev_sp500) / prev_sp500) * 100
-        st.metric(
-            "현재 S&P 500",
-            f"${current_sp500:,.2f}",
-            f"{sp500_change:+.2f}%"
-        )
-    
-    with col2:
-        current_margin = filtered_data['Margin_Debt'].iloc[-1]
-        prev_margin = filtered_data['Margin_Debt'].iloc[-2] if len(filtered_data) > 1 else current_margin
-        margin_change = ((current_margin - prev_margin) / prev_margin) * 100
-        st.metric(
-            "현재 Margin Debt",
-            f"${current_margin:,.0f}M",
-            f"{margin_change:+.2f}%"
-        )
-    
-    with col3:
-        # 전체 기간 수익률
-        total_sp500_return = ((filtered_data['S&P_500'].iloc[-1] / filtered_data['S&P_500'].iloc[0]) - 1) * 100
-        total_margin_change = ((filtered_data['Margin_Debt'].iloc[-1] / filtered_data['Margin_Debt'].iloc[0]) - 1) * 100
-        st.metric(
-            "전체 기간 변화",
-            f"S&P: {total_sp500_return:+.1f}%",
-            f"Margin: {total_margin_change:+.1f}%"
-        )
-
-def get_finra_margin_debt_from_website():
-    """FINRA.org에서 직접 margin debt 데이터 스크래핑 (Perplexity 제안)"""
-    try:
-        # FINRA margin statistics 페이지
-        url = "https://www.finra.org/investors/learn-to-invest/advanced-investing/margin-statistics"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # FINRA 데이터 테이블 찾기
-            tables = soup.find_all('table')
-            
-            margin_data = []
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        try:
-                            # 날짜와 마진 부채 데이터 추출
-                            date_text = cells[0].get_text(strip=True)
-                            margin_text = cells[1].get_text(strip=True)
-                            
-                            # 날짜 파싱
-                            if date_text and margin_text:
-                                # 다양한 날짜 형식 처리
-                                if '/' in date_text:
-                                    date_parts = date_text.split('/')
-                                    if len(date_parts) == 2:
-                                        month, year = date_parts
-                                        date_str = f"{year}-{month.zfill(2)}-01"
-                                    elif len(date_parts) == 3:
-                                        month, day, year = date_parts
-                                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                                else:
-                                    # 다른 날짜 형식 처리
-                                    date_str = date_text
-                                
-                                # 마진 부채 값 파싱 (숫자만 추출)
-                                margin_value = ''.join(filter(str.isdigit, margin_text.replace(',', '')))
-                                
-                                if margin_value:
-                                    margin_data.append({
-                                        'Date': pd.to_datetime(date_str),
-                                        'Margin_Debt': float(margin_value)
-                                    })
-                        except Exception as e:
-                            continue
-            
-            if margin_data:
-                df = pd.DataFrame(margin_data)
-                df = df.sort_values('Date')
-                df = df.set_index('Date')
-                return df
-        
-        return None
-        
-    except Exception as e:
-        return None
-
-def get_high_yield_spread(start_date=None, end_date=None):
-    """미국 하이일드 채권의 신용부도스와프 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # 날짜 설정
-        if start_date is None:
-            start_date = '2019-01-01'
-        if end_date is None:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        
-        # FRED API를 사용하여 ICE BofA US High Yield Index Option-Adjusted Spread 가져오기
-        fred = Fred(api_key=FRED_API_KEY)
-        
-        try:
-            # ICE BofA US High Yield Index Option-Adjusted Spread
-            data = fred.get_series('BAMLH0A0HYM2', observation_start=start_date, observation_end=end_date)
-            if not data.empty:
-                return data
-        except Exception as fred_error:
-            st.warning(f"FRED BAMLH0A0HYM2 실패: {fred_error}")
-        
-        # FRED 실패 시 기존 방법들 시도
-        try:
-            # 방법 1: Baa yield - Treasury yield
-            baa_data = fred.get_series('BAA10Y', observation_start=start_date, observation_end=end_date)
-            treasury_data = fred.get_series('DGS10', observation_start=start_date, observation_end=end_date)
-            
-            if not baa_data.empty and not treasury_data.empty:
-                # 공통 날짜에 대해서만 계산
-                common_dates = baa_data.index.intersection(treasury_data.index)
-                if len(common_dates) > 0:
-                    spread = baa_data.loc[common_dates] - treasury_data.loc[common_dates]
-                    return spread
-        except Exception as spread_error:
-            st.warning(f"신용 스프레드 계산 실패: {spread_error}")
-        
-        # 방법 2: ETF 기반 계산
-        try:
-            hyg = yf.Ticker('HYG')
-            tlt = yf.Ticker('TLT')
-            
-            # 날짜 범위에 따른 기간 설정
-            if start_date and end_date:
-                start_dt = pd.to_datetime(start_date)
-                end_dt = pd.to_datetime(end_date)
-                days_diff = (end_dt - start_dt).days
-                period = f"{days_diff}d" if days_diff > 0 else "2y"
-            else:
-                period = "2y"
-            
-            hyg_data = hyg.history(period=period)
-            tlt_data = tlt.history(period=period)
-            
-            if not hyg_data.empty and not tlt_data.empty:
-                # 날짜 필터 적용
-                if start_date and end_date:
-                    hyg_data = hyg_data[start_date:end_date]
-                    tlt_data = tlt_data[start_date:end_date]
-                
-                # 공통 날짜에 대해서만 계산
-                common_dates = hyg_data.index.intersection(tlt_data.index)
-                if len(common_dates) > 0:
-                    hyg_prices = hyg_data.loc[common_dates, 'Close']
-                    tlt_prices = tlt_data.loc[common_dates, 'Close']
-                    
-                    # 가격 비율의 변화율을 스프레드로 사용
-                    spread = (hyg_prices / tlt_prices).pct_change() * 10000
-                    return spread
-        except Exception as etf_error:
-            st.warning(f"ETF 기반 계산 실패: {etf_error}")
-        
-        # 방법 3: 다른 High Yield ETF들 시도
-        try:
-            hy_etfs = ['JNK', 'HYG', 'HYEM']
-            for etf in hy_etfs:
-                try:
-                    hy_etf = yf.Ticker(etf)
-                    hy_data = hy_etf.history(period=period)
-                    
-                    if not hy_data.empty:
-                        # 날짜 필터 적용
-                        if start_date and end_date:
-                            hy_data = hy_data[start_date:end_date]
-                        
-                        # 거래일이 없는 날짜 제거
-                        hy_data = hy_data.dropna()
-                        hy_data = hy_data[hy_data.index.dayofweek < 5]
-                        
-                        if 'Volume' in hy_data.columns:
-                            hy_data = hy_data[hy_data['Volume'] > 0]
-                        
-                        if not hy_data.empty:
-                            # 단순히 ETF 가격 변화율을 스프레드로 사용
-                            spread = hy_data['Close'].pct_change() * 10000
-                            return spread
-                except:
-                    continue
-                    
-        except Exception as alt_error:
-            st.warning(f"대안 ETF 계산 실패: {alt_error}")
-        
-        return None
-        
-    except Exception as e:
-        st.error(f"High Yield CDS 데이터 로드 중 오류: {e}")
-        return None
-
-def get_sp500_forward_pe(start_date=None, end_date=None):
-    """S&P 500 Forward EPS 데이터 가져오기 (실제 기업 이익 기반)"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # 날짜 설정
-        if start_date is None:
-            start_date = '2019-01-01'
-        if end_date is None:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        
-        # FRED API를 사용하여 실제 기업 이익 데이터 가져오기
-        try:
-            fred = Fred(api_key=FRED_API_KEY)
-            
-            # 기업 이익 시리즈들
-            profit_series = [
-                'CPROFIT',  # Corporate Profits After Tax
-                'CPROFIT_W',  # Corporate Profits After Tax (without IVA and CCAdj)
-            ]
-            
-            for series_id in profit_series:
-                try:
-                    profit_data = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
-                    if not profit_data.empty:
-                        # 기업 이익을 S&P 500 EPS로 변환 (단순화된 계산)
-                        # 실제로는 더 복잡한 계산이 필요하지만 여기서는 단순화
-                        eps_data = profit_data / 1000  # 단순화된 변환
-                        return eps_data
-                except:
-                    continue
-                    
-        except Exception as fred_error:
-            st.warning(f"FRED 기업 이익 데이터 로드 실패: {fred_error}")
-        
-        # FRED 실패 시 S&P 500 가격 기반 EPS 시뮬레이션
-        try:
-            sp500 = yf.Ticker('^GSPC')
-            
-            # 날짜 범위에 따른 기간 설정
-            if start_date and end_date:
-                start_dt = pd.to_datetime(start_date)
-                end_dt = pd.to_datetime(end_date)
-                days_diff = (end_dt - start_dt).days
-                period = f"{days_diff}d" if days_diff > 0 else "2y"
-            else:
-                period = "2y"
-            
-            sp500_data = sp500.history(period=period)
-            
-            if not sp500_data.empty:
-                # 날짜 필터 적용
-                if start_date and end_date:
-                    sp500_data = sp500_data[start_date:end_date]
-                
-                # 거래일이 없는 날짜 제거 (NaN 값 제거)
-                sp500_data = sp500_data.dropna()
-                
-                # 주말 제거 (토요일=5, 일요일=6)
-                sp500_data = sp500_data[sp500_data.index.dayofweek < 5]
-                
-                # 거래량이 0인 날짜도 제거
-                if 'Volume' in sp500_data.columns:
-                    sp500_data = sp500_data[sp500_data['Volume'] > 0]
-                
-                # 추가 필터링: 거래가 없는 날짜 완전 제거
-                # 거래량이 매우 낮은 날짜도 제거 (거래량이 평균의 10% 미만인 날)
-                if 'Volume' in sp500_data.columns and len(sp500_data) > 0:
-                    avg_volume = sp500_data['Volume'].mean()
-                    sp500_data = sp500_data[sp500_data['Volume'] >= avg_volume * 0.1]
-                
-                # 가격 변화가 없는 날짜 제거 (시가=종가=고가=저가)
-                if len(sp500_data) > 0:
-                    sp500_data = sp500_data[
-                        ~((sp500_data['Open'] == sp500_data['Close']) & 
-                          (sp500_data['Open'] == sp500_data['High']) & 
-                          (sp500_data['Open'] == sp500_data['Low']))
-                    ]
-                
-                dates = sp500_data.index
-                base_eps = 150.0  # S&P 500 평균 EPS (실제로는 변동)
-                volatility = 0.15
-                
-                # 시장 상황에 따른 EPS 변화 시뮬레이션
-                market_conditions = np.random.randn(len(dates)) * volatility
-                forward_eps = base_eps + market_conditions.cumsum() * 2
-                
-                # 범위 제한 (실제 S&P 500 EPS 범위)
-                forward_eps = np.clip(forward_eps, 100, 200)
-                
-                eps_data = pd.Series(forward_eps, index=dates)
-                
-                return eps_data
-                
-        except Exception as e:
-            st.warning(f"S&P 500 기반 EPS 시뮬레이션 실패: {e}")
-        
-        return None
-        
-    except Exception as e:
-        st.error(f"Forward EPS 데이터 로드 중 오류: {e}")
-        return None
-
-def get_breakeven_inflation(start_date=None, end_date=None):
-    """미국 10년물 국채 기대인플레이션 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # 날짜 설정
-        if start_date is None:
-            start_date = '2019-01-01'
-        if end_date is None:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        
-        # FRED API를 사용하여 기대인플레이션 데이터 가져오기
-        fred = Fred(api_key=FRED_API_KEY)
-        
-        # 기대인플레이션 시리즈들
-        inflation_series = [
-            'T10YIE',  # 10-Year Breakeven Inflation Rate
-            'T5YIE',   # 5-Year Breakeven Inflation Rate
-            'T10YIEM', # 10-Year Inflation Expectations
-        ]
-        
-        for series_id in inflation_series:
-            try:
-                data = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
-                if not data.empty:
-                    return data
-            except:
-                continue
-        
-        # FRED 실패 시 시뮬레이션
-        if start_date and end_date:
-            dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        else:
-            dates = pd.date_range(start='2019-01-01', end=datetime.now(), freq='D')
-        
-        base_inflation = 2.0
-        volatility = 0.5
-        
-        # 인플레이션 기대치 시뮬레이션
-        inflation_expectations = base_inflation + np.random.randn(len(dates)) * volatility * 0.1
-        inflation_expectations = np.clip(inflation_expectations, 1.0, 4.0)
-        
-        inflation_data = pd.Series(inflation_expectations, index=dates)
-        
-        return inflation_data
-        
-    except Exception as e:
-        st.error(f"기대인플레이션 데이터 로드 중 오류: {e}")
-        return None
-
-def get_sp500_data(start_date=None, end_date=None):
-    """S&P 500 지수 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # S&P 500 데이터
-        sp500 = yf.Ticker('^GSPC')
-        
-        # selected_period 사용 (전역 변수로 전달받아야 함)
-        # 임시로 MAX 사용
-        sp500_data = sp500.history(period='max')
-        
-        if sp500_data.empty:
-            return None
-        
-        # 날짜 필터 적용
-        if start_date and end_date:
-            sp500_data = sp500_data[start_date:end_date]
-        
-        # 거래일이 없는 날짜 제거 (NaN 값 제거)
-        sp500_data = sp500_data.dropna()
-        
-        # 주말 제거 (토요일=5, 일요일=6)
-        sp500_data = sp500_data[sp500_data.index.dayofweek < 5]
-        
-        # 거래량이 0인 날짜도 제거
-        if 'Volume' in sp500_data.columns:
-            sp500_data = sp500_data[sp500_data['Volume'] > 0]
-        
-        # 추가 필터링: 거래가 없는 날짜 완전 제거
-        # 거래량이 매우 낮은 날짜도 제거 (거래량이 평균의 10% 미만인 날)
-        if 'Volume' in sp500_data.columns and len(sp500_data) > 0:
-            avg_volume = sp500_data['Volume'].mean()
-            sp500_data = sp500_data[sp500_data['Volume'] >= avg_volume * 0.1]
-        
-        # 가격 변화가 없는 날짜 제거 (시가=종가=고가=저가)
-        if len(sp500_data) > 0:
-            sp500_data = sp500_data[
-                ~((sp500_data['Open'] == sp500_data['Close']) & 
-                  (sp500_data['Open'] == sp500_data['High']) & 
-                  (sp500_data['Open'] == sp500_data['Low']))
-            ]
-        
-        return sp500_data
-        
-    except Exception as e:
-        st.error(f"S&P 500 데이터 로드 중 오류: {e}")
-        return None
-
-def get_aud_usd_candlestick_data(start_date=None, end_date=None):
-    """호주달러/미국달러 환율 봉차트 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # AUD/USD 환율 데이터
-        aud_usd = yf.Ticker('AUDUSD=X')
-        
-        # 날짜 범위에 따른 기간 설정
-        if start_date and end_date:
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            days_diff = (end_dt - start_dt).days
-            period = f"{days_diff}d" if days_diff > 0 else "1y"
-        else:
-            period = "1y"
-        
-        aud_data = aud_usd.history(period=period)
-        
-        if aud_data.empty:
-            st.warning("AUD/USD 데이터가 비어있습니다.")
-            return None
-        
-        # 날짜 필터 적용
-        if start_date and end_date:
-            aud_data = aud_data[start_date:end_date]
-        
-        # 거래일이 없는 날짜 제거 (NaN 값 제거)
-        aud_data = aud_data.dropna()
-        
-        # 주말 제거 (토요일=5, 일요일=6)
-        aud_data = aud_data[aud_data.index.dayofweek < 5]
-        
-        # 환율 데이터는 거래량 필터 제거 (forex는 거래량이 다르게 처리됨)
-        # if 'Volume' in aud_data.columns:
-        #     aud_data = aud_data[aud_data['Volume'] > 0]
-        
-        # 추가 필터링: 거래가 없는 날짜 완전 제거
-        # 가격 변화가 없는 날짜 제거 (시가=종가=고가=저가)
-        if len(aud_data) > 0:
-            aud_data = aud_data[
-                ~((aud_data['Open'] == aud_data['Close']) & 
-                  (aud_data['Open'] == aud_data['High']) & 
-                  (aud_data['Open'] == aud_data['Low']))
-            ]
-        
-        # 데이터가 비어있는지 다시 확인
-        if aud_data.empty:
-            st.warning("필터링 후 AUD/USD 데이터가 비어있습니다.")
-            return None
-        
-        return aud_data
-        
-    except Exception as e:
-        st.error(f"AUD/USD 봉차트 데이터 로드 중 오류: {e}")
-        return None
-
-def get_aud_usd_volatility_data(start_date=None, end_date=None):
-    """호주달러/미국달러 3개월 변동성 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # AUD/USD 환율 데이터
-        aud_usd = yf.Ticker('AUDUSD=X')
-        
-        # 날짜 범위에 따른 기간 설정
-        if start_date and end_date:
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            days_diff = (end_dt - start_dt).days
-            period = f"{days_diff}d" if days_diff > 0 else "1y"
-        else:
-            period = "1y"
-        
-        aud_data = aud_usd.history(period=period)
-        
-        if aud_data.empty:
-            return None
-        
-        # 날짜 필터 적용
-        if start_date and end_date:
-            aud_data = aud_data[start_date:end_date]
-        
-        # 거래일이 없는 날짜 제거 (NaN 값 제거)
-        aud_data = aud_data.dropna()
-        
-        # 주말 제거 (토요일=5, 일요일=6)
-        aud_data = aud_data[aud_data.index.dayofweek < 5]
-        
-        # 환율 데이터는 거래량 필터 제거 (forex는 거래량이 다르게 처리됨)
-        # if 'Volume' in aud_data.columns:
-        #     aud_data = aud_data[aud_data['Volume'] > 0]
-        
-        # 추가 필터링: 거래가 없는 날짜 완전 제거
-        # 가격 변화가 없는 날짜 제거 (시가=종가=고가=저가)
-        if len(aud_data) > 0:
-            aud_data = aud_data[
-                ~((aud_data['Open'] == aud_data['Close']) & 
-                  (aud_data['Open'] == aud_data['High']) & 
-                  (aud_data['Open'] == aud_data['Low']))
-            ]
-        
-        # 3개월 변동성 계산 (60일 이동 표준편차)
-        returns = aud_data['Close'].pct_change()
-        
-        # 3개월 = 약 63 거래일 (21 거래일/월 * 3개월)
-        # 더 정확한 3개월 변동성 계산
-        volatility = returns.rolling(window=63).std() * np.sqrt(252) * 100  # 연율화
-        
-        # NaN 값 제거
-        volatility = volatility.dropna()
-        
-        # 변동성 계산 결과 검증
-        if len(volatility) > 0:
-            # 극단적인 값 필터링 (0.1% 미만 또는 50% 초과)
-            volatility = volatility[(volatility >= 0.1) & (volatility <= 50)]
-            
-            # 최근 데이터의 변동성이 급격히 감소하는 경우 경고
-            if len(volatility) > 10:
-                recent_vol = volatility.tail(10).mean()
-                prev_vol = volatility.tail(20).head(10).mean()
-                if recent_vol < prev_vol * 0.5:  # 50% 이상 감소
-                    st.warning(f"최근 변동성이 급격히 감소했습니다. 이전: {prev_vol:.2f}%, 현재: {recent_vol:.2f}%")
-        
-        return volatility
-        
-    except Exception as e:
-        st.error(f"AUD/USD 변동성 데이터 로드 중 오류: {e}")
-        return None
-
-def get_aud_usd_data(start_date=None, end_date=None):
-    """호주달러/미국달러 환율 및 변동성 데이터 가져오기"""
-    try:
-        import time
-        time.sleep(1)
-        
-        # AUD/USD 환율 데이터
-        aud_usd = yf.Ticker('AUDUSD=X')
-        
-        # 날짜 범위에 따른 기간 설정
-        if start_date and end_date:
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            days_diff = (end_dt - start_dt).days
-            period = f"{days_diff}d" if days_diff > 0 else "1y"
-        else:
-            period = "1y"
-        
-        aud_data = aud_usd.history(period=period)
-        
-        if aud_data.empty:
-            return None, None
-        
-        # 날짜 필터 적용
-        if start_date and end_date:
-            aud_data = aud_data[start_date:end_date]
-        
-        # 환율 데이터
-        exchange_rate = aud_data['Close']
-        
-        # 3개월 변동성 계산 (60일 이동 표준편차)
-        returns = aud_data['Close'].pct_change()
-        volatility = returns.rolling(window=60).std() * np.sqrt(252) * 100  # 연율화
-        
-        return exchange_rate, volatility
-        
-    except Exception as e:
-        st.error(f"AUD/USD 데이터 로드 중 오류: {e}")
-        return None, None
-
-# Market Sentiment 페이지
-if st.session_state.current_page == 'market_sentiment':
-    st.title("Market Sentiment")
-    
-    # 날짜 선택 (맨 위로 이동)
-    st.subheader("날짜 범위 설정")
-    
-    col_date1, col_date2, col_date3 = st.columns(3)
-    with col_date1:
-        start_date = st.date_input(
-            "시작 날짜",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            key="sentiment_start"
-        )
-    with col_date2:
-        end_date = st.date_input(
-            "종료 날짜",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            key="sentiment_end"
-        )
-    with col_date3:
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        selected_period = st.selectbox("분석 기간", period_options, index=5, key="sentiment_period")
-    
-    # 분석기간에 따른 날짜 계산 (사용자가 직접 입력한 날짜 우선)
-    if selected_period != '1Y':  # 기본값이 아닌 경우에만 계산
-        end_date = datetime.now()
-        if selected_period == '1D':
-            start_date = end_date - timedelta(days=1)
-        elif selected_period == '5D':
-            start_date = end_date - timedelta(days=5)
-        elif selected_period == '1MO':
-            start_date = end_date - timedelta(days=30)
-        elif selected_period == '3MO':
-            start_date = end_date - timedelta(days=90)
-        elif selected_period == '6MO':
-            start_date = end_date - timedelta(days=180)
-        elif selected_period == '2Y':
-            start_date = end_date - timedelta(days=730)
-        elif selected_period == '5Y':
-            start_date = end_date - timedelta(days=1825)
-        elif selected_period == '10Y':
-            start_date = end_date - timedelta(days=3650)
-        elif selected_period == 'YTD':
-            start_date = datetime(end_date.year, 1, 1)
-        elif selected_period == 'MAX':
-            start_date = datetime(2019, 1, 1)  # 최대 2019년부터
-    
-    # 날짜를 문자열로 변환
-    start_date_str = start_date.strftime('%Y-%m-%d')
-    end_date_str = end_date.strftime('%Y-%m-%d')
-    
-    st.markdown("---")
-    
-    # 2x2 그리드로 그래프 배치
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # High Yield CDS Spread
-        with st.spinner("High Yield CDS 데이터를 불러오는 중..."):
-            high_yield_data = get_high_yield_spread(start_date_str, end_date_str)
-        
-        if high_yield_data is not None and not high_yield_data.empty:
-            fig1 = go.Figure()
-            fig1.add_trace(go.Scatter(
-                x=high_yield_data.index,
-                y=high_yield_data.values,
-                mode='lines',
-                name='High Yield CDS Spread',
-                line=dict(color='red', width=2)
-            ))
-            
-            fig1.update_layout(
-                title="High Yield CDS Spread",
-                xaxis_title="Date",
-                yaxis_title="CDS Spread (bps)",
-                height=400,  # 높이 증가
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=10),
-                margin=dict(t=30, b=30, l=30, r=30),
-                legend=dict(
-                    x=0.02,
-                    y=0.98,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='black',
-                    borderwidth=1
-                ),
-                xaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                )
-            )
-            st.plotly_chart(fig1, use_container_width=True)
-            
-            # 현재 값 표시
-            current_spread = high_yield_data.iloc[-1]
-            st.metric("Current Spread", f"{current_spread:.2f} bps")
-        else:
-            st.warning("High Yield CDS 데이터를 불러올 수 없습니다.")
-    
-    with col2:
-        # S&P 500 Index
-        with st.spinner("S&P 500 데이터를 불러오는 중..."):
-            sp500_data = get_sp500_data(start_date_str, end_date_str)
-        
-        if sp500_data is not None and not sp500_data.empty:
-            fig2 = go.Figure()
-            fig2.add_trace(go.Candlestick(
-                x=sp500_data.index,
-                open=sp500_data['Open'],
-                high=sp500_data['High'],
-                low=sp500_data['Low'],
-                close=sp500_data['Close'],
-                name='S&P 500',
-                increasing_line_color='red',
-                decreasing_line_color='green'
-            ))
-            
-            fig2.update_layout(
-                title="S&P 500 Index",
-                xaxis_title="Date",
-                yaxis_title="Price ($)",
-                height=400,  # 높이 감소
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=10),
-                margin=dict(t=30, b=30, l=30, r=30),
-                legend=dict(
-                    x=0.02,
-                    y=0.98,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='black',
-                    borderwidth=1
-                ),
-                xaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                )
-            )
-            st.plotly_chart(fig2, use_container_width=True)
-            
-            # 현재 값 표시
-            current_price = sp500_data['Close'].iloc[-1]
-            st.metric("Current Price", f"${current_price:.2f}")
-        else:
-            st.warning("S&P 500 데이터를 불러올 수 없습니다.")
-    
-    # 상하 간격 추가
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        # 10년물 국채 기대인플레이션
-        with st.spinner("기대인플레이션 데이터를 불러오는 중..."):
-            inflation_data = get_breakeven_inflation(start_date_str, end_date_str)
-        
-        if inflation_data is not None and not inflation_data.empty:
-            fig3 = go.Figure()
-            fig3.add_trace(go.Scatter(
-                x=inflation_data.index,
-                y=inflation_data.values,
-                name='Breakeven Inflation',
-                line=dict(color='orange', width=2)
-            ))
-            fig3.add_hline(y=2.0, line_dash="dash", line_color="green",
-                          annotation_text="Fed Target (2%)")
-            fig3.update_layout(
-                title="10-Year Breakeven Inflation",
-                xaxis_title="Date",
-                yaxis_title="Inflation Rate (%)",
-                height=400,  # 높이 증가
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=10),
-                margin=dict(t=30, b=30, l=30, r=30),
-                legend=dict(
-                    x=0.02,
-                    y=0.98,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='black',
-                    borderwidth=1
-                ),
-                xaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                )
-            )
-            st.plotly_chart(fig3, use_container_width=True)
-            current_inflation = inflation_data.iloc[-1]
-            st.metric("Current Inflation", f"{current_inflation:.2f}%")
-        else:
-            st.warning("기대인플레이션 데이터를 불러올 수 없습니다.")
-    
-    with col4:
-        # AUD/USD 환율 봉차트 및 변동성
-        with st.spinner("AUD/USD 데이터를 불러오는 중..."):
-            aud_usd_data = get_aud_usd_candlestick_data(start_date_str, end_date_str)
-            volatility_data = get_aud_usd_volatility_data(start_date_str, end_date_str)
-        
-        if aud_usd_data is not None and not aud_usd_data.empty:
-            # 환율 봉차트와 변동성을 같은 그래프에 표시
-            fig4 = go.Figure()
-            
-            # 환율 봉차트 (왼쪽 Y축)
-            fig4.add_trace(go.Candlestick(
-                x=aud_usd_data.index,
-                open=aud_usd_data['Open'],
-                high=aud_usd_data['High'],
-                low=aud_usd_data['Low'],
-                close=aud_usd_data['Close'],
-                name='AUD/USD',
-                increasing_line_color='red',
-                decreasing_line_color='green',
-                yaxis='y'
-            ))
-            
-            # 변동성 (오른쪽 Y축)
-            if volatility_data is not None and not volatility_data.empty:
-                fig4.add_trace(go.Scatter(
-                    x=volatility_data.index,
-                    y=volatility_data.values,
-                    name='3-Month Volatility',
-                    line=dict(color='purple', width=2),
-                    yaxis='y2'
-                ))
-            
-            fig4.update_layout(
-                title="AUD/USD Exchange Rate & Volatility",
-                xaxis_title="Date",
-                yaxis=dict(
-                    title="Exchange Rate (AUD/USD)",
-                    side='left',
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                ),
-                yaxis2=dict(
-                    title="Volatility (%)",
-                    side='right',
-                    overlaying='y',
-                    showgrid=False,
-                    showline=True,
-                    linewidth=1,
-                    linecolor='purple',
-                    mirror=True
-                ),
-                height=400,  # 높이 감소
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial"),
-                margin=dict(t=30, b=30, l=30, r=30),
-                legend=dict(
-                    x=0.02,
-                    y=0.98,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='black',
-                    borderwidth=1
-                ),
-                xaxis=dict(
-                    showgrid=True,
-                    gridwidth=0.5,
-                    gridcolor='lightgray',
-                    showline=True,
-                    linewidth=1,
-                    linecolor='black',
-                    mirror=True
-                )
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-            
-            # 현재 값들 표시
-            col_metric1, col_metric2 = st.columns(2)
-            with col_metric1:
-                current_rate = aud_usd_data['Close'].iloc[-1]
-                st.metric("Current Rate", f"{current_rate:.4f}")
-            with col_metric2:
-                if volatility_data is not None and not volatility_data.empty:
-                    current_volatility = volatility_data.iloc[-1]
-                    st.metric("Current Volatility", f"{current_volatility:.2f}%")
-                else:
-                    st.metric("Current Volatility", "N/A")
-        else:
-            st.warning("AUD/USD 데이터를 불러올 수 없습니다.")
 
+def format_age(seconds):
+    """경과 시간을 '3분', '2시간', '1일' 형식으로 표시"""
+    if seconds < 3600:
+        return f"{max(1, int(seconds // 60))}분"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}시간"
+    return f"{int(seconds // 86400)}일"
 
 
 # 사이드바 네비게이션 - Simple & 세련된 디자인
@@ -1832,2427 +101,36 @@ with st.sidebar.container():
         st.rerun()
 
 
-# FINRA Margin Debt vs S&P 500
-if st.session_state.current_page == 'finra_margin_debt':
-    st.title("FINRA Margin Debt vs S&P 500")
-    st.markdown("""
-    FINRA(미국 금융산업규제국)에서 발표하는 마진 부채(Margin Debt)와 S&P 500 지수의 관계를 시각화합니다. 
-    마진 부채는 투자자들이 빚을 내서 주식을 얼마나 사고 있는지 보여주는 지표로, 시장 과열/과매도 신호로 해석될 수 있습니다.
-    """)
-    
-    with st.spinner("데이터를 불러오는 중..."):
-        data = get_finra_margin_debt_and_sp500()
-    plot_margin_debt_vs_sp500(data)
-
-# 메인 페이지
-if st.session_state.current_page == 'main':
-    # 그래프 내용만 표시 (모든 설명과 버튼 삭제)
-    pass
-
-# Market Analysis 페이지
-elif st.session_state.current_page == 'market_analysis':
-    # 그래프 내용만 표시 (모든 설명과 버튼 삭제)
-    pass
-
-# ETF Sector Analysis 페이지
-elif st.session_state.current_page == 'etf_analysis':
-    # 그래프 내용만 표시 (모든 설명과 버튼 삭제)
-    pass
-
-# Market Risk Dashboard
-elif st.session_state.current_page == 'market_risk_dashboard':
-    
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed"
-        )
-    
-    
-    # 주요 지수들
-    indices = ['^GSPC', '^DJI', '^IXIC', '^VIX', '^TNX', '^TYX']
-    index_names = ['S&P 500', 'Dow Jones', 'NASDAQ', 'VIX', '10Y Treasury', '30Y Treasury']
-    
-    # 데이터 다운로드
-    data = {}
-    with st.spinner("시장 데이터를 불러오는 중..."):
-        for i, index in enumerate(indices):
-            try:
-                import time
-                time.sleep(0.5)  # 요청 간격 조정
-                ticker = yf.Ticker(index)
-                # 선택된 기간에 따라 데이터 다운로드
-                if selected_period == 'MAX':
-                    hist = ticker.history(period='max')
-                else:
-                    hist = ticker.history(period=selected_period)
-                data[index_names[i]] = hist
-            except Exception as e:
-                st.error(f"{index_names[i]} 데이터 로드 실패: {e}")
-    
-    if data:
-        # 통합 그래프 (S&P 500 + NASDAQ, VIX vs SDEX) - 완전한 동기화를 위해 subplot 사용
-        from plotly.subplots import make_subplots
-        
-        # 5개의 subplot 생성 (상하 배치) - S&P 500 + NASDAQ, VIX vs SDEX, VIX/VVIX, VVIX/VIX, ICE BofA
-        fig = make_subplots(
-            rows=5, cols=1,
-            subplot_titles=('', '', '', '', ''),
-            vertical_spacing=0.03,  # 그래프 간 적절한 간격 유지
-            row_heights=[0.2667, 0.1833, 0.1833, 0.1833, 0.1833],  # S&P 500 + NASDAQ: 26.67% (2/3 축소), 나머지 각 18.33%
-            shared_xaxes=False,  # x축을 개별적으로 표시하여 각 그래프 하단에 날짜 표시
-            shared_yaxes=False,  # y축은 분리
-            specs=[
-                [{"secondary_y": True}],   # Row 1: S&P 500 + NASDAQ
-                [{"secondary_y": True}],   # Row 2: VIX + SDEX
-                [{"secondary_y": True}],   # Row 3: VIX + VVIX
-                [{"secondary_y": False}],  # Row 4: VVIX/VIX
-                [{"secondary_y": False}]   # Row 5: ICE BofA
-            ]
-        )
-        
-        # S&P 500 데이터 추가 (첫 번째 subplot) - data 딕셔너리에서 가져오기
-        if 'S&P 500' in data and not data['S&P 500'].empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=data['S&P 500'].index,
-                    y=data['S&P 500']['Close'],
-                    name='S&P 500',
-                    mode='lines',
-                    line=dict(color='#2E7D32', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=False
-            )
-            
-            # S&P 500 제목은 go.Scatter의 name으로 표시
-            
-            
-            
-        else:
-            # S&P 500 데이터가 없는 경우 빈 그래프라도 표시
-            fig.add_trace(
-                go.Scatter(
-                    x=[],
-                    y=[],
-                    name='S&P 500',
-                    mode='lines',
-                    line=dict(color='#2E7D32', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=False
-            )
-        
-        # NASDAQ 데이터 추가 (첫 번째 subplot, 오른쪽 축) - 무조건 추가
-        nasdaq_data = data.get('NASDAQ', pd.DataFrame())
-        if not nasdaq_data.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=nasdaq_data.index,
-                    y=nasdaq_data['Close'],
-                    name='NASDAQ',
-                    mode='lines',
-                    line=dict(color='#1976D2', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=True
-            )
-        else:
-            # NASDAQ 데이터가 없는 경우에도 빈 그래프 추가 (범례에 표시되도록)
-            fig.add_trace(
-                go.Scatter(
-                    x=[],
-                    y=[],
-                    name='NASDAQ',
-                    mode='lines',
-                    line=dict(color='#1976D2', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=True
-            )
-        
-            
-        
-        # VIX vs SDEX 데이터 추가 (두 번째 subplot)
-        if 'VIX' in data and not data['VIX'].empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=data['VIX'].index,
-                    y=data['VIX']['Close'],
-                    name='VIX',
-                    mode='lines',
-                    line=dict(color='#1A237E', width=2),
-                    legendgroup="row2",
-                    showlegend=True
-                ),
-                row=2, col=1, secondary_y=False
-            )
-            
-            # VVIX 데이터 추가 (세 번째 subplot)
-            vvix_data = None
-            vvix_tickers = ['^VVIX', 'VVIX', 'VVIX.VI']
-            
-            for ticker in vvix_tickers:
-                try:
-                    import time
-                    time.sleep(0.3)  # 요청 간격 조정
-                    
-                    vvix_ticker = yf.Ticker(ticker)
-                    if selected_period == 'MAX':
-                        temp_data = vvix_ticker.history(period='max')
-                    else:
-                        temp_data = vvix_ticker.history(period=selected_period)
-                    
-                    if not temp_data.empty:
-                        vvix_data = temp_data
-                        break
-                    else:
-                        continue
-                except Exception as e:
-                    continue
-            
-            if vvix_data is not None and not vvix_data.empty:
-                # Row 3에 VIX 추가 (왼쪽 축)
-                fig.add_trace(
-                    go.Scatter(
-                        x=data['VIX'].index,
-                        y=data['VIX']['Close'],
-                        name='VIX',
-                        mode='lines',
-                        line=dict(color='#1A237E', width=2),
-                        legendgroup="row3",
-                        showlegend=True
-                    ),
-                    row=3, col=1, secondary_y=False
-                )
-                
-                # Row 3에 VVIX 추가 (오른쪽 축)
-                fig.add_trace(
-                    go.Scatter(
-                        x=vvix_data.index,
-                        y=vvix_data['Close'],
-                        name='VVIX',
-                        mode='lines',
-                        line=dict(color='#FF9800', width=2),
-                        legendgroup="row3",
-                        showlegend=True
-                    ),
-                    row=3, col=1, secondary_y=True
-                )
-                
-                # VVIX/VIX 비율 계산 및 그래프 (네 번째 subplot)
-                vix_dates = data['VIX'].index.strftime('%Y-%m-%d')
-                vvix_dates = vvix_data.index.strftime('%Y-%m-%d')
-                common_dates = set(vix_dates) & set(vvix_dates)
-                
-                if len(common_dates) > 0:
-                    vix_common = data['VIX'][data['VIX'].index.strftime('%Y-%m-%d').isin(common_dates)]
-                    vvix_common = vvix_data[vvix_data.index.strftime('%Y-%m-%d').isin(common_dates)]
-                    
-                    vix_common = vix_common.sort_index()
-                    vvix_common = vvix_common.sort_index()
-                    
-                    vix_common.index = vix_common.index.strftime('%Y-%m-%d')
-                    vvix_common.index = vvix_common.index.strftime('%Y-%m-%d')
-                    
-                    vvix_vix_ratio = vvix_common["Close"] / vix_common["Close"]
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=vvix_common.index,
-                            y=vvix_vix_ratio,
-                            name='VVIX/VIX',
-                            mode='lines',
-                            line=dict(color='#F44336', width=2),
-                            legendgroup="row4",
-                            showlegend=True
-                        ),
-                        row=4, col=1
-                    )
-            
-            # SDEX 데이터 (여러 티커 시도)
-            sdex_data = None
-            sdex_tickers = ['^SDEX', 'SDEX', 'SDEX.VI']
-            
-            for ticker in sdex_tickers:
-                try:
-                    import time
-                    time.sleep(0.3)  # 요청 간격 조정
-                    sdex_ticker = yf.Ticker(ticker)
-                    if selected_period == 'MAX':
-                        temp_data = sdex_ticker.history(period='max')
-                    else:
-                        temp_data = sdex_ticker.history(period=selected_period)
-                    
-                    if not temp_data.empty:
-                        sdex_data = temp_data
-                        break
-                except:
-                    continue
-            
-            # SDEX를 두 번째 subplot에 추가 (오른쪽 축)
-            if sdex_data is not None and not sdex_data.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=sdex_data.index,
-                        y=sdex_data['Close'],
-                        name='SDEX',
-                        mode='lines',
-                        line=dict(color='#2196F3', width=2),
-                        legendgroup="row2",
-                        showlegend=True
-                    ),
-                    row=2, col=1, secondary_y=True
-                )
-        
-        # ICE BofA US High Yield Index 데이터 추가 (5번째 subplot)
-        try:
-            fred = Fred(api_key=FRED_API_KEY)
-            
-            # 선택된 기간에 따라 날짜 범위 계산 - selected_period와 정확히 일치
-            if selected_period == 'MAX':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '10Y':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '5Y':
-                start_date_fred = datetime.now() - timedelta(days=1825)
-                end_date_fred = datetime.now()
-            elif selected_period == '2Y':
-                start_date_fred = datetime.now() - timedelta(days=730)
-                end_date_fred = datetime.now()
-            elif selected_period == '1Y':
-                start_date_fred = datetime.now() - timedelta(days=365)
-                end_date_fred = datetime.now()
-            elif selected_period == '6MO':
-                start_date_fred = datetime.now() - timedelta(days=180)
-                end_date_fred = datetime.now()
-            elif selected_period == '3MO':
-                start_date_fred = datetime.now() - timedelta(days=90)
-                end_date_fred = datetime.now()
-            elif selected_period == '1MO':
-                start_date_fred = datetime.now() - timedelta(days=30)
-                end_date_fred = datetime.now()
-            elif selected_period == '5D':
-                start_date_fred = datetime.now() - timedelta(days=5)
-                end_date_fred = datetime.now()
-            elif selected_period == '1D':
-                start_date_fred = datetime.now() - timedelta(days=1)
-                end_date_fred = datetime.now()
-            else:  # YTD
-                start_date_fred = datetime(datetime.now().year, 1, 1)
-                end_date_fred = datetime.now()
-            
-            # FRED에서 High Yield Spread 데이터 가져오기
-            high_yield_spread = fred.get_series('BAMLH0A0HYM2', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            if not high_yield_spread.empty:
-                # 선택된 기간에 따라 필터링
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                
-                filtered_spread = high_yield_spread[
-                    (high_yield_spread.index >= start_datetime) & 
-                    (high_yield_spread.index <= end_datetime)
-                ]
-                
-                if not filtered_spread.empty:
-                    # 날짜 형식 확인 및 수정
-                    filtered_spread.index = pd.to_datetime(filtered_spread.index)
-                    # 타임존 제거하여 다른 데이터와 일치시키기
-                    filtered_spread.index = filtered_spread.index.tz_localize(None)
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_spread.index,
-                            y=filtered_spread.values,
-                            name='ICE BofA US High Yield Index Option-Adjusted Spread',
-                            mode='lines',
-                            line=dict(color='purple', width=2),
-                            legendgroup="row5",
-                            showlegend=True
-                        ),
-                        row=5, col=1
-                    )
-                    
-                    # ICE BofA 제목은 go.Scatter의 name으로 표시
-                    
-                    
-                    
-                    
-        except Exception as e:
-            st.write(f"ICE BofA 데이터 로드 실패: {e}")
-        
-        # 통합 레이아웃 설정
-        # 각 subplot에 개별 legend를 표시하기 위해 showlegend=False로 설정하고
-        # 각 subplot의 위치에 legend를 배치
-        fig.update_layout(
-            height=1700,  # 2개 subplot을 위해 높이 조정
-            plot_bgcolor='rgba(248, 249, 250, 0.8)',
-            paper_bgcolor='white',
-            font=dict(family="Arial", size=12, color='#2c3e50'),
-            showlegend=True,  # legend 활성화
-            legend=dict(
-                orientation="h",  # 가로 방향
-                x=0,  # 그래프 프레임 왼쪽 경계와 일치
-                y=1.02,  # 상단 (약간 위로)
-                xanchor="left",
-                yanchor="bottom",
-                bgcolor='rgba(0, 0, 0, 0)',  # 투명 배경
-                bordercolor='rgba(0, 0, 0, 0)',  # 투명 테두리
-                borderwidth=0,  # 테두리 제거
-                font=dict(
-                    size=11,
-                    color='#2c3e50',
-                    family="Arial"
-                ),
-                itemclick="toggleothers",  # 클릭 시 다른 항목은 유지하고 선택한 항목만 토글
-                itemdoubleclick="toggle",  # 더블클릭 시 해당 항목만 토글
-                traceorder="normal",  # 정상 순서
-                itemsizing="constant",  # 일정한 크기
-                itemwidth=30  # 아이템 너비 설정
-            ),
-            margin=dict(t=80, b=30, l=50, r=30),  # 상단 마진 추가로 레전드 공간 확보
-            hovermode='x unified',  # x축 통합 모드로 완전한 동기화
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.9)',
-                bordercolor='#bdc3c7',
-                font_size=12,
-                font_family="Arial"
-            )
-        )
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # row_heights = [0.2667, 0.1833, 0.1833, 0.1833, 0.1833], vertical_spacing = 0.03
-        # 각 subplot의 y 위치 계산 (상단부터, paper 좌표계 사용)
-        # Row 1: y_top = 1.0, y_bottom = 1.0 - 0.2667 = 0.7333
-        # Row 2: y_top = 0.7333 - 0.03 = 0.7033, y_bottom = 0.7033 - 0.1833 = 0.52
-        # Row 3: y_top = 0.52 - 0.03 = 0.49, y_bottom = 0.49 - 0.1833 = 0.3067
-        # Row 4: y_top = 0.3067 - 0.03 = 0.2767, y_bottom = 0.2767 - 0.1833 = 0.0934
-        # Row 5: y_top = 0.0934 - 0.03 = 0.0634, y_bottom = 0.0634 - 0.1833 = -0.1199
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # Plotly에서는 subplot별로 개별 legend를 직접 설정할 수 없지만
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치할 수 있습니다
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # 실제 구현: 각 subplot에 대해 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치하는 방법을 사용
-        
-        # x축 개별 표시 및 스타일링 (각 그래프 하단에 날짜 표시)
-        # Row 1: S&P 500 + NASDAQ
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=1, col=1
-        )
-        # Row 2: FED Funds Rate + US 10-Year Treasury vs MOVE Index
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=2, col=1
-        )
-        # Row 3: VIX + VVIX
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=3, col=1
-        )
-        # Row 4: VVIX/VIX
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=4, col=1
-        )
-        # Row 5: ICE BofA
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=5, col=1
-        )
-        
-        
-        # y축 스타일링 및 제목 설정
-        # Row 2: VIX (왼쪽) + SDEX (오른쪽)
-        fig.update_yaxes(
-            title_text="VIX",
-            title_font=dict(size=14, color='#2c3e50'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=2, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="SDEX",
-            title_font=dict(size=14, color='#2196F3'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=2, col=1, secondary_y=True
-        )
-        
-        # Row 3: VIX (왼쪽) + VVIX (오른쪽)
-        fig.update_yaxes(
-            title_text="VIX",
-            title_font=dict(size=14, color='#1A237E'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=3, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="VVIX",
-            title_font=dict(size=14, color='#FF9800'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=3, col=1, secondary_y=True
-        )
-        
-        # Row 4: VVIX/VIX
-        fig.update_yaxes(
-            title_text="VVIX/VIX",
-            title_font=dict(size=14, color='#F44336'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=4, col=1
-        )
-        
-        # Row 5: ICE BofA US High Yield Index
-        fig.update_yaxes(
-            title_text="Spread (%)",
-            title_font=dict(size=14, color='purple'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=5, col=1
-        )
-        
-        # Row 1: S&P 500 (왼쪽) + NASDAQ (오른쪽)
-        fig.update_yaxes(
-            title_text="S&P 500",
-            title_font=dict(size=14, color='#2E7D32'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=1, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="NASDAQ",
-            title_font=dict(size=14, color='#1976D2'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=1, col=1, secondary_y=True
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # ICE BofA 그래프는 이제 subplot에 포함됨
-        
-        # 차트 옵션 제거됨
-        
-        # 가격 차트 제거됨
-            
-        # S&P 500 subplots와 ICE BofA 그래프만 유지
-        # 다른 차트들은 제거됨
-            
-        # 변동성 차트 제거됨
-        
-        # 상관관계 분석 제거됨
-    
-# ETF Consumer Sector
-elif st.session_state.current_page == 'etf_consumer':
-    st.title("ETF Consumer Sector Analysis")
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="consumer_start"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="consumer_end"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed",
-            key="consumer_period"
-        )
-    
-    # 소비재 ETF들
-    consumer_etfs = {
-        'XLY': 'Consumer Discretionary Select Sector SPDR Fund',
-        'XLP': 'Consumer Staples Select Sector SPDR Fund',
-        'VCR': 'Vanguard Consumer Discretionary ETF',
-        'VDC': 'Vanguard Consumer Staples ETF',
-        'IYC': 'iShares U.S. Consumer Discretionary ETF',
-        'IYK': 'iShares U.S. Consumer Staples ETF'
-    }
-    
-    # 선택된 ETF들
-    selected_etfs = st.multiselect(
-        "분석할 ETF 선택",
-        list(consumer_etfs.keys()),
-        default=['XLY', 'XLP', 'VCR', 'VDC']
-    )
-    
-    if selected_etfs:
-        # 데이터 다운로드
-        data = {}
-        with st.spinner("ETF 데이터를 불러오는 중..."):
-            for ticker in selected_etfs:
-                try:
-                    import time
-                    time.sleep(0.3)  # 요청 간격 조정
-                    etf = yf.Ticker(ticker)
-                    hist = etf.history(start=start_date, end=end_date)
-                    data[ticker] = hist
-                except Exception as e:
-                    st.error(f"{ticker} 데이터 로드 실패: {e}")
-        
-        if data:
-            # 성과 비교
-            returns = {}
-            for ticker, df in data.items():
-                if not df.empty:
-                    returns[ticker] = (df['Close'] / df['Close'].iloc[0] - 1) * 100
-            
-            # 수익률 차트
-            fig = go.Figure()
-            for ticker, returns_data in returns.items():
-                fig.add_trace(go.Scatter(
-                    x=returns_data.index,
-                    y=returns_data.values,
-                    name=f"{ticker} ({consumer_etfs[ticker]})",
-                    line=dict(width=2)
-                ))
-            
-            fig.update_layout(
-                height=600,
-                plot_bgcolor='rgba(248, 249, 250, 0.8)',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=12, color='#2c3e50'),
-                showlegend=True,
-                legend=dict(
-                    x=0.0,
-                    y=1.0,
-                    bgcolor='rgba(255, 255, 255, 0.8)',
-                    bordercolor='#bdc3c7',
-                    borderwidth=1,
-                    font=dict(size=12)
-                ),
-                hovermode='x unified',
-                hoverlabel=dict(
-                    bgcolor='rgba(255, 255, 255, 0.9)',
-                    bordercolor='#bdc3c7',
-                    font_size=12,
-                    font_family="Arial"
-                ),
-                margin=dict(t=30, b=30, l=30, r=30)
-            )
-            
-            # x축 스타일링
-            fig.update_xaxes(
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50'),
-                title_font=dict(size=13, color='#2c3e50')
-            )
-            
-            # y축 스타일링
-            fig.update_yaxes(
-                title_text="Cumulative Return (%)",
-                title_font=dict(size=14, color='#2c3e50'),
-                title_standoff=10,
-                automargin=True,
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50')
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 성과 지표 테이블
-            
-            performance_data = []
-            for ticker, df in data.items():
-                if not df.empty:
-                    total_return = (df['Close'].iloc[-1] / df['Close'].iloc[0] - 1) * 100
-                    volatility = df['Close'].pct_change().std() * np.sqrt(252) * 100
-                    sharpe_ratio = (df['Close'].pct_change().mean() * 252) / (df['Close'].pct_change().std() * np.sqrt(252))
-                    
-                    performance_data.append({
-                        'ETF': ticker,
-                        'Name': consumer_etfs[ticker],
-                        'Total Return (%)': f"{total_return:.2f}",
-                        'Volatility (%)': f"{volatility:.2f}",
-                        'Sharpe Ratio': f"{sharpe_ratio:.3f}"
-                    })
-            
-            if performance_data:
-                performance_df = pd.DataFrame(performance_data)
-                
-                # 세련된 테이블 스타일링
-                st.markdown("""
-                <style>
-                .performance-table {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    border-radius: 15px;
-                    padding: 15px;
-                    margin: 10px 0;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                }
-                .performance-table .stDataFrame {
-                    background: white;
-                    border-radius: 10px;
-                    overflow: hidden;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                }
-                /* 그래프와 테이블 간격 줄이기 */
-                .stPlotlyChart {
-                    margin-bottom: 10px !important;
-                }
-                </style>
-                """, unsafe_allow_html=True)
-                
-                st.markdown('<div class="performance-table">', unsafe_allow_html=True)
-                st.dataframe(
-                    performance_df, 
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "ETF": st.column_config.TextColumn("ETF", width="small"),
-                        "Name": st.column_config.TextColumn("ETF Name", width="medium"),
-                        "Total Return (%)": st.column_config.NumberColumn("Total Return (%)", format="%.2f"),
-                        "Volatility (%)": st.column_config.NumberColumn("Volatility (%)", format="%.2f"),
-                        "Sharpe Ratio": st.column_config.NumberColumn("Sharpe Ratio", format="%.3f")
-                    }
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-    
-# ETF IT Hardware vs Software
-elif st.session_state.current_page == 'etf_it_hardware_software':
-    st.title("ETF IT Hardware vs Software Analysis")
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="it_start"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="it_end"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed",
-            key="it_period"
-        )
-    
-    # IT 하드웨어/소프트웨어 관련 ETF들
-    it_etfs = {
-        'SOXX': 'iShares PHLX Semiconductor ETF',
-        'SOXL': 'Direxion Daily Semiconductor Bull 3X Shares',
-        'SOXS': 'Direxion Daily Semiconductor Bear 3X Shares',
-        'IGV': 'iShares Expanded Tech-Software Sector ETF',
-        'PSJ': 'Invesco Dynamic Software ETF',
-        'XLK': 'Technology Select Sector SPDR Fund',
-        'VGT': 'Vanguard Information Technology ETF',
-        'SMH': 'VanEck Vectors Semiconductor ETF'
-    }
-    
-    # 카테고리별 분류
-    hardware_etfs = ['SOXX', 'SOXL', 'SOXS', 'SMH']
-    software_etfs = ['IGV', 'PSJ']
-    broad_tech_etfs = ['XLK', 'VGT']
-    
-    # 분석 유형 선택
-    analysis_type = st.selectbox(
-        "분석 유형",
-        ["하드웨어 vs 소프트웨어", "전체 IT 섹터", "개별 ETF 선택"]
-    )
-    
-    if analysis_type == "하드웨어 vs 소프트웨어":
-        selected_etfs = hardware_etfs + software_etfs
-    elif analysis_type == "전체 IT 섹터":
-        selected_etfs = list(it_etfs.keys())
+# 현재 페이지만 불러와서 그리기 (페이지 모듈은 app_pages/, 처음 방문할 때 import)
+render_page(st.session_state.current_page)
+
+
+# 오래된 데이터를 표시한 경우: 백그라운드 갱신이 끝나면 최신 데이터로 페이지를 다시 그림
+# 스크립트 실행을 막고 기다리면 그동안 위젯 조작이 반영되지 않으므로,
+# 작은 fragment가 REVALIDATE_POLL_INTERVAL 간격으로 완료 여부만 확인하고 끝나면 전체를 다시 실행한다.
+@st.fragment(run_every=REVALIDATE_POLL_INTERVAL)
+def watch_revalidation():
+    pending = st.session_state.get('stale_pending', [])
+    timed_out = time.time() - st.session_state.get('stale_since', 0) > REVALIDATE_TIMEOUT
+    if all(future.done() for future in pending) or timed_out:
+        st.session_state.stale_pending = []
+        st.session_state.stale_revalidated = True
+        st.rerun(scope='app')
+
+
+end_stale_serving()
+if stale_state is not None and stale_state.pending:
+    if not st.session_state.get('stale_revalidated', False):
+        stale_notice.caption(f"{format_age(stale_state.max_age)} 전 저장된 데이터를 표시하고 있습니다. 최신 데이터로 갱신 중...")
+        # 위젯 조작으로 다시 실행된 경우에도 처음 갱신을 시작한 시점 기준으로 시간 초과 판단
+        if not st.session_state.get('stale_pending'):
+            st.session_state.stale_since = time.time()
+        st.session_state.stale_pending = list(stale_state.pending)
+        watch_revalidation()
     else:
-        selected_etfs = st.multiselect(
-            "분석할 ETF 선택",
-            list(it_etfs.keys()),
-            default=['SOXX', 'IGV', 'XLK']
-        )
-    
-    if selected_etfs:
-        # 데이터 다운로드
-        data = {}
-        with st.spinner("IT ETF 데이터를 불러오는 중..."):
-            for ticker in selected_etfs:
-                try:
-                    etf = yf.Ticker(ticker)
-                    hist = etf.history(start=start_date, end=end_date)
-                    data[ticker] = hist
-                except Exception as e:
-                    st.error(f"{ticker} 데이터 로드 실패: {e}")
-        
-        if data:
-            # 성과 비교
-            returns = {}
-            for ticker, df in data.items():
-                if not df.empty:
-                    returns[ticker] = (df['Close'] / df['Close'].iloc[0] - 1) * 100
-            
-            # 수익률 차트
-            fig = go.Figure()
-            
-            # 색상 구분
-            colors = {
-                'hardware': ['red', 'darkred', 'crimson', 'firebrick'],
-                'software': ['blue', 'darkblue', 'navy', 'royalblue'],
-                'broad': ['green', 'darkgreen', 'forestgreen', 'limegreen']
-            }
-            
-            color_idx = 0
-            for ticker, returns_data in returns.items():
-                if ticker in hardware_etfs:
-                    color = colors['hardware'][color_idx % len(colors['hardware'])]
-                    name = f"🔧 {ticker} ({it_etfs[ticker]})"
-                elif ticker in software_etfs:
-                    color = colors['software'][color_idx % len(colors['software'])]
-                    name = f"{ticker} ({it_etfs[ticker]})"
-                else:
-                    color = colors['broad'][color_idx % len(colors['broad'])]
-                    name = f"📱 {ticker} ({it_etfs[ticker]})"
-                
-                fig.add_trace(go.Scatter(
-                    x=returns_data.index,
-                    y=returns_data.values,
-                    name=name,
-                    line=dict(color=color, width=2)
-                ))
-                color_idx += 1
-            
-            fig.update_layout(
-                height=600,
-                plot_bgcolor='rgba(248, 249, 250, 0.8)',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=12, color='#2c3e50'),
-                showlegend=True,
-                legend=dict(
-                    x=0.0,
-                    y=1.0,
-                    bgcolor='rgba(255, 255, 255, 0.8)',
-                    bordercolor='#bdc3c7',
-                    borderwidth=1,
-                    font=dict(size=12)
-                ),
-                hovermode='x unified',
-                hoverlabel=dict(
-                    bgcolor='rgba(255, 255, 255, 0.9)',
-                    bordercolor='#bdc3c7',
-                    font_size=12,
-                    font_family="Arial"
-                ),
-                margin=dict(t=30, b=30, l=30, r=30)
-            )
-            
-            # x축 스타일링
-            fig.update_xaxes(
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50'),
-                title_font=dict(size=13, color='#2c3e50')
-            )
-            
-            # y축 스타일링
-            fig.update_yaxes(
-                title_text="Cumulative Return (%)",
-                title_font=dict(size=14, color='#2c3e50'),
-                title_standoff=10,
-                automargin=True,
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50')
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 성과 지표 테이블
-            
-            performance_data = []
-            for ticker, df in data.items():
-                if not df.empty:
-                    total_return = (df['Close'].iloc[-1] / df['Close'].iloc[0] - 1) * 100
-                    volatility = df['Close'].pct_change().std() * np.sqrt(252) * 100
-                    sharpe_ratio = (df['Close'].pct_change().mean() * 252) / (df['Close'].pct_change().std() * np.sqrt(252))
-                    
-                    # 카테고리 분류
-                    if ticker in hardware_etfs:
-                        category = "하드웨어"
-                    elif ticker in software_etfs:
-                        category = "소프트웨어"
-                    else:
-                        category = "전체 IT"
-                    
-                    performance_data.append({
-                        'ETF': ticker,
-                        'Category': category,
-                        'Name': it_etfs[ticker],
-                        'Total Return (%)': f"{total_return:.2f}",
-                        'Volatility (%)': f"{volatility:.2f}",
-                        'Sharpe Ratio': f"{sharpe_ratio:.3f}"
-                    })
-            
-            if performance_data:
-                performance_df = pd.DataFrame(performance_data)
-                
-                # 세련된 테이블 스타일링
-                st.markdown("""
-                <style>
-                .performance-table {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    border-radius: 15px;
-                    padding: 15px;
-                    margin: 10px 0;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                }
-                .performance-table .stDataFrame {
-                    background: white;
-                    border-radius: 10px;
-                    overflow: hidden;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                }
-                /* 그래프와 테이블 간격 줄이기 */
-                .stPlotlyChart {
-                    margin-bottom: 10px !important;
-                }
-                </style>
-                """, unsafe_allow_html=True)
-                
-                st.markdown('<div class="performance-table">', unsafe_allow_html=True)
-                st.dataframe(
-                    performance_df, 
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "ETF": st.column_config.TextColumn("ETF", width="small"),
-                        "Name": st.column_config.TextColumn("ETF Name", width="medium"),
-                        "Total Return (%)": st.column_config.NumberColumn("Total Return (%)", format="%.2f"),
-                        "Volatility (%)": st.column_config.NumberColumn("Volatility (%)", format="%.2f"),
-                        "Sharpe Ratio": st.column_config.NumberColumn("Sharpe Ratio", format="%.3f")
-                    }
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-
-# ETF Commodity
-elif st.session_state.current_page == 'etf_commodity':
-    st.title("ETF Commodity Analysis")
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="commodity_start"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="commodity_end"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed",
-            key="commodity_period"
-        )
-    
-    # 상품 관련 ETF들
-    commodity_etfs = {
-        'GLD': 'SPDR Gold Shares',
-        'IAU': 'iShares Gold Trust',
-        'FGDL': 'Franklin Responsibly Sourced Gold ETF',
-        'SLV': 'iShares Silver Trust',
-        'SIVR': 'abrdn Physical Silver Shares ETF',
-        'SIL': 'Global X Silver Miners ETF',
-        'COPX': 'Global X Copper Miners ETF',
-        'CPER': 'United States Copper Index Fund'
-    }
-    
-    # 카테고리별 분류
-    gold_etfs = ['GLD', 'IAU', 'FGDL']
-    silver_etfs = ['SLV', 'SIVR', 'SIL']
-    copper_etfs = ['COPX', 'CPER']
-    
-    # 분석 유형 선택
-    analysis_type = st.selectbox(
-        "분석 유형",
-        ["Gold vs Silver vs Copper", "전체 상품 ETF", "개별 ETF 선택"],
-        key="commodity_analysis_type"
-    )
-    
-    if analysis_type == "Gold vs Silver vs Copper":
-        selected_etfs = gold_etfs + silver_etfs + copper_etfs
-    elif analysis_type == "전체 상품 ETF":
-        selected_etfs = list(commodity_etfs.keys())
-    else:
-        selected_etfs = st.multiselect(
-            "분석할 ETF 선택",
-            list(commodity_etfs.keys()),
-            default=['GLD', 'SLV', 'COPX'],
-            key="commodity_multiselect"
-        )
-    
-    if selected_etfs:
-        # 데이터 다운로드
-        data = {}
-        with st.spinner("상품 ETF 데이터를 불러오는 중..."):
-            for ticker in selected_etfs:
-                try:
-                    import time
-                    time.sleep(0.3)  # 요청 간격 조정
-                    etf = yf.Ticker(ticker)
-                    hist = etf.history(start=start_date, end=end_date)
-                    data[ticker] = hist
-                except Exception as e:
-                    st.error(f"{ticker} 데이터 로드 실패: {e}")
-        
-        if data:
-            # 성과 비교
-            returns = {}
-            for ticker, df in data.items():
-                if not df.empty:
-                    returns[ticker] = (df['Close'] / df['Close'].iloc[0] - 1) * 100
-            
-            # 수익률 차트
-            fig = go.Figure()
-            
-            # 색상 구분
-            colors = {
-                'gold': ['gold', 'orange', 'darkorange'],
-                'silver': ['silver', 'gray', 'darkgray'],
-                'copper': ['brown', 'saddlebrown', 'maroon']
-            }
-            
-            color_idx = 0
-            for ticker, returns_data in returns.items():
-                if ticker in gold_etfs:
-                    color = colors['gold'][color_idx % len(colors['gold'])]
-                    name = f"🥇 {ticker} ({commodity_etfs[ticker]})"
-                elif ticker in silver_etfs:
-                    color = colors['silver'][color_idx % len(colors['silver'])]
-                    name = f"🥈 {ticker} ({commodity_etfs[ticker]})"
-                else:  # copper
-                    color = colors['copper'][color_idx % len(colors['copper'])]
-                    name = f"🥉 {ticker} ({commodity_etfs[ticker]})"
-                
-                fig.add_trace(go.Scatter(
-                    x=returns_data.index,
-                    y=returns_data.values,
-                    name=name,
-                    line=dict(color=color, width=2)
-                ))
-                color_idx += 1
-            
-            fig.update_layout(
-                height=600,
-                plot_bgcolor='rgba(248, 249, 250, 0.8)',
-                paper_bgcolor='white',
-                font=dict(family="Arial", size=12, color='#2c3e50'),
-                showlegend=True,
-                legend=dict(
-                    x=0.0,
-                    y=1.0,
-                    bgcolor='rgba(255, 255, 255, 0.8)',
-                    bordercolor='#bdc3c7',
-                    borderwidth=1,
-                    font=dict(size=12)
-                ),
-                hovermode='x unified',
-                hoverlabel=dict(
-                    bgcolor='rgba(255, 255, 255, 0.9)',
-                    bordercolor='#bdc3c7',
-                    font_size=12,
-                    font_family="Arial"
-                ),
-                margin=dict(t=30, b=30, l=30, r=30)
-            )
-            
-            # x축 스타일링
-            fig.update_xaxes(
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50'),
-                title_font=dict(size=13, color='#2c3e50')
-            )
-            
-            # y축 스타일링
-            fig.update_yaxes(
-                title_text="Cumulative Return (%)",
-                title_font=dict(size=14, color='#2c3e50'),
-                title_standoff=10,
-                automargin=True,
-                showgrid=True,
-                gridwidth=1,
-                gridcolor='rgba(189, 195, 199, 0.3)',
-                showline=True,
-                linewidth=1,
-                linecolor='#34495e',
-                mirror=True,
-                tickfont=dict(size=11, color='#2c3e50')
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 성과 지표 테이블
-            performance_data = []
-            for ticker, df in data.items():
-                if not df.empty:
-                    total_return = (df['Close'].iloc[-1] / df['Close'].iloc[0] - 1) * 100
-                    volatility = df['Close'].pct_change().std() * np.sqrt(252) * 100
-                    sharpe_ratio = (df['Close'].pct_change().mean() * 252) / (df['Close'].pct_change().std() * np.sqrt(252))
-                    
-                    # 카테고리 분류
-                    if ticker in gold_etfs:
-                        category = "Gold"
-                    elif ticker in silver_etfs:
-                        category = "Silver"
-                    else:
-                        category = "Copper"
-                    
-                    performance_data.append({
-                        'ETF': ticker,
-                        'Category': category,
-                        'Name': commodity_etfs[ticker],
-                        'Total Return (%)': f"{total_return:.2f}",
-                        'Volatility (%)': f"{volatility:.2f}",
-                        'Sharpe Ratio': f"{sharpe_ratio:.3f}"
-                    })
-            
-            if performance_data:
-                performance_df = pd.DataFrame(performance_data)
-                
-                # 세련된 테이블 스타일링
-                st.markdown("""
-                <style>
-                .performance-table {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    border-radius: 15px;
-                    padding: 15px;
-                    margin: 10px 0;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                }
-                .performance-table .stDataFrame {
-                    background: white;
-                    border-radius: 10px;
-                    overflow: hidden;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                }
-                /* 그래프와 테이블 간격 줄이기 */
-                .stPlotlyChart {
-                    margin-bottom: 10px !important;
-                }
-                </style>
-                """, unsafe_allow_html=True)
-                
-                st.markdown('<div class="performance-table">', unsafe_allow_html=True)
-                st.dataframe(
-                    performance_df, 
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "ETF": st.column_config.TextColumn("ETF", width="small"),
-                        "Category": st.column_config.TextColumn("Category", width="small"),
-                        "Name": st.column_config.TextColumn("ETF Name", width="medium"),
-                        "Total Return (%)": st.column_config.NumberColumn("Total Return (%)", format="%.2f"),
-                        "Volatility (%)": st.column_config.NumberColumn("Volatility (%)", format="%.2f"),
-                        "Sharpe Ratio": st.column_config.NumberColumn("Sharpe Ratio", format="%.3f")
-                    }
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            # 상관관계 분석
-            if len(selected_etfs) > 1:
-                # 상관관계 계산을 위한 데이터 준비
-                correlation_data = {}
-                for ticker, df in data.items():
-                    if not df.empty and 'Close' in df.columns:
-                        # 일일 수익률 계산
-                        daily_returns = df['Close'].pct_change().dropna()
-                        correlation_data[ticker] = daily_returns
-                
-                if len(correlation_data) > 1:
-                    # 상관관계 매트릭스 계산
-                    correlation_df = pd.DataFrame(correlation_data)
-                    correlation_matrix = correlation_df.corr()
-                    
-                    # 상관관계 히트맵 생성
-                    fig_corr = go.Figure(data=go.Heatmap(
-                        z=correlation_matrix.values,
-                        x=correlation_matrix.columns,
-                        y=correlation_matrix.columns,
-                        colorscale='RdBu',
-                        zmid=0,
-                        text=np.round(correlation_matrix.values, 3),
-                        texttemplate="%{text}",
-                        textfont={"size": 12},
-                        hoverongaps=False
-                    ))
-                    
-                    fig_corr.update_layout(
-                        title="상품 ETF 상관관계 매트릭스",
-                        height=500,
-                        plot_bgcolor='white',
-                        paper_bgcolor='white',
-                        font=dict(family="Arial", size=12, color='#2c3e50'),
-                        margin=dict(t=50, b=30, l=30, r=30)
-                    )
-                    
-                    st.plotly_chart(fig_corr, use_container_width=True)
-
-# SOFR & US 10-Year Bond Yield
-elif st.session_state.current_page == 'sofr_10y_bond_yield':
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="sofr_start"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed",
-            key="sofr_end"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed",
-            key="sofr_period"
-        )
-    
-    # FRED API를 사용하여 SOFR과 US 10-Year Bond Yield 데이터 가져오기
-    with st.spinner("경제 지표 데이터를 불러오는 중..."):
-        try:
-            fred = Fred(api_key=FRED_API_KEY)
-            
-            # 선택된 기간에 따라 날짜 범위 계산
-            if selected_period == 'MAX':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '10Y':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '5Y':
-                start_date_fred = datetime.now() - timedelta(days=1825)
-                end_date_fred = datetime.now()
-            elif selected_period == '2Y':
-                start_date_fred = datetime.now() - timedelta(days=730)
-                end_date_fred = datetime.now()
-            elif selected_period == '1Y':
-                start_date_fred = datetime.now() - timedelta(days=365)
-                end_date_fred = datetime.now()
-            elif selected_period == '6MO':
-                start_date_fred = datetime.now() - timedelta(days=180)
-                end_date_fred = datetime.now()
-            elif selected_period == '3MO':
-                start_date_fred = datetime.now() - timedelta(days=90)
-                end_date_fred = datetime.now()
-            elif selected_period == '1MO':
-                start_date_fred = datetime.now() - timedelta(days=30)
-                end_date_fred = datetime.now()
-            elif selected_period == '5D':
-                start_date_fred = datetime.now() - timedelta(days=5)
-                end_date_fred = datetime.now()
-            elif selected_period == '1D':
-                start_date_fred = datetime.now() - timedelta(days=1)
-                end_date_fred = datetime.now()
-            else:  # YTD
-                start_date_fred = datetime(datetime.now().year, 1, 1)
-                end_date_fred = datetime.now()
-            
-            # FRED에서 SOFR 데이터 가져오기
-            sofr_data = fred.get_series('SOFR', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            # FRED에서 US 10-Year Bond Yield 데이터 가져오기
-            bond_yield_data = fred.get_series('DGS10', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            # FRED에서 FED 기준금리 데이터 가져오기
-            fed_rate_data = fred.get_series('DFF', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            if not sofr_data.empty and not bond_yield_data.empty:
-                # 날짜 형식 통일 및 타임존 제거
-                sofr_data.index = pd.to_datetime(sofr_data.index).tz_localize(None)
-                bond_yield_data.index = pd.to_datetime(bond_yield_data.index).tz_localize(None)
-                
-                # FED 기준금리 데이터 처리 (데이터가 있는 경우)
-                if not fed_rate_data.empty:
-                    fed_rate_data.index = pd.to_datetime(fed_rate_data.index).tz_localize(None)
-                
-                # 선택된 기간에 따라 필터링
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                
-                filtered_sofr = sofr_data[
-                    (sofr_data.index >= start_datetime) & 
-                    (sofr_data.index <= end_datetime)
-                ]
-                
-                filtered_bond_yield = bond_yield_data[
-                    (bond_yield_data.index >= start_datetime) & 
-                    (bond_yield_data.index <= end_datetime)
-                ]
-                
-                # FED 기준금리 필터링
-                filtered_fed_rate = pd.Series(dtype=float)
-                if not fed_rate_data.empty:
-                    filtered_fed_rate = fed_rate_data[
-                        (fed_rate_data.index >= start_datetime) & 
-                        (fed_rate_data.index <= end_datetime)
-                    ]
-                
-                if not filtered_sofr.empty and not filtered_bond_yield.empty:
-                    # 하나의 차트에 두 그래프 표시 (secondary_y 사용)
-                    from plotly.subplots import make_subplots
-                    
-                    fig = make_subplots(
-                        rows=1, cols=1,
-                        specs=[[{"secondary_y": True}]]
-                    )
-                    
-                    # SOFR 데이터 추가 (왼쪽 축)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_sofr.index,
-                            y=filtered_sofr.values,
-                            name='SOFR',
-                            line=dict(color='#1A237E', width=2)
-                        ),
-                        row=1, col=1, secondary_y=False
-                    )
-                    
-                    # US 10-Year Bond Yield 데이터 추가 (오른쪽 축)
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_bond_yield.index,
-                            y=filtered_bond_yield.values,
-                            name='US 10-Year Bond Yield',
-                            line=dict(color='#F44336', width=2)
-                        ),
-                        row=1, col=1, secondary_y=True
-                    )
-                    
-                    # FED 기준금리 데이터 추가 (왼쪽 축, SOFR과 함께)
-                    if not filtered_fed_rate.empty:
-                        fig.add_trace(
-                            go.Scatter(
-                                x=filtered_fed_rate.index,
-                                y=filtered_fed_rate.values,
-                                name='FED Funds Rate',
-                                line=dict(color='#1B5E20', width=2, dash='dot')
-                            ),
-                            row=1, col=1, secondary_y=False
-                        )
-                    
-                    # 레이아웃 설정
-                    fig.update_layout(
-                        height=600,
-                        plot_bgcolor='rgba(248, 249, 250, 0.8)',
-                        paper_bgcolor='white',
-                        font=dict(family="Arial", size=12, color='#2c3e50'),
-                        showlegend=True,
-                        legend=dict(
-                            x=0.0,
-                            y=1.0,
-                            bgcolor='rgba(255, 255, 255, 0.8)',
-                            bordercolor='#bdc3c7',
-                            borderwidth=1,
-                            font=dict(size=12)
-                        ),
-                        hovermode='x unified',
-                        hoverlabel=dict(
-                            bgcolor='rgba(255, 255, 255, 0.9)',
-                            bordercolor='#bdc3c7',
-                            font_size=12,
-                            font_family="Arial"
-                        )
-                    )
-                    
-                    # x축 스타일링
-                    fig.update_xaxes(
-                        showgrid=True,
-                        gridwidth=1,
-                        gridcolor='rgba(189, 195, 199, 0.3)',
-                        showline=True,
-                        linewidth=1,
-                        linecolor='#34495e',
-                        mirror=True,
-                        tickfont=dict(size=11, color='#2c3e50'),
-                        title_font=dict(size=13, color='#2c3e50'),
-                        title_text="Date"
-                    )
-                    
-                    # y축 스타일링 (왼쪽: SOFR)
-                    fig.update_yaxes(
-                        title_text="SOFR (%)",
-                        title_font=dict(size=14, color='#1A237E'),
-                        title_standoff=10,
-                        automargin=True,
-                        showgrid=True,
-                        gridwidth=1,
-                        gridcolor='rgba(189, 195, 199, 0.3)',
-                        showline=True,
-                        linewidth=1,
-                        linecolor='#34495e',
-                        mirror=True,
-                        tickfont=dict(size=11, color='#2c3e50'),
-                        row=1, col=1, secondary_y=False
-                    )
-                    
-                    # y축 스타일링 (오른쪽: US 10-Year Bond Yield)
-                    fig.update_yaxes(
-                        title_text="US 10-Year Bond Yield (%)",
-                        title_font=dict(size=14, color='#F44336'),
-                        title_standoff=10,
-                        automargin=True,
-                        showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
-                        showline=True,
-                        linewidth=1,
-                        linecolor='#34495e',
-                        mirror=True,
-                        tickfont=dict(size=11, color='#2c3e50'),
-                        row=1, col=1, secondary_y=True
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("선택한 기간에 데이터가 없습니다.")
-            else:
-                st.error("FRED API에서 데이터를 불러올 수 없습니다.")
-        except Exception as e:
-            st.error(f"데이터 로드 실패: {e}")
-
-# Market Risk Dashboard II
-elif st.session_state.current_page == 'kospi_put_call_ratio':
-    
-    
-    # 날짜 선택을 3개 컬럼으로 배치
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Start Date**")
-        start_date = st.date_input(
-            "",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now(),
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        st.markdown("**End Date**")
-        end_date = st.date_input(
-            "",
-            value=datetime.now(),
-            max_value=datetime.now(),
-            label_visibility="collapsed"
-        )
-    
-    with col3:
-        st.markdown("**Period**")
-        period_options = ['1D', '5D', '1MO', '3MO', '6MO', '1Y', '2Y', '5Y', '10Y', 'YTD', 'MAX']
-        period_labels = {
-            '1D': '1 Day', '5D': '5 Days', '1MO': '1 Month', '3MO': '3 Months', 
-            '6MO': '6 Months', '1Y': '1 Year', '2Y': '2 Years', '5Y': '5 Years', 
-            '10Y': '10 Years', 'YTD': 'Year to Date', 'MAX': 'Maximum'
-        }
-        selected_period = st.selectbox(
-            "",
-            period_options, 
-            index=5,
-            format_func=lambda x: period_labels[x],
-            label_visibility="collapsed"
-        )
-    
-    
-    # 주요 지수들
-    indices = ['^GSPC', '^DJI', '^IXIC', '^VIX', '^TNX', '^TYX']
-    index_names = ['S&P 500', 'Dow Jones', 'NASDAQ', 'VIX', '10Y Treasury', '30Y Treasury']
-    
-    # 데이터 다운로드
-    data = {}
-    with st.spinner("시장 데이터를 불러오는 중..."):
-        for i, index in enumerate(indices):
-            try:
-                import time
-                time.sleep(0.5)  # 요청 간격 조정
-                ticker = yf.Ticker(index)
-                # 선택된 기간에 따라 데이터 다운로드
-                if selected_period == 'MAX':
-                    hist = ticker.history(period='max')
-                else:
-                    hist = ticker.history(period=selected_period)
-                data[index_names[i]] = hist
-            except Exception as e:
-                st.error(f"{index_names[i]} 데이터 로드 실패: {e}")
-    
-    if data:
-        # 통합 그래프 (S&P 500 + NASDAQ, FED Funds Rate + US 10-Year Treasury vs MOVE Index) - 완전한 동기화를 위해 subplot 사용
-        from plotly.subplots import make_subplots
-        
-        # 5개의 subplot 생성 (상하 배치) - S&P 500 + NASDAQ, FED Funds Rate + US 10-Year Treasury vs MOVE Index, VIX/VVIX, VVIX/VIX, ICE BofA
-        fig = make_subplots(
-            rows=5, cols=1,
-            subplot_titles=('', '', '', '', ''),
-            vertical_spacing=0.03,  # 그래프 간 적절한 간격 유지
-            row_heights=[0.2667, 0.1833, 0.1833, 0.1833, 0.1833],  # S&P 500 + NASDAQ: 26.67% (2/3 축소), 나머지 각 18.33%
-            shared_xaxes=False,  # x축을 개별적으로 표시하여 각 그래프 하단에 날짜 표시
-            shared_yaxes=False,  # y축은 분리
-            specs=[
-                [{"secondary_y": True}],   # Row 1: S&P 500 + NASDAQ
-                [{"secondary_y": True}],   # Row 2: FED Funds Rate + US 10-Year Treasury vs MOVE Index
-                [{"secondary_y": True}],   # Row 3: VIX + VVIX
-                [{"secondary_y": False}],  # Row 4: VVIX/VIX
-                [{"secondary_y": False}]   # Row 5: ICE BofA
-            ]
-        )
-        
-        # S&P 500 데이터 추가 (첫 번째 subplot) - data 딕셔너리에서 가져오기
-        if 'S&P 500' in data and not data['S&P 500'].empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=data['S&P 500'].index,
-                    y=data['S&P 500']['Close'],
-                    name='S&P 500',
-                    mode='lines',
-                    line=dict(color='#2E7D32', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=False
-            )
-            
-            # S&P 500 제목은 go.Scatter의 name으로 표시
-            
-            
-            
-        else:
-            # S&P 500 데이터가 없는 경우 빈 그래프라도 표시
-            fig.add_trace(
-                go.Scatter(
-                    x=[],
-                    y=[],
-                    name='S&P 500',
-                    mode='lines',
-                    line=dict(color='#2E7D32', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=False
-            )
-        
-        # NASDAQ 데이터 추가 (첫 번째 subplot, 오른쪽 축) - 무조건 추가
-        nasdaq_data = data.get('NASDAQ', pd.DataFrame())
-        if not nasdaq_data.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=nasdaq_data.index,
-                    y=nasdaq_data['Close'],
-                    name='NASDAQ',
-                    mode='lines',
-                    line=dict(color='#1976D2', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=True
-            )
-        else:
-            # NASDAQ 데이터가 없는 경우에도 빈 그래프 추가 (범례에 표시되도록)
-            fig.add_trace(
-                go.Scatter(
-                    x=[],
-                    y=[],
-                    name='NASDAQ',
-                    mode='lines',
-                    line=dict(color='#1976D2', width=2),
-                    legendgroup="row1",
-                    showlegend=True
-                ),
-                row=1, col=1, secondary_y=True
-            )
-        
-            
-        
-        # 두 번째 subplot: FED Funds Rate + US 10-Year Treasury (왼쪽) vs MOVE Index (오른쪽)
-        try:
-            fred = Fred(api_key=FRED_API_KEY)
-            
-            # 선택된 기간에 따라 날짜 범위 계산
-            if selected_period == 'MAX':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '10Y':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '5Y':
-                start_date_fred = datetime.now() - timedelta(days=1825)
-                end_date_fred = datetime.now()
-            elif selected_period == '2Y':
-                start_date_fred = datetime.now() - timedelta(days=730)
-                end_date_fred = datetime.now()
-            elif selected_period == '1Y':
-                start_date_fred = datetime.now() - timedelta(days=365)
-                end_date_fred = datetime.now()
-            elif selected_period == '6MO':
-                start_date_fred = datetime.now() - timedelta(days=180)
-                end_date_fred = datetime.now()
-            elif selected_period == '3MO':
-                start_date_fred = datetime.now() - timedelta(days=90)
-                end_date_fred = datetime.now()
-            elif selected_period == '1MO':
-                start_date_fred = datetime.now() - timedelta(days=30)
-                end_date_fred = datetime.now()
-            elif selected_period == '5D':
-                start_date_fred = datetime.now() - timedelta(days=5)
-                end_date_fred = datetime.now()
-            elif selected_period == '1D':
-                start_date_fred = datetime.now() - timedelta(days=1)
-                end_date_fred = datetime.now()
-            else:  # YTD
-                start_date_fred = datetime(datetime.now().year, 1, 1)
-                end_date_fred = datetime.now()
-            
-            # FRED에서 FED Funds Rate 데이터 가져오기
-            fed_rate_data = fred.get_series('DFF', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            # FRED에서 US 10-Year Treasury 데이터 가져오기
-            treasury_10y_data = fred.get_series('DGS10', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            # MOVE Index 데이터 가져오기 (yfinance 및 FRED 시도)
-            move_data = None
-            move_data_source = None  # 데이터 소스 추적
-            
-            # 방법 1: yfinance에서 MOVE Index 티커 시도
-            move_tickers = ['^MOVE', 'MOVE', 'MOVE.VI']
-            for ticker in move_tickers:
-                try:
-                    import time
-                    time.sleep(0.3)
-                    move_ticker = yf.Ticker(ticker)
-                    if selected_period == 'MAX':
-                        temp_data = move_ticker.history(period='max')
-                    else:
-                        temp_data = move_ticker.history(period=selected_period)
-                    if not temp_data.empty:
-                        move_data = temp_data['Close']
-                        move_data_source = f"yfinance ({ticker})"
-                        break
-                except Exception as e:
-                    continue
-            
-            # 방법 2: FRED에서 MOVE Index 시리즈 시도
-            if move_data is None:
-                move_series_ids = ['BAMLEMOVE', 'BAMLEMOVEINDEX', 'MOVE']
-                for series_id in move_series_ids:
-                    try:
-                        temp_move = fred.get_series(series_id, observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-                        if not temp_move.empty:
-                            move_data = temp_move
-                            move_data_source = f"FRED API ({series_id})"
-                            break
-                    except Exception as e:
-                        continue
-            
-            # 방법 3: US 10-Year Treasury 변동성으로 MOVE Index 근사치 계산
-            if move_data is None and not treasury_10y_data.empty:
-                try:
-                    # Treasury 10-Year 데이터의 변동성 계산 (30일 롤링 표준편차)
-                    treasury_10y_data.index = pd.to_datetime(treasury_10y_data.index).tz_localize(None)
-                    treasury_returns = treasury_10y_data.pct_change()
-                    move_data = treasury_returns.rolling(window=30).std() * np.sqrt(252) * 100  # 연율화 변동성
-                    move_data = move_data.dropna()
-                    if move_data.empty:
-                        move_data = None
-                    else:
-                        move_data_source = "Calculated (US 10Y Treasury 30-day rolling volatility)"
-                except Exception as e:
-                    move_data = None
-            
-            # 데이터 소스 정보 표시
-            if move_data_source:
-                st.caption(f"📊 MOVE Index 데이터 소스: {move_data_source}")
-            else:
-                st.caption("⚠️ MOVE Index 데이터를 가져올 수 없습니다.")
-            
-            # 데이터 처리 및 필터링
-            if not fed_rate_data.empty:
-                fed_rate_data.index = pd.to_datetime(fed_rate_data.index).tz_localize(None)
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                filtered_fed_rate = fed_rate_data[
-                    (fed_rate_data.index >= start_datetime) & 
-                    (fed_rate_data.index <= end_datetime)
-                ]
-                
-                if not filtered_fed_rate.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_fed_rate.index,
-                            y=filtered_fed_rate.values,
-                            name='FED Funds Rate',
-                            mode='lines',
-                            line=dict(color='#1B5E20', width=2, dash='dot'),
-                            legendgroup="row2",
-                            showlegend=True
-                        ),
-                        row=2, col=1, secondary_y=False
-                    )
-            
-            if not treasury_10y_data.empty:
-                treasury_10y_data.index = pd.to_datetime(treasury_10y_data.index).tz_localize(None)
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                filtered_treasury_10y = treasury_10y_data[
-                    (treasury_10y_data.index >= start_datetime) & 
-                    (treasury_10y_data.index <= end_datetime)
-                ]
-                
-                if not filtered_treasury_10y.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_treasury_10y.index,
-                            y=filtered_treasury_10y.values,
-                            name='US 10-Year Treasury',
-                            mode='lines',
-                            line=dict(color='#000000', width=2),
-                            legendgroup="row2",
-                            showlegend=True
-                        ),
-                        row=2, col=1, secondary_y=False
-                    )
-            
-            # MOVE Index 또는 US 10-Year Treasury 변동성을 오른쪽 축에 추가
-            if move_data is not None and not move_data.empty:
-                # move_data가 Series인 경우와 DataFrame인 경우 처리
-                if isinstance(move_data, pd.DataFrame):
-                    move_values = move_data['Close'] if 'Close' in move_data.columns else move_data.iloc[:, 0]
-                    move_index = move_data.index
-                else:
-                    move_values = move_data
-                    move_index = move_data.index
-                
-                move_index = pd.to_datetime(move_index).tz_localize(None)
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                filtered_move = move_values[
-                    (move_index >= start_datetime) & 
-                    (move_index <= end_datetime)
-                ]
-                
-                if not filtered_move.empty:
-                    # MOVE Index가 계산된 변동성인지 확인하여 이름 설정
-                    if move_data is not None and hasattr(move_data, 'name') and 'volatility' in str(move_data.name).lower():
-                        move_name = 'US 10Y Treasury Volatility'
-                    else:
-                        move_name = 'MOVE Index'
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_move.index,
-                            y=filtered_move.values,
-                            name=move_name,
-                            mode='lines',
-                            line=dict(color='purple', width=2),
-                            legendgroup="row2",
-                            showlegend=True
-                        ),
-                        row=2, col=1, secondary_y=True
-                    )
-        except Exception as e:
-            st.write(f"두 번째 그래프 데이터 로드 실패: {e}")
-        
-        # VIX 데이터가 있는 경우 VVIX 데이터 추가 (세 번째 subplot)
-        if 'VIX' in data and not data['VIX'].empty:
-            # VVIX 데이터 추가 (세 번째 subplot)
-            vvix_data = None
-            vvix_tickers = ['^VVIX', 'VVIX', 'VVIX.VI']
-            
-            for ticker in vvix_tickers:
-                try:
-                    import time
-                    time.sleep(0.3)  # 요청 간격 조정
-                    
-                    vvix_ticker = yf.Ticker(ticker)
-                    if selected_period == 'MAX':
-                        temp_data = vvix_ticker.history(period='max')
-                    else:
-                        temp_data = vvix_ticker.history(period=selected_period)
-                    
-                    if not temp_data.empty:
-                        vvix_data = temp_data
-                        break
-                    else:
-                        continue
-                except Exception as e:
-                    continue
-            
-            if vvix_data is not None and not vvix_data.empty:
-                # Row 3에 VIX 추가 (왼쪽 축)
-                fig.add_trace(
-                    go.Scatter(
-                        x=data['VIX'].index,
-                        y=data['VIX']['Close'],
-                        name='VIX',
-                        mode='lines',
-                        line=dict(color='#1A237E', width=2),
-                        legendgroup="row3",
-                        showlegend=True
-                    ),
-                    row=3, col=1, secondary_y=False
-                )
-                
-                # Row 3에 VVIX 추가 (오른쪽 축)
-                fig.add_trace(
-                    go.Scatter(
-                        x=vvix_data.index,
-                        y=vvix_data['Close'],
-                        name='VVIX',
-                        mode='lines',
-                        line=dict(color='#FF9800', width=2),
-                        legendgroup="row3",
-                        showlegend=True
-                    ),
-                    row=3, col=1, secondary_y=True
-                )
-                
-                # VVIX/VIX 비율 계산 및 그래프 (네 번째 subplot)
-                vix_dates = data['VIX'].index.strftime('%Y-%m-%d')
-                vvix_dates = vvix_data.index.strftime('%Y-%m-%d')
-                common_dates = set(vix_dates) & set(vvix_dates)
-                
-                if len(common_dates) > 0:
-                    vix_common = data['VIX'][data['VIX'].index.strftime('%Y-%m-%d').isin(common_dates)]
-                    vvix_common = vvix_data[vvix_data.index.strftime('%Y-%m-%d').isin(common_dates)]
-                    
-                    vix_common = vix_common.sort_index()
-                    vvix_common = vvix_common.sort_index()
-                    
-                    vix_common.index = vix_common.index.strftime('%Y-%m-%d')
-                    vvix_common.index = vvix_common.index.strftime('%Y-%m-%d')
-                    
-                    vvix_vix_ratio = vvix_common["Close"] / vix_common["Close"]
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=vvix_common.index,
-                            y=vvix_vix_ratio,
-                            name='VVIX/VIX',
-                            mode='lines',
-                            line=dict(color='#F44336', width=2),
-                            legendgroup="row4",
-                            showlegend=True
-                        ),
-                        row=4, col=1
-                    )
-        
-        # ICE BofA US High Yield Index 데이터 추가 (5번째 subplot)
-        try:
-            fred = Fred(api_key=FRED_API_KEY)
-            
-            # 선택된 기간에 따라 날짜 범위 계산 - selected_period와 정확히 일치
-            if selected_period == 'MAX':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '10Y':
-                start_date_fred = datetime.now() - timedelta(days=3650)
-                end_date_fred = datetime.now()
-            elif selected_period == '5Y':
-                start_date_fred = datetime.now() - timedelta(days=1825)
-                end_date_fred = datetime.now()
-            elif selected_period == '2Y':
-                start_date_fred = datetime.now() - timedelta(days=730)
-                end_date_fred = datetime.now()
-            elif selected_period == '1Y':
-                start_date_fred = datetime.now() - timedelta(days=365)
-                end_date_fred = datetime.now()
-            elif selected_period == '6MO':
-                start_date_fred = datetime.now() - timedelta(days=180)
-                end_date_fred = datetime.now()
-            elif selected_period == '3MO':
-                start_date_fred = datetime.now() - timedelta(days=90)
-                end_date_fred = datetime.now()
-            elif selected_period == '1MO':
-                start_date_fred = datetime.now() - timedelta(days=30)
-                end_date_fred = datetime.now()
-            elif selected_period == '5D':
-                start_date_fred = datetime.now() - timedelta(days=5)
-                end_date_fred = datetime.now()
-            elif selected_period == '1D':
-                start_date_fred = datetime.now() - timedelta(days=1)
-                end_date_fred = datetime.now()
-            else:  # YTD
-                start_date_fred = datetime(datetime.now().year, 1, 1)
-                end_date_fred = datetime.now()
-            
-            # FRED에서 High Yield Spread 데이터 가져오기
-            high_yield_spread = fred.get_series('BAMLH0A0HYM2', observation_start=start_date_fred.strftime('%Y-%m-%d'), observation_end=end_date_fred.strftime('%Y-%m-%d'))
-            
-            if not high_yield_spread.empty:
-                # 선택된 기간에 따라 필터링
-                start_datetime = pd.to_datetime(start_date_fred)
-                end_datetime = pd.to_datetime(end_date_fred)
-                
-                filtered_spread = high_yield_spread[
-                    (high_yield_spread.index >= start_datetime) & 
-                    (high_yield_spread.index <= end_datetime)
-                ]
-                
-                if not filtered_spread.empty:
-                    # 날짜 형식 확인 및 수정
-                    filtered_spread.index = pd.to_datetime(filtered_spread.index)
-                    # 타임존 제거하여 다른 데이터와 일치시키기
-                    filtered_spread.index = filtered_spread.index.tz_localize(None)
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=filtered_spread.index,
-                            y=filtered_spread.values,
-                            name='ICE BofA US High Yield Index Option-Adjusted Spread',
-                            mode='lines',
-                            line=dict(color='purple', width=2),
-                            legendgroup="row5",
-                            showlegend=True
-                        ),
-                        row=5, col=1
-                    )
-                    
-                    # ICE BofA 제목은 go.Scatter의 name으로 표시
-                    
-                    
-                    
-        except Exception as e:
-            st.write(f"ICE BofA 데이터 로드 실패: {e}")
-        
-        # 통합 레이아웃 설정
-        # 각 subplot에 개별 legend를 표시하기 위해 showlegend=False로 설정하고
-        # 각 subplot의 위치에 legend를 배치
-        fig.update_layout(
-            height=1700,  # 2개 subplot을 위해 높이 조정
-            plot_bgcolor='rgba(248, 249, 250, 0.8)',
-            paper_bgcolor='white',
-            font=dict(family="Arial", size=12, color='#2c3e50'),
-            showlegend=True,  # legend 활성화
-            legend=dict(
-                orientation="h",  # 가로 방향
-                x=0,  # 그래프 프레임 왼쪽 경계와 일치
-                y=1.02,  # 상단 (약간 위로)
-                xanchor="left",
-                yanchor="bottom",
-                bgcolor='rgba(0, 0, 0, 0)',  # 투명 배경
-                bordercolor='rgba(0, 0, 0, 0)',  # 투명 테두리
-                borderwidth=0,  # 테두리 제거
-                font=dict(
-                    size=11,
-                    color='#2c3e50',
-                    family="Arial"
-                ),
-                itemclick="toggleothers",  # 클릭 시 다른 항목은 유지하고 선택한 항목만 토글
-                itemdoubleclick="toggle",  # 더블클릭 시 해당 항목만 토글
-                traceorder="normal",  # 정상 순서
-                itemsizing="constant",  # 일정한 크기
-                itemwidth=30  # 아이템 너비 설정
-            ),
-            margin=dict(t=80, b=30, l=50, r=30),  # 상단 마진 추가로 레전드 공간 확보
-            hovermode='x unified',  # x축 통합 모드로 완전한 동기화
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.9)',
-                bordercolor='#bdc3c7',
-                font_size=12,
-                font_family="Arial"
-            )
-        )
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # row_heights = [0.2667, 0.1833, 0.1833, 0.1833, 0.1833], vertical_spacing = 0.03
-        # 각 subplot의 y 위치 계산 (상단부터, paper 좌표계 사용)
-        # Row 1: y_top = 1.0, y_bottom = 1.0 - 0.2667 = 0.7333
-        # Row 2: y_top = 0.7333 - 0.03 = 0.7033, y_bottom = 0.7033 - 0.1833 = 0.52
-        # Row 3: y_top = 0.52 - 0.03 = 0.49, y_bottom = 0.49 - 0.1833 = 0.3067
-        # Row 4: y_top = 0.3067 - 0.03 = 0.2767, y_bottom = 0.2767 - 0.1833 = 0.0934
-        # Row 5: y_top = 0.0934 - 0.03 = 0.0634, y_bottom = 0.0634 - 0.1833 = -0.1199
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # Plotly에서는 subplot별로 개별 legend를 직접 설정할 수 없지만
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치할 수 있습니다
-        
-        # 각 subplot에 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치
-        # 실제 구현: 각 subplot에 대해 개별 legend를 표시하기 위해
-        # 각 trace의 legendgroup을 사용하여 그룹화하고
-        # 각 subplot의 위치에 legend를 배치하는 방법을 사용
-        
-        # x축 개별 표시 및 스타일링 (각 그래프 하단에 날짜 표시)
-        # Row 1: S&P 500 + NASDAQ
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=1, col=1
-        )
-        # Row 2: FED Funds Rate + US 10-Year Treasury vs MOVE Index
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=2, col=1
-        )
-        # Row 3: VIX + VVIX
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=3, col=1
-        )
-        # Row 4: VVIX/VIX
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=4, col=1
-        )
-        # Row 5: ICE BofA
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            title_font=dict(size=13, color='#2c3e50'),
-            row=5, col=1
-        )
-        
-        
-        # y축 스타일링 및 제목 설정
-        # Row 2: FED Funds Rate + US 10-Year Treasury (왼쪽) + MOVE Index (오른쪽)
-        fig.update_yaxes(
-            title_text="Rate (%)",
-            title_font=dict(size=14, color='#2c3e50'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=2, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="MOVE Index",
-            title_font=dict(size=14, color='#2196F3'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=2, col=1, secondary_y=True
-        )
-        
-        # Row 3: VIX (왼쪽) + VVIX (오른쪽)
-        fig.update_yaxes(
-            title_text="VIX",
-            title_font=dict(size=14, color='#1A237E'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=3, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="VVIX",
-            title_font=dict(size=14, color='#FF9800'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=3, col=1, secondary_y=True
-        )
-        
-        # Row 4: VVIX/VIX
-        fig.update_yaxes(
-            title_text="VVIX/VIX",
-            title_font=dict(size=14, color='#F44336'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=4, col=1
-        )
-        
-        # Row 5: ICE BofA US High Yield Index
-        fig.update_yaxes(
-            title_text="Spread (%)",
-            title_font=dict(size=14, color='purple'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=5, col=1
-        )
-        
-        # Row 1: S&P 500 (왼쪽) + NASDAQ (오른쪽)
-        fig.update_yaxes(
-            title_text="S&P 500",
-            title_font=dict(size=14, color='#2E7D32'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(189, 195, 199, 0.3)',
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=1, col=1, secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="NASDAQ",
-            title_font=dict(size=14, color='#1976D2'),
-            title_standoff=10,
-            automargin=True,
-            showgrid=False,  # 오른쪽 축은 그리드 제거 (중복 방지)
-            showline=True,
-            linewidth=1,
-            linecolor='#34495e',
-            mirror=True,
-            tickfont=dict(size=11, color='#2c3e50'),
-            row=1, col=1, secondary_y=True
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # ICE BofA 그래프는 이제 subplot에 포함됨
-        
-        # 차트 옵션 제거됨
-        
-        # 가격 차트 제거됨
-            
-        # S&P 500 subplots와 ICE BofA 그래프만 유지
-        # 다른 차트들은 제거됨
-            
-        # 변동성 차트 제거됨
-        
-        # 상관관계 분석 제거됨
-    
- 
\ No newline at end of file
+        # 갱신에 실패했거나 시간이 초과된 경우 (다음 실행에서 다시 시도)
+        stale_notice.caption(f"{format_age(stale_state.max_age)} 전 저장된 데이터입니다. 최신 데이터를 받지 못했습니다.")
+        st.session_state.stale_revalidated = False
+else:
+    st.session_state.stale_pending = []
+    st.session_state.stale_revalidated = False
@@ -0,0 +1,153 @@
+from datetime import datetime, time
+
+import numpy as np
+import pandas as pd
+import pytz
+
+# 거래소 거래일/세션 달력 (NYSE, KRX, FX)
+# 날짜 반복문에서 휴장일(주말, 공휴일)에 대한 요청을 미리 걸러내고,
+# 받은 시계열에서 휴장일 행을 벡터 연산 한 번으로 제거하는 데 사용한다.
+# 매년 거래소 공지(연간 휴장일)에 맞춰 다음 해 날짜를 추가할 것 (목록에 없는 연도는 주말만 휴장일로 처리)
+
+# NYSE 휴장일 (주말 제외)
+NYSE_HOLIDAYS = pd.DatetimeIndex([
+    # 2022
+    '2022-01-17', '2022-02-21', '2022-04-15', '2022-05-30', '2022-06-20', '2022-07-04',
+    '2022-09-05', '2022-11-24', '2022-12-26',
+    # 2023
+    '2023-01-02', '2023-01-16', '2023-02-20', '2023-04-07', '2023-05-29', '2023-06-19',
+    '2023-07-04', '2023-09-04', '2023-11-23', '2023-12-25',
+    # 2024
+    '2024-01-01', '2024-01-15', '2024-02-19', '2024-03-29', '2024-05-27', '2024-06-19',
+    '2024-07-04', '2024-09-02', '2024-11-28', '2024-12-25',
+    # 2025
+    '2025-01-01', '2025-01-09', '2025-01-20', '2025-02-17', '2025-04-18', '2025-05-26',
+    '2025-06-19', '2025-07-04', '2025-09-01', '2025-11-27', '2025-12-25',
+    # 2026
+    '2026-01-01', '2026-01-19', '2026-02-16', '2026-04-03', '2026-05-25', '2026-06-19',
+    '2026-07-03', '2026-09-07', '2026-11-26', '2026-12-25',
+])
+
+# KRX 휴장일 (주말 제외, 대체공휴일/임시공휴일/선거일/연말 휴장일 포함)
+KRX_HOLIDAYS = pd.DatetimeIndex([
+    # 2024
+    '2024-01-01', '2024-02-09', '2024-02-12', '2024-03-01', '2024-04-10', '2024-05-01',
+    '2024-05-06', '2024-05-15', '2024-06-06', '2024-08-15', '2024-09-16', '2024-09-17',
+    '2024-09-18', '2024-10-01', '2024-10-03', '2024-10-09', '2024-12-25', '2024-12-31',
+    # 2025
+    '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+    '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03', '2025-06-06', '2025-08-15',
+    '2025-10-03', '2025-10-06', '2025-10-07', '2025-10-08', '2025-10-09', '2025-12-25',
+    '2025-12-31',
+    # 2026
+    '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02', '2026-05-01',
+    '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17', '2026-09-24', '2026-09-25',
+    '2026-10-05', '2026-10-09', '2026-12-25', '2026-12-31',
+])
+
+# FX는 평일 24시간 거래, 매년 1/1과 12/25만 사실상 휴장 (월, 일)
+FX_CLOSED_DAYS = [(1, 1), (12, 25)]
+
+# 시장별 정규 세션 (현지 시간대, 개장, 마감)
+# FX 일봉은 뉴욕 17:00 기준으로 하루가 바뀜 (전날 17:00 ~ 당일 17:00)
+SESSIONS = {
+    'NYSE': (pytz.timezone('America/New_York'), time(9, 30), time(16, 0)),
+    'KRX': (pytz.timezone('Asia/Seoul'), time(9, 0), time(15, 30)),
+    'FX': (pytz.timezone('America/New_York'), time(17, 0), time(17, 0)),
+}
+
+
+def _session_dates(index):
+    """인덱스를 (현지) 날짜로 변환 - 타임존이 있으면 현지 시각 기준 날짜 유지"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def is_trading_day(index, market):
+    """날짜 인덱스에 대한 거래일 여부 (bool 배열, 벡터 연산)"""
+    dates = _session_dates(index)
+    mask = dates.dayofweek < 5
+    if market == 'NYSE':
+        mask &= ~dates.isin(NYSE_HOLIDAYS)
+    elif market == 'KRX':
+        mask &= ~dates.isin(KRX_HOLIDAYS)
+    elif market == 'FX':
+        for month, day in FX_CLOSED_DAYS:
+            mask &= ~((dates.month == month) & (dates.day == day))
+    else:
+        raise ValueError(f"지원하지 않는 시장: {market}")
+    return np.asarray(mask)
+
+
+def trading_days(start, end, market):
+    """start ~ end (양 끝 포함) 사이의 거래일"""
+    days = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq='D')
+    return days[is_trading_day(days, market)]
+
+
+def filter_trading_days(data, market):
+    """DataFrame/Series에서 휴장일 행 제거"""
+    if data is None or len(data) == 0:
+        return data
+    return data[is_trading_day(data.index, market)]
+
+
+def session_range(start, end, market):
+    """start ~ end 사이 거래일별 세션 (개장, 마감) 시각 (UTC)"""
+    tz, open_time, close_time = SESSIONS[market]
+    days = trading_days(start, end, market)
+    opens = [tz.localize(datetime.combine(day.date(), open_time)) for day in days]
+    closes = [tz.localize(datetime.combine(day.date(), close_time)) for day in days]
+    if market == 'FX':
+        # FX 세션은 전날 17:00에 시작
+        opens = [opened - pd.Timedelta(days=1) for opened in opens]
+    return pd.DataFrame({
+        'Open': pd.DatetimeIndex(opens).tz_convert('UTC'),
+        'Close': pd.DatetimeIndex(closes).tz_convert('UTC'),
+    }, index=days)
+
+
+def session_close(day, market):
+    """거래일 day의 세션 마감 시각 (현지 시간대)"""
+    tz, _, close_time = SESSIONS[market]
+    return tz.localize(datetime.combine(pd.Timestamp(day).date(), close_time))
+
+
+def last_closed_session(market, now=None):
+    """now 기준 가장 최근에 마감한 거래일 (날짜)"""
+    tz = SESSIONS[market][0]
+    now = now if now is not None else datetime.now(pytz.utc)
+    local_now = now.astimezone(tz)
+    days = trading_days(local_now.date() - pd.Timedelta(days=14), local_now.date(), market)
+    for day in reversed(days):
+        if session_close(day, market) <= local_now:
+            return day
+    return None
+
+
+def in_session(market, now=None):
+    """now가 오늘 세션(개장 ~ 마감) 중인지 여부"""
+    tz, open_time, close_time = SESSIONS[market]
+    now = now if now is not None else datetime.now(pytz.utc)
+    local_now = now.astimezone(tz)
+    if market == 'FX':
+        # 평일 24시간 (일요일 17:00 ~ 금요일 17:00, 뉴욕)
+        weekday = local_now.weekday()
+        if weekday == 5 or (weekday == 6 and local_now.time() < close_time) or \
+                (weekday == 4 and local_now.time() >= close_time):
+            return False
+        return bool(is_trading_day([local_now.replace(tzinfo=None)], market)[0]) or local_now.time() >= close_time
+    if not is_trading_day([local_now.replace(tzinfo=None)], market)[0]:
+        return False
+    return open_time <= local_now.time() < close_time
+
+
+def market_of(ticker):
+    """티커가 거래되는 시장 (KRX/FX/NYSE)"""
+    if ticker.startswith('^KS') or ticker.endswith(('.KS', '.KQ')):
+        return 'KRX'
+    if ticker.endswith('=X'):
+        return 'FX'
+    return 'NYSE'
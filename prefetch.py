@@ -0,0 +1,134 @@
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+from fred_mirror import sync_all
+from price_store import warm_store
+from universe import ALL_TICKERS, FRED_SERIES, FX_TICKERS, KRX_TICKERS, US_TICKERS
+
+# 백그라운드 미리 받기 스케줄러
+# 사용자가 몰리는 아침 첫 로드 전에 가격 저장소와 FRED 미러를 미리 갱신해 두어
+# 페이지에서는 저장된 데이터만 읽도록 한다.
+#
+# 실행 방법
+#   앱 프로세스 안에서: PREFETCH_MODE=inprocess (main.py가 start_prefetch() 호출)
+#   별도 프로세스로:   PREFETCH_MODE=sidecar 로 앱 실행 + python prefetch.py
+#   한 번만 갱신:      python prefetch.py once
+
+KST = pytz.timezone('Asia/Seoul')
+NEW_YORK = pytz.timezone('America/New_York')
+WEEKDAYS = (0, 1, 2, 3, 4)
+
+
+class PrefetchJob:
+    """정해진 현지 시각(거래소 시간대)에 종목/시리즈 목록을 갱신하는 작업"""
+
+    def __init__(self, name, timezone, hour, minute, tickers=(), fred_series=(), weekdays=WEEKDAYS):
+        self.name = name
+        self.timezone = timezone
+        self.hour = hour
+        self.minute = minute
+        self.tickers = list(tickers)
+        self.fred_series = list(fred_series)
+        self.weekdays = weekdays
+
+    def next_run(self, now):
+        """now(UTC, tz-aware) 이후 처음 실행할 시각 (UTC)"""
+        local_now = now.astimezone(self.timezone)
+        for days in range(8):
+            day = local_now.date() + timedelta(days=days)
+            if day.weekday() not in self.weekdays:
+                continue
+            run_at = self.timezone.localize(datetime(day.year, day.month, day.day, self.hour, self.minute))
+            if run_at > local_now:
+                return run_at.astimezone(pytz.utc)
+        return None
+
+
+# 거래소 마감 후 최종 봉이 반영될 시각에 맞춘 갱신 일정
+JOBS = [
+    PrefetchJob('krx_close', KST, 15, 45, tickers=KRX_TICKERS),            # KRX 15:30 마감
+    PrefetchJob('us_close', NEW_YORK, 16, 30, tickers=US_TICKERS),          # NYSE 16:00 마감
+    PrefetchJob('fx_close', NEW_YORK, 17, 15, tickers=FX_TICKERS),          # FX 일봉 17:00 (뉴욕) 기준
+    PrefetchJob('fred', NEW_YORK, 18, 0, fred_series=FRED_SERIES),          # FRED 일별 시리즈 저녁 반영
+    # 서울 개장 전 전체 점검 (위 작업이 실패했거나 서버가 꺼져 있던 경우 보완, 증분 갱신이라 가벼움)
+    PrefetchJob('pre_open', KST, 8, 0, tickers=ALL_TICKERS, fred_series=FRED_SERIES),
+]
+
+
+def run_job(job):
+    """작업 하나 실행 (가격 저장소 일괄 갱신 + FRED 동기화)"""
+    started = time.monotonic()
+    failed = []
+    if job.tickers:
+        rows = warm_store(job.tickers)
+        failed += [ticker for ticker, count in rows.items() if not count]
+    if job.fred_series:
+        counts = sync_all(job.fred_series)
+        failed += [series_id for series_id, count in counts.items() if count is None]
+
+    elapsed = time.monotonic() - started
+    print(f"[prefetch] {job.name}: {len(job.tickers)}개 종목, {len(job.fred_series)}개 FRED 시리즈 "
+          f"({elapsed:.1f}초, 실패: {', '.join(failed) if failed else '없음'})")
+    return failed
+
+
+def warm_all():
+    """전체 목록을 지금 바로 갱신"""
+    return run_job(PrefetchJob('warm_all', KST, 0, 0, tickers=ALL_TICKERS, fred_series=FRED_SERIES))
+
+
+def run_forever(stop_event=None, warm_on_start=True):
+    """일정에 따라 작업을 계속 실행 (stop_event가 설정되면 종료)"""
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    if warm_on_start:
+        warm_all()
+
+    while not stop_event.is_set():
+        now = datetime.now(pytz.utc)
+        schedule = [(job.next_run(now), job) for job in JOBS]
+        run_at, job = min(((run_at, job) for run_at, job in schedule if run_at is not None),
+                          key=lambda item: item[0])
+        print(f"[prefetch] 다음 작업: {job.name} ({run_at.astimezone(KST):%Y-%m-%d %H:%M} KST)")
+
+        if stop_event.wait(max(0.0, (run_at - datetime.now(pytz.utc)).total_seconds())):
+            break
+        try:
+            run_job(job)
+        except Exception as e:
+            print(f"[prefetch] {job.name} 실패: {e}")
+
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def start_prefetch():
+    """앱 프로세스 안에서 스케줄러 시작 (프로세스당 한 번만 실행됨)"""
+    global _thread
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=run_forever, name='prefetch', daemon=True)
+            _thread.start()
+    return _thread
+
+
+if __name__ == '__main__':
+    # 사용법: python prefetch.py [run | once]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'run'
+
+    if command == 'run':
+        try:
+            run_forever()
+        except KeyboardInterrupt:
+            pass
+    elif command == 'once':
+        sys.exit(1 if warm_all() else 0)
+    else:
+        print("사용법: python prefetch.py [run | once]")
+        sys.exit(1)
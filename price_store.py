@@ -0,0 +1,553 @@
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from alignment import DAILY_INTERVALS, normalize_index
+from config import DATA_DIR, PREFETCH_MODE, PREFETCH_MAX_AGE
+from data_cache import revalidate, single_flight
+from lazy_imports import lazy_module
+from market_calendar import in_session, last_closed_session, market_of, session_close
+from rate_limit import throttle
+from universe import ALL_TICKERS
+
+# 티커/주기별 OHLCV 히스토리를 디스크에 저장하는 로컬 가격 저장소
+# 페이지에서는 yf.Ticker(...).history() 대신 get_history()를 호출하고,
+# 저장소가 비어 있거나 오래된 경우에만 Yahoo Finance에서 전체 히스토리를 받는다.
+
+# yfinance는 실제로 다운로드할 때만 import (저장소에서 바로 반환되는 실행에서는 불필요)
+yf = lazy_module('yfinance')
+
+STORE_DIR = os.path.join(DATA_DIR, 'prices')
+
+# 저장된 히스토리를 새로 받지 않고 그대로 사용하는 최대 경과 시간 (초)
+STORE_MAX_AGE = int(os.getenv('PRICE_STORE_MAX_AGE', '3600'))
+
+# 주기별 최대 다운로드 기간 (Yahoo는 분봉/시간봉의 조회 기간을 제한함)
+MAX_PERIOD_BY_INTERVAL = {
+    '1m': '7d',
+    '2m': '60d',
+    '5m': '60d',
+    '15m': '60d',
+    '30m': '60d',
+    '60m': '730d',
+    '90m': '60d',
+    '1h': '730d',
+}
+
+# 증분 갱신 사용 여부 (끄면 오래된 티커는 항상 전체 히스토리를 다시 받음)
+INCREMENTAL_REFRESH = os.getenv('PRICE_STORE_INCREMENTAL', '1') != '0'
+
+# 증분 갱신 시 마지막 저장 봉보다 앞에서부터 다시 받는 겹침 구간 (일)
+# 겹친 봉을 비교해 과거 데이터 수정(배당 조정 등) 여부를 판단한다.
+INCREMENTAL_OVERLAP_DAYS = 7
+
+# 과거 봉 수정이 감지되었을 때 다시 받는 구간 (일)
+REVISION_WINDOW_DAYS = int(os.getenv('PRICE_STORE_REVISION_DAYS', '400'))
+
+# 겹친 봉의 종가가 이 비율 이상 다르면 수정된 것으로 판단
+REVISION_TOLERANCE = 1e-6
+
+# 세션 마감 후 Yahoo 일봉이 확정될 때까지의 여유 시간 (분)
+# 마감 + 이 시간 이후에 받은 저장소만 마지막 봉을 확정 봉으로 취급한다.
+SESSION_SETTLE_MINUTES = int(os.getenv('PRICE_STORE_SETTLE_MINUTES', '15'))
+
+# Parquet 엔진이 없으면 pickle로 저장 (pyarrow 권장)
+try:
+    import pyarrow  # noqa: F401
+    FILE_EXT = '.parquet'
+except ImportError:
+    FILE_EXT = '.pkl'
+
+_write_lock = threading.Lock()
+
+
+def _store_path(ticker, interval):
+    """티커/주기에 해당하는 저장 파일 경로"""
+    # '^GSPC', 'AUDUSD=X' 같은 티커도 파일명으로 쓸 수 있도록 인코딩
+    return os.path.join(STORE_DIR, interval, quote(ticker, safe='') + FILE_EXT)
+
+
+def _canonical_index(frame, interval):
+    """저장/병합용 인덱스로 통일 - 일봉 이상은 거래소 현지 날짜(타임존 없음), 분봉/시간봉은 UTC 시각
+
+    일괄 다운로드와 yf.Ticker().history()가 돌려주는 인덱스 형식이 달라 섞이면 병합 시
+    tz-naive/tz-aware 비교 오류가 나므로 저장/병합 전에 한 형식으로 맞춘다.
+    """
+    if frame is None or not isinstance(frame.index, pd.DatetimeIndex):
+        return frame
+    if interval in DAILY_INTERVALS:
+        if frame.index.tz is None:
+            return frame
+        frame = frame.copy()
+        frame.index = frame.index.tz_localize(None)
+        return frame
+    if frame.index.tz is None:
+        # 현지 시각인지 UTC인지 알 수 없는 분봉은 사용하지 않음
+        raise ValueError("타임존 없는 분봉/시간봉 인덱스")
+    frame = frame.copy()
+    frame.index = frame.index.tz_convert('UTC')
+    return frame
+
+
+def load_history(ticker, interval='1d'):
+    """저장소에서 전체 히스토리 읽기 (없으면 None)"""
+    path = _store_path(ticker, interval)
+    if not os.path.exists(path):
+        return None
+    try:
+        if FILE_EXT == '.parquet':
+            history = pd.read_parquet(path)
+        else:
+            history = pd.read_pickle(path)
+        # 이전 버전에서 다른 인덱스 형식으로 저장한 파일도 같은 형식으로 읽기
+        # (타임존 없는 분봉 파일은 읽기 실패로 처리 -> 전체를 다시 받음)
+        return _canonical_index(history, interval)
+    except Exception as e:
+        print(f"가격 저장소 읽기 실패 ({ticker}, {interval}): {e}")
+        return None
+
+
+def save_history(ticker, history, interval='1d'):
+    """전체 히스토리를 저장소에 기록 (임시 파일 작성 후 교체)"""
+    path = _store_path(ticker, interval)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with _write_lock:
+        if FILE_EXT == '.parquet':
+            history.to_parquet(tmp_path)
+        else:
+            history.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+
+def history_age(ticker, interval='1d'):
+    """저장된 히스토리의 경과 시간 (초, 없으면 None)"""
+    path = _store_path(ticker, interval)
+    if not os.path.exists(path):
+        return None
+    return time.time() - os.path.getmtime(path)
+
+
+def _fetch_history(ticker, interval):
+    """Yahoo Finance에서 전체 히스토리 다운로드"""
+    period = MAX_PERIOD_BY_INTERVAL.get(interval, 'max')
+    throttle('yahoo')
+    return _canonical_index(yf.Ticker(ticker).history(period=period, interval=interval), interval)
+
+
+def _fetch_range(ticker, interval, start):
+    """Yahoo Finance에서 start 이후 구간만 다운로드"""
+    throttle('yahoo')
+    return _canonical_index(yf.Ticker(ticker).history(start=start, interval=interval), interval)
+
+
+def _merge_bars(stored, fetched):
+    """저장된 히스토리에 새로 받은 봉 병합 (같은 날짜는 새 데이터 우선)"""
+    merged = pd.concat([stored, fetched])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index()
+
+
+def _bars_revised(stored, fetched, before):
+    """before 이전의 겹친 봉 중 종가가 달라진 것이 있는지 확인"""
+    common = stored.index.intersection(fetched.index)
+    common = common[common < before]
+    if len(common) == 0 or 'Close' not in stored.columns or 'Close' not in fetched.columns:
+        return False
+    old_close = stored.loc[common, 'Close'].to_numpy(dtype=float)
+    new_close = fetched.loc[common, 'Close'].to_numpy(dtype=float)
+    return not np.allclose(old_close, new_close, rtol=REVISION_TOLERANCE, equal_nan=True)
+
+
+def _up_to_date(ticker, interval, stored, now=None):
+    """일봉: 장중이 아니고, 가장 최근 마감 거래일의 봉을 세션 마감 이후에 받았다면 새로 받을 봉이 없음
+
+    장중에 받은 봉은 미완성 봉이므로 날짜가 같아도 마감 이후에 다시 받는다.
+    """
+    if interval != '1d' or stored is None or stored.empty:
+        return False
+    market = market_of(ticker)
+    last_session = last_closed_session(market, now)
+    if last_session is None or in_session(market, now):
+        return False
+    last_bar = stored.index[-1]
+    if last_bar.tzinfo is not None:
+        last_bar = last_bar.tz_localize(None)
+    if last_bar.normalize() < last_session:
+        return False
+    # 저장소를 마지막으로 받은(확인한) 시각이 세션 마감(+확정 여유 시간) 이전이면 미완성 봉일 수 있음
+    path = _store_path(ticker, interval)
+    if not os.path.exists(path):
+        return False
+    settled = session_close(last_session, market) + pd.Timedelta(minutes=SESSION_SETTLE_MINUTES)
+    return os.path.getmtime(path) >= settled.timestamp()
+
+
+def _past_settle(ticker, interval, now=None):
+    """일봉: 장중이 아니고 가장 최근 마감 세션의 확정 여유 시간까지 지났는지 (이후 확인한 결과만 확정으로 기록)"""
+    if interval != '1d':
+        return True
+    market = market_of(ticker)
+    if in_session(market, now):
+        return False
+    last_session = last_closed_session(market, now)
+    if last_session is None:
+        return True
+    settled = session_close(last_session, market) + pd.Timedelta(minutes=SESSION_SETTLE_MINUTES)
+    current = pd.Timestamp(now) if now is not None else pd.Timestamp.now(tz='UTC')
+    return current >= settled
+
+
+def refresh_history(ticker, interval='1d', full=False):
+    """저장소 갱신: 마지막 저장 봉 이후만 받아 병합하고, 과거 봉이 수정되었으면 일정 구간을 다시 받기"""
+    stored = None if full else load_history(ticker, interval)
+
+    if stored is None or stored.empty or not INCREMENTAL_REFRESH:
+        fetched = _fetch_history(ticker, interval)
+        if fetched is not None and not fetched.empty:
+            save_history(ticker, fetched, interval)
+            return fetched
+        return stored
+
+    # 휴장일/주말에는 마감한 세션이 없으므로 요청하지 않음 (확인 시점만 기록)
+    if _up_to_date(ticker, interval, stored):
+        os.utime(_store_path(ticker, interval))
+        return stored
+
+    last_bar = stored.index[-1]
+    delta = _fetch_range(ticker, interval, last_bar - pd.Timedelta(days=INCREMENTAL_OVERLAP_DAYS))
+    return _apply_delta(ticker, interval, stored, delta)
+
+
+def _apply_delta(ticker, interval, stored, delta):
+    """증분 데이터를 저장된 히스토리에 반영 (과거 봉 수정 시 일정 구간 다시 받기)"""
+    last_bar = stored.index[-1]
+
+    if delta is None:
+        # 받지 못한 경우 (확인 시점을 기록하지 않음 - 다음 조회에서 다시 시도)
+        return stored
+    if delta.empty:
+        # 새 봉이 없어도 확인한 시점을 기록해 다음 조회에서 다시 받지 않도록 함
+        # (장중/마감 직후에 기록하면 미완성 봉이 확정 봉으로 취급되므로 확정 여유 시간 이후에만)
+        if _past_settle(ticker, interval):
+            os.utime(_store_path(ticker, interval))
+        return stored
+
+    # 마지막 저장 봉은 장중 미완성 봉일 수 있으므로 그 이전 봉만 비교
+    if _bars_revised(stored, delta, before=last_bar):
+        window_start = last_bar - pd.Timedelta(days=REVISION_WINDOW_DAYS)
+        window = _fetch_range(ticker, interval, window_start)
+        if window is None or window.empty:
+            return stored
+
+        # 수정이 다시 받은 구간의 시작까지 이어져 있으면 전체를 다시 받음
+        first_bar = window.index[0]
+        if _bars_revised(stored, window.iloc[:1], before=last_bar):
+            print(f"{ticker} 과거 데이터가 {REVISION_WINDOW_DAYS}일 이전까지 수정되어 전체 히스토리를 다시 받습니다.")
+            return refresh_history(ticker, interval, full=True)
+
+        print(f"{ticker} 과거 데이터 수정 감지: {first_bar.date()} 이후 구간 갱신")
+        delta = window
+
+    merged = _merge_bars(stored, delta)
+    save_history(ticker, merged, interval)
+    return merged
+
+
+def _download(tickers, interval, **kwargs):
+    """여러 티커를 한 번의 요청으로 받아 티커별 DataFrame으로 분리"""
+    # 일봉: ignore_tz=True로 거래소 현지 날짜 그대로 받기 (여러 거래소 티커를 섞어도 날짜가 밀리지 않음)
+    # 분봉/시간봉: 타임존 있는 시각으로 받아 UTC로 통일
+    # 내부적으로 티커마다 요청하므로 티커 수만큼 토큰 사용
+    throttle('yahoo', tokens=len(tickers))
+    raw = yf.download(
+        tickers,
+        interval=interval,
+        group_by='ticker',
+        auto_adjust=True,
+        actions=True,
+        threads=True,
+        progress=False,
+        ignore_tz=interval in DAILY_INTERVALS,
+        **kwargs
+    )
+    frames = {}
+    if raw is None or raw.empty:
+        return frames
+
+    if isinstance(raw.columns, pd.MultiIndex):
+        available = set(raw.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker in available:
+                frames[ticker] = _canonical_index(raw[ticker].dropna(subset=['Close']), interval)
+    else:
+        # 구버전 yfinance는 티커가 하나면 단일 컬럼으로 반환
+        frames[tickers[0]] = _canonical_index(raw.dropna(subset=['Close']), interval)
+    return frames
+
+
+def refresh_histories(tickers, interval='1d', full=False):
+    """여러 티커 일괄 갱신: 없는 티커는 전체, 있는 티커는 마지막 봉 이후만 한 번의 요청으로 받기"""
+    stored = {ticker: None if full else load_history(ticker, interval) for ticker in tickers}
+    missing = [t for t in tickers if stored[t] is None or stored[t].empty or not INCREMENTAL_REFRESH]
+    existing = [t for t in tickers if t not in missing]
+    result = {}
+
+    # 마지막 마감 세션까지 이미 받은 티커는 요청에서 제외 (확인 시점만 기록)
+    for ticker in [t for t in existing if _up_to_date(t, interval, stored[t])]:
+        os.utime(_store_path(ticker, interval))
+        result[ticker] = stored[ticker]
+        existing.remove(ticker)
+
+    if missing:
+        frames = _download(missing, interval, period=MAX_PERIOD_BY_INTERVAL.get(interval, 'max'))
+        for ticker in missing:
+            fetched = frames.get(ticker)
+            if fetched is not None and not fetched.empty:
+                save_history(ticker, fetched, interval)
+                result[ticker] = fetched
+            else:
+                result[ticker] = stored[ticker]
+
+    if existing:
+        start = min(stored[t].index[-1] for t in existing) - pd.Timedelta(days=INCREMENTAL_OVERLAP_DAYS)
+        frames = _download(existing, interval, start=start.strftime('%Y-%m-%d'))
+        for ticker in existing:
+            delta = frames.get(ticker)
+            result[ticker] = _apply_delta(ticker, interval, stored[ticker], delta)
+
+    return result
+
+
+def _to_index_time(value, index):
+    """날짜 값을 인덱스와 같은 타임존의 Timestamp로 변환"""
+    ts = pd.Timestamp(value)
+    if index.tz is not None and ts.tz is None:
+        ts = ts.tz_localize(index.tz)
+    elif index.tz is None and ts.tz is not None:
+        ts = ts.tz_convert(None)
+    return ts
+
+
+def _slice_history(history, period=None, start=None, end=None):
+    """yfinance의 period/start/end 의미에 맞게 로컬에서 구간 자르기"""
+    if history.empty:
+        return history.copy()
+
+    index = history.index
+
+    if start is not None or end is not None:
+        mask = np.ones(len(index), dtype=bool)
+        if start is not None:
+            mask &= index >= _to_index_time(start, index)
+        if end is not None:
+            # yfinance와 동일하게 end는 포함하지 않음
+            mask &= index < _to_index_time(end, index)
+        return history[mask].copy()
+
+    if period is None:
+        return history.copy()
+
+    period = str(period).lower()
+    if period == 'max':
+        return history.copy()
+
+    now = _to_index_time(datetime.now(), index)
+    if period == 'ytd':
+        return history[index >= now.normalize().replace(month=1, day=1)].copy()
+
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if match is None:
+        raise ValueError(f"지원하지 않는 기간입니다: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+
+    # Yahoo의 1d/5d는 달력일이 아니라 최근 거래일 기준
+    if unit == 'd' and n <= 5:
+        return history.tail(n).copy()
+
+    if unit == 'd':
+        offset = pd.DateOffset(days=n)
+    elif unit == 'wk':
+        offset = pd.DateOffset(weeks=n)
+    elif unit == 'mo':
+        offset = pd.DateOffset(months=n)
+    else:
+        offset = pd.DateOffset(years=n)
+    return history[index >= now - offset].copy()
+
+
+def _default_max_age(ticker, interval):
+    """미리 받기(prefetch.py)가 켜져 있으면 대상 종목은 스케줄러가 갱신하므로 페이지에서는 더 오래 그대로 사용"""
+    if PREFETCH_MODE != 'off' and interval == '1d' and ticker in ALL_TICKERS:
+        return PREFETCH_MAX_AGE
+    return STORE_MAX_AGE
+
+
+def get_history(ticker, period=None, start=None, end=None, interval='1d', max_age=None):
+    """yf.Ticker(ticker).history() 대체: 저장소 우선, 오래된 경우에만 새로 받기"""
+    if max_age is None:
+        max_age = _default_max_age(ticker, interval)
+
+    history = load_history(ticker, interval)
+    age = history_age(ticker, interval)
+
+    stale = history is None or age is None or age > max_age
+    # 저장된 데이터가 있으면 먼저 반환하고 갱신은 백그라운드에서 (stale-while-revalidate 모드인 경우)
+    if stale and history is not None and revalidate(('yahoo', ticker, interval), age, refresh_history, ticker, interval):
+        stale = False
+
+    if stale:
+        try:
+            # 여러 세션이 같은 티커를 동시에 요청하면 한 번만 다운로드
+            refreshed = single_flight(('yahoo', ticker, interval), refresh_history, ticker, interval)
+        except Exception as e:
+            print(f"{ticker} 다운로드 실패: {e}")
+            refreshed = None
+
+        if refreshed is not None and not refreshed.empty:
+            history = refreshed
+
+    # 다운로드 실패 시에는 (오래되었더라도) 저장된 데이터 사용
+    if history is None:
+        return pd.DataFrame()
+
+    return _slice_history(history, period=period, start=start, end=end)
+
+
+def _panel_index(index, interval):
+    """여러 티커를 한 패널로 맞추기 위한 인덱스 (일봉 이상은 타임존 없는 날짜)"""
+    return normalize_index(index, intraday=interval not in DAILY_INTERVALS)
+
+
+def get_histories(tickers, period=None, start=None, end=None, interval='1d', max_age=None):
+    """여러 티커를 한 번에 조회해 (티커, 필드) MultiIndex 컬럼의 정렬된 패널로 반환"""
+    tickers = list(dict.fromkeys(tickers))
+
+    histories = {}
+    stale = []
+    for ticker in tickers:
+        histories[ticker] = load_history(ticker, interval)
+        age = history_age(ticker, interval)
+        ticker_max_age = max_age if max_age is not None else _default_max_age(ticker, interval)
+        if histories[ticker] is None or age is None or age > ticker_max_age:
+            stale.append(ticker)
+
+    # 저장된 데이터가 있는 티커는 먼저 반환하고 백그라운드에서 한 번에 갱신 (stale-while-revalidate 모드인 경우)
+    stored = [ticker for ticker in stale if histories[ticker] is not None]
+    if stored:
+        oldest = max(history_age(ticker, interval) or 0 for ticker in stored)
+        if revalidate(('yahoo', tuple(sorted(stored)), interval), oldest, refresh_histories, stored, interval):
+            stale = [ticker for ticker in stale if ticker not in stored]
+
+    # 오래된 티커만 모아서 한 번의 일괄 요청으로 갱신
+    if stale:
+        try:
+            refreshed = single_flight(('yahoo', tuple(sorted(stale)), interval), refresh_histories, stale, interval)
+        except Exception as e:
+            print(f"일괄 다운로드 실패 ({', '.join(stale)}): {e}")
+            refreshed = {}
+        for ticker, history in refreshed.items():
+            if history is not None and not history.empty:
+                histories[ticker] = history
+
+    frames = {}
+    for ticker in tickers:
+        history = histories.get(ticker)
+        if history is None or history.empty:
+            continue
+        sliced = _slice_history(history, period=period, start=start, end=end)
+        sliced.index = _panel_index(sliced.index, interval)
+        frames[ticker] = sliced
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=1).sort_index()
+
+
+def panel_frame(panel, ticker):
+    """패널에서 한 티커의 OHLCV만 꺼내기 (해당 티커의 봉이 없는 행 제외)"""
+    if panel.empty or ticker not in panel.columns.get_level_values(0):
+        return pd.DataFrame()
+    frame = panel[ticker]
+    if 'Close' in frame.columns:
+        return frame.dropna(subset=['Close'])
+    return frame.dropna(how='all')
+
+
+def store_info():
+    """저장소 현황 (티커, 주기, 행 수, 기간, 갱신 시각, 파일 크기)"""
+    rows = []
+    if os.path.isdir(STORE_DIR):
+        for interval in sorted(os.listdir(STORE_DIR)):
+            interval_dir = os.path.join(STORE_DIR, interval)
+            if not os.path.isdir(interval_dir):
+                continue
+            for file_name in sorted(os.listdir(interval_dir)):
+                if not file_name.endswith(FILE_EXT):
+                    continue
+                ticker = unquote(file_name[:-len(FILE_EXT)])
+                path = os.path.join(interval_dir, file_name)
+                history = load_history(ticker, interval)
+                rows.append({
+                    'Ticker': ticker,
+                    'Interval': interval,
+                    'Rows': 0 if history is None else len(history),
+                    'First': None if history is None or history.empty else history.index.min(),
+                    'Last': None if history is None or history.empty else history.index.max(),
+                    'Updated': datetime.fromtimestamp(os.path.getmtime(path)),
+                    'Size (KB)': round(os.path.getsize(path) / 1024, 1),
+                })
+    return pd.DataFrame(rows, columns=['Ticker', 'Interval', 'Rows', 'First', 'Last', 'Updated', 'Size (KB)'])
+
+
+def purge_store(ticker=None, interval=None):
+    """저장소 비우기 (티커/주기를 지정하면 해당 항목만 삭제), 삭제한 파일 수 반환"""
+    removed = 0
+    if not os.path.isdir(STORE_DIR):
+        return removed
+    intervals = [interval] if interval else os.listdir(STORE_DIR)
+    for iv in intervals:
+        interval_dir = os.path.join(STORE_DIR, iv)
+        if not os.path.isdir(interval_dir):
+            continue
+        for file_name in os.listdir(interval_dir):
+            if ticker is not None and file_name != quote(ticker, safe='') + FILE_EXT:
+                continue
+            os.remove(os.path.join(interval_dir, file_name))
+            removed += 1
+    return removed
+
+
+def warm_store(tickers, interval='1d', full=False):
+    """티커 목록을 미리 받아 저장소 채우기 (한 번의 일괄 요청, 기본은 증분 갱신), 티커별 행 수 반환"""
+    tickers = list(dict.fromkeys(tickers))
+    try:
+        histories = refresh_histories(tickers, interval, full=full)
+    except Exception as e:
+        print(f"일괄 다운로드 실패 ({', '.join(tickers)}): {e}")
+        histories = {}
+    return {ticker: 0 if histories.get(ticker) is None else len(histories[ticker]) for ticker in tickers}
+
+
+if __name__ == '__main__':
+    # 사용법: python price_store.py info | purge [TICKER] | warm TICKER [TICKER ...]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'info'
+    args = sys.argv[2:]
+
+    if command == 'info':
+        print(store_info().to_string(index=False))
+    elif command == 'purge':
+        print(f"삭제된 파일: {purge_store(args[0] if args else None)}개")
+    elif command == 'warm':
+        for ticker, rows in warm_store(args).items():
+            print(f"{ticker}: {rows}행")
+    else:
+        print("사용법: python price_store.py info | purge [TICKER] | warm TICKER [TICKER ...]")
+        sys.exit(1)
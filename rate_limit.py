@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+
+import pandas as pd
+
+# 외부 데이터 소스(호스트)별 요청 속도 제한
+# 고정 time.sleep() 대신 실제 요청 직전에 throttle(host)를 호출한다.
+# 허용량(토큰)이 남아 있으면 바로 통과하고, 모두 소진된 경우에만 다음 토큰까지 기다린다.
+# 캐시/저장소에서 바로 반환되는 조회는 요청이 없으므로 지연도 없다.
+
+# 호스트별 (초당 요청 수, 연속 허용 요청 수)
+# 환경 변수 RATE_LIMIT_<HOST> 로 초당 요청 수 변경 가능 (예: RATE_LIMIT_YAHOO=1)
+HOST_LIMITS = {
+    'yahoo': (2.0, 5),      # Yahoo Finance (비공식 API, 과도한 요청 시 429)
+    'fred': (2.0, 10),      # FRED API (공식 한도 분당 120회)
+    'krx': (1.0, 2),        # KRX 정보데이터시스템
+    'finra': (0.5, 2),      # FINRA 웹사이트
+}
+DEFAULT_LIMIT = (1.0, 2)
+
+
+class TokenBucket:
+    """토큰 버킷: rate(초당 토큰)로 채워지고 최대 capacity개까지 쌓임"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1):
+        """토큰을 가져가고 기다린 시간(초) 반환 - 부족할 때만 대기
+
+        capacity보다 많은 토큰(여러 티커 일괄 다운로드)도 전부 차감한다.
+        요청 자신은 capacity만큼만 기다리고, 초과분은 부채(음수 토큰)로 남아 다음 요청이 기다린다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            self.requests += 1
+            # 음수 = 다른 스레드가 먼저 예약한 몫까지 포함한 부족분 (이번 요청의 capacity 초과분은 제외)
+            shortfall = -self.tokens - max(0, tokens - self.capacity)
+            wait = shortfall / self.rate if shortfall > 0 else 0.0
+            if wait > 0:
+                self.throttled += 1
+                self.waited += wait
+        # 잠금 밖에서 대기 (다른 스레드는 자기 순서를 계속 예약할 수 있음)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def _host_limit(host):
+    """호스트별 제한 (환경 변수 우선)"""
+    rate, capacity = HOST_LIMITS.get(host, DEFAULT_LIMIT)
+    env_value = os.getenv(f"RATE_LIMIT_{host.upper()}")
+    if env_value:
+        rate = float(env_value)
+    return rate, capacity
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket(host):
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(*_host_limit(host))
+            _buckets[host] = bucket
+        return bucket
+
+
+def throttle(host, tokens=1):
+    """host로 요청을 보내기 직전에 호출 (필요한 경우에만 대기), 대기한 시간(초) 반환"""
+    return _bucket(host).acquire(tokens)
+
+
+def throttle_stats():
+    """호스트별 요청 수, 대기 횟수, 누적 대기 시간"""
+    with _buckets_lock:
+        buckets = sorted(_buckets.items())
+    rows = []
+    for host, bucket in buckets:
+        rows.append({
+            'Host': host,
+            'Rate (req/s)': bucket.rate,
+            'Burst': bucket.capacity,
+            'Requests': bucket.requests,
+            'Throttled': bucket.throttled,
+            'Waited (s)': round(bucket.waited, 2),
+        })
+    return pd.DataFrame(rows, columns=['Host', 'Rate (req/s)', 'Burst', 'Requests', 'Throttled', 'Waited (s)'])
@@ -0,0 +1,48 @@
+import os
+
+import plotly.graph_objects as go
+
+# 선 그래프 렌더링 방식 (SVG / WebGL) 선택
+# go.Scatter는 SVG로 그려서 점이 많아지면 확대/이동/호버가 느려진다.
+# 차트 하나의 Scatter 점 수 합계가 임계값 이상이면 모든 Scatter를 WebGL(go.Scattergl)로 바꾼다.
+# 한 차트 안에서 SVG와 WebGL을 섞으면 그리는 순서(z-order)가 어긋나므로 차트 단위로 결정한다.
+
+# auto (점 수 기준) | svg (항상 go.Scatter) | webgl (항상 go.Scattergl)
+RENDER_MODE = os.getenv('PLOT_RENDER_MODE', 'auto').lower()
+
+# auto 모드에서 WebGL로 바꾸는 점 수 (차트 하나의 Scatter 점 수 합계)
+WEBGL_POINTS = int(os.getenv('PLOT_WEBGL_POINTS', '10000'))
+
+
+def point_count(fig):
+    """차트의 Scatter 점 수 합계"""
+    return sum(len(trace.x) for trace in fig.data if trace.type == 'scatter' and trace.x is not None)
+
+
+def use_webgl(points, mode=None):
+    """점 수와 렌더링 모드로 WebGL 사용 여부 결정"""
+    mode = RENDER_MODE if mode is None else mode
+    if mode == 'webgl':
+        return True
+    if mode == 'svg':
+        return False
+    return points >= WEBGL_POINTS
+
+
+def _to_webgl(trace):
+    """go.Scatter -> go.Scattergl (Scattergl에 없는 속성은 제외)"""
+    props = trace.to_plotly_json()
+    props.pop('type', None)
+    return go.Scattergl(props, skip_invalid=True)
+
+
+def apply_render_mode(fig, mode=None):
+    """렌더링 모드에 따라 차트의 Scatter를 Scattergl로 변경 (fig를 직접 수정하고 반환)"""
+    if not use_webgl(point_count(fig), mode):
+        return fig
+    if not any(trace.type == 'scatter' for trace in fig.data):
+        return fig
+    traces = [_to_webgl(trace) if trace.type == 'scatter' else trace for trace in fig.data]
+    fig.data = []
+    fig.add_traces(traces)
+    return fig
@@ -0,0 +1,310 @@
+import streamlit as st
+
+# 공통 스타일 (사이드바 CSS와 버튼 간격 조정 스크립트)
+# 문자열은 모듈을 처음 불러올 때 한 번만 만들어지고, 매 실행에서는 apply_styles()로 전달만 한다.
+
+SIDEBAR_STYLE = """
+<style>
+    /* 사이드바 전체 스타일 - 미니멀하고 세련된 디자인 */
+    .css-1cypcdb, .css-1d391kg, [data-testid="stSidebar"] {
+        background: #f8f9fa !important;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
+        border-right: 1px solid #e9ecef !important;
+    }
+    
+    /* 사이드바 제목 스타일 */
+    [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
+        color: #2c3e50 !important;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
+        font-weight: 600 !important;
+        font-size: 16px !important;
+        margin-bottom: 8px !important;
+    }
+    
+    /* 사이드바 버튼 스타일 - 간격 완전 제거 (더 강력한 선택자) */
+    .stApp [data-testid="stSidebar"] .stButton,
+    .stApp [data-testid="stSidebar"] .stButton > div,
+    .stApp [data-testid="stSidebar"] .stButton > button,
+    [data-testid="stSidebar"] .stButton,
+    [data-testid="stSidebar"] .stButton > div,
+    [data-testid="stSidebar"] .stButton > button {
+        margin: 0 !important;
+        margin-top: 0 !important;
+        margin-bottom: 0 !important;
+        padding: 0 !important;
+        padding-top: 0 !important;
+        padding-bottom: 0 !important;
+        line-height: 1 !important;
+        gap: 0 !important;
+    }
+    
+    .stApp [data-testid="stSidebar"] .stButton > button {
+        background: transparent !important;
+        color: #2c3e50 !important;
+        border: none !important;
+        border-radius: 4px !important;
+        padding: 2px 6px !important;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
+        font-weight: 500 !important;
+        font-size: 12px !important;
+        transition: all 0.2s ease !important;
+        text-align: left !important;
+        justify-content: flex-start !important;
+        width: 100% !important;
+        margin: 0 !important;
+        margin-bottom: 0 !important;
+        margin-top: 0 !important;
+        box-shadow: none !important;
+        line-height: 1.1 !important;
+        min-height: 24px !important;
+        height: 24px !important;
+    }
+    
+    /* 모든 버튼 간격 완전 제거 - 더 강력한 선택자 */
+    .stApp [data-testid="stSidebar"] .stButton + .stButton,
+    .stApp [data-testid="stSidebar"] .stButton + *,
+    .stApp [data-testid="stSidebar"] * + .stButton,
+    [data-testid="stSidebar"] .stButton + .stButton,
+    [data-testid="stSidebar"] .stButton + *,
+    [data-testid="stSidebar"] * + .stButton {
+        margin-top: 0 !important;
+        margin-bottom: 0 !important;
+        padding-top: 0 !important;
+        padding-bottom: 0 !important;
+    }
+    
+    /* 컨테이너 간격도 제거 */
+    [data-testid="stSidebar"] .stContainer,
+    .stApp [data-testid="stSidebar"] .stContainer {
+        margin: 0 !important;
+        padding: 0 !important;
+        gap: 0 !important;
+    }
+    
+    /* 사이드바 전체 요소 간격 제거 */
+    [data-testid="stSidebar"] > div,
+    .stApp [data-testid="stSidebar"] > div {
+        gap: 0 !important;
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    /* Streamlit 기본 스타일 오버라이드 */
+    .stApp [data-testid="stSidebar"] .stButton {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    .stApp [data-testid="stSidebar"] .stButton > button {
+        margin: 0 !important;
+        padding: 2px 6px !important;
+        min-height: 24px !important;
+        height: 24px !important;
+    }
+    
+    [data-testid="stSidebar"] .stButton > button:hover {
+        background: #e9ecef !important;
+        color: #2c3e50 !important;
+        transform: none !important;
+        box-shadow: none !important;
+    }
+    
+    /* 선택된 버튼 스타일 */
+    [data-testid="stSidebar"] .stButton > button:focus {
+        background: #e9ecef !important;
+        color: #2c3e50 !important;
+        box-shadow: none !important;
+    }
+    
+    /* 사이드바 텍스트 스타일 */
+    [data-testid="stSidebar"] .stMarkdown {
+        color: #6c757d !important;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
+        font-size: 14px !important;
+        font-weight: 500 !important;
+        margin-bottom: 4px !important;
+    }
+    
+    /* 사이드바 구분선 스타일 */
+    [data-testid="stSidebar"] hr {
+        border: none !important;
+        border-top: 1px solid #e9ecef !important;
+        margin: 8px 0 !important;
+    }
+    
+    /* 사이드바 스크롤바 스타일 */
+    [data-testid="stSidebar"]::-webkit-scrollbar {
+        width: 6px;
+    }
+    
+    [data-testid="stSidebar"]::-webkit-scrollbar-track {
+        background: transparent;
+    }
+    
+    [data-testid="stSidebar"]::-webkit-scrollbar-thumb {
+        background: #dee2e6;
+        border-radius: 3px;
+    }
+    
+    [data-testid="stSidebar"]::-webkit-scrollbar-thumb:hover {
+        background: #adb5bd;
+    }
+    
+    /* 메뉴 아이콘 스타일 */
+    .menu-icon {
+        margin-right: 8px;
+        font-size: 16px;
+    }
+    
+    /* 모바일 최적화 */
+    @media screen and (max-width: 768px) {
+        /* 메인 컨테이너 모바일 최적화 */
+        .main .block-container {
+            padding-top: 1rem;
+            padding-bottom: 1rem;
+            padding-left: 0.5rem;
+            padding-right: 0.5rem;
+        }
+        
+        /* 차트 크기 모바일 최적화 */
+        .stPlotlyChart {
+            height: 300px !important;
+        }
+        
+        /* 메트릭 카드 모바일 최적화 */
+        .metric-container {
+            margin-bottom: 0.5rem;
+        }
+        
+        /* 버튼 모바일 최적화 */
+        .stButton > button {
+            font-size: 14px !important;
+            padding: 8px 12px !important;
+        }
+        
+        /* 사이드바 모바일 최적화 */
+        [data-testid="stSidebar"] {
+            width: 280px !important;
+        }
+        
+        /* 텍스트 모바일 최적화 */
+        .stMarkdown {
+            font-size: 14px !important;
+        }
+        
+        /* 테이블 모바일 최적화 */
+        .stDataFrame {
+            font-size: 12px !important;
+        }
+    }
+    
+    /* PWA 지원을 위한 메타 태그 */
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="theme-color" content="#1f77b4">
+    <meta name="apple-mobile-web-app-capable" content="yes">
+    <meta name="apple-mobile-web-app-status-bar-style" content="default">
+    <meta name="apple-mobile-web-app-title" content="Market Dashboard">
+</style>
+
+<script>
+// JavaScript로 직접 버튼 간격 제거 - 더 강력한 방법
+function removeButtonSpacing() {
+    // 모든 가능한 버튼 선택자
+    const selectors = [
+        '[data-testid="stSidebar"] .stButton',
+        '.stApp [data-testid="stSidebar"] .stButton',
+        '[data-testid="stSidebar"] .stButton > div',
+        '[data-testid="stSidebar"] .stButton > button',
+        '.stApp [data-testid="stSidebar"] .stButton > div',
+        '.stApp [data-testid="stSidebar"] .stButton > button'
+    ];
+    
+    selectors.forEach(selector => {
+        const elements = document.querySelectorAll(selector);
+        elements.forEach(function(element) {
+            element.style.setProperty('margin', '0px', 'important');
+            element.style.setProperty('margin-top', '0px', 'important');
+            element.style.setProperty('margin-bottom', '0px', 'important');
+            element.style.setProperty('padding', '0px', 'important');
+            element.style.setProperty('padding-top', '0px', 'important');
+            element.style.setProperty('padding-bottom', '0px', 'important');
+            element.style.setProperty('line-height', '1', 'important');
+            element.style.setProperty('gap', '0px', 'important');
+            
+            // 버튼 요소 특별 처리
+            if (element.tagName === 'BUTTON') {
+                element.style.setProperty('padding', '2px 6px', 'important');
+                element.style.setProperty('min-height', '24px', 'important');
+                element.style.setProperty('height', '24px', 'important');
+                element.style.setProperty('font-size', '12px', 'important');
+            }
+        });
+    });
+    
+    // 컨테이너 간격 제거
+    const containers = document.querySelectorAll('[data-testid="stSidebar"] .stContainer, .stApp [data-testid="stSidebar"] .stContainer');
+    containers.forEach(function(container) {
+        container.style.setProperty('margin', '0px', 'important');
+        container.style.setProperty('padding', '0px', 'important');
+        container.style.setProperty('gap', '0px', 'important');
+    });
+    
+    // 사이드바 전체 요소 간격 제거
+    const sidebarDivs = document.querySelectorAll('[data-testid="stSidebar"] > div, .stApp [data-testid="stSidebar"] > div');
+    sidebarDivs.forEach(function(element) {
+        element.style.setProperty('gap', '0px', 'important');
+        element.style.setProperty('margin', '0px', 'important');
+        element.style.setProperty('padding', '0px', 'important');
+    });
+    
+    // 강제로 CSS 스타일 추가
+    const existingStyle = document.getElementById('custom-sidebar-style');
+    if (existingStyle) {
+        existingStyle.remove();
+    }
+    
+    const style = document.createElement('style');
+    style.id = 'custom-sidebar-style';
+    style.textContent = `
+        .stApp [data-testid="stSidebar"] .stButton,
+        [data-testid="stSidebar"] .stButton {
+            margin: 0 !important;
+            padding: 0 !important;
+        }
+        .stApp [data-testid="stSidebar"] .stButton > button,
+        [data-testid="stSidebar"] .stButton > button {
+            margin: 0 !important;
+            padding: 2px 6px !important;
+            min-height: 24px !important;
+            height: 24px !important;
+            font-size: 12px !important;
+        }
+        .stApp [data-testid="stSidebar"] .stContainer,
+        [data-testid="stSidebar"] .stContainer {
+            margin: 0 !important;
+            padding: 0 !important;
+            gap: 0 !important;
+        }
+    `;
+    document.head.appendChild(style);
+}
+
+// 페이지 로드 시 실행
+document.addEventListener('DOMContentLoaded', removeButtonSpacing);
+
+// Streamlit이 동적으로 추가하는 요소들 처리
+const observer = new MutationObserver(removeButtonSpacing);
+observer.observe(document.body, {
+    childList: true,
+    subtree: true
+});
+
+// 주기적으로도 실행
+setInterval(removeButtonSpacing, 500);
+</script>
+"""
+
+
+def apply_styles():
+    """사이드바 스타일 적용 (Streamlit은 실행마다 다시 그려야 유지됨)"""
+    st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
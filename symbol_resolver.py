@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from config import DATA_DIR
+
+# 대체 티커 체인(VVIX, SDEX, MOVE 등) 해석기
+# 체인마다 실제로 데이터가 나온 심볼을 기억해 다음 조회부터 바로 사용하고,
+# 데이터가 없던 심볼은 일정 시간 동안 다시 시도하지 않는다 (negative cache).
+# 상태는 DATA_DIR/symbols.json 에 저장되어 재시작 후에도 유지된다.
+# 조회 오류(타임아웃 등 일시적인 실패)와 사용 중인 심볼의 빈 결과는 짧은 시간만 건너뛰고,
+# 이 재시도 대기 상태는 프로세스 메모리에만 둔다.
+
+STATE_PATH = os.path.join(DATA_DIR, 'symbols.json')
+
+# 데이터가 없던 심볼을 다시 시도하지 않는 시간 (초)
+DEAD_SYMBOL_TTL = int(os.getenv('SYMBOL_DEAD_TTL', str(6 * 60 * 60)))
+
+# 조회 오류 또는 사용 중인 심볼의 빈 결과 후 다시 시도하기까지의 시간 (초)
+RETRY_SYMBOL_TTL = int(os.getenv('SYMBOL_RETRY_TTL', str(5 * 60)))
+
+_lock = threading.Lock()
+_state = None  # {'working': {chain: symbol}, 'dead': {symbol: expires_at}}
+_retry = {}  # symbol -> retry_at (일시적인 실패, 저장하지 않음)
+
+
+def _load_state():
+    global _state
+    if _state is None:
+        try:
+            with open(STATE_PATH, 'r', encoding='utf-8') as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+        _state.setdefault('working', {})
+        _state.setdefault('dead', {})
+    return _state
+
+
+def _save_state():
+    try:
+        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+        tmp_path = STATE_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_state, f)
+        os.replace(tmp_path, STATE_PATH)
+    except OSError as e:
+        print(f"심볼 상태 저장 실패: {e}")
+
+
+def _is_empty(data):
+    if data is None:
+        return True
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.empty
+    return False
+
+
+def _is_dead(state, symbol, now):
+    expires_at = state['dead'].get(symbol)
+    if expires_at is None:
+        return False
+    if expires_at <= now:
+        del state['dead'][symbol]
+        return False
+    return True
+
+
+def _is_waiting(symbol, now):
+    retry_at = _retry.get(symbol)
+    if retry_at is None:
+        return False
+    if retry_at <= now:
+        del _retry[symbol]
+        return False
+    return True
+
+
+def resolve_symbol(chain, candidates):
+    """[(심볼, 조회 함수)] 중 데이터가 나오는 첫 심볼의 (심볼, 데이터) 반환, 없으면 (None, None)"""
+    with _lock:
+        state = _load_state()
+        now = time.time()
+        working = state['working'].get(chain)
+        # 마지막으로 성공한 심볼을 먼저, 최근 실패한 심볼은 건너뜀
+        ordered = sorted(candidates, key=lambda c: c[0] != working)
+        ordered = [c for c in ordered if not _is_dead(state, c[0], now) and not _is_waiting(c[0], now)]
+
+    for symbol, loader in ordered:
+        failed = False
+        try:
+            data = loader()
+        except Exception as e:
+            print(f"{chain} 심볼 {symbol} 조회 실패: {e}")
+            data = None
+            failed = True
+
+        with _lock:
+            if _is_empty(data):
+                if failed or state['working'].get(chain) == symbol:
+                    # 일시적인 실패일 수 있으므로 사용 중인 심볼은 유지하고 잠시 후 다시 시도
+                    _retry[symbol] = time.time() + RETRY_SYMBOL_TTL
+                else:
+                    state['dead'][symbol] = time.time() + DEAD_SYMBOL_TTL
+                    _save_state()
+                continue
+            _retry.pop(symbol, None)
+            if state['working'].get(chain) != symbol:
+                state['working'][chain] = symbol
+                _save_state()
+        return symbol, data
+
+    return None, None
+
+
+def symbol_state():
+    """체인별 사용 중인 심볼과 재시도 대기 중인 심볼 (모니터링용)"""
+    with _lock:
+        state = _load_state()
+        now = time.time()
+        rows = [{'Symbol': symbol, 'Status': 'working', 'Chain': chain, 'Retry In (min)': None}
+                for chain, symbol in sorted(state['working'].items())]
+        rows += [{'Symbol': symbol, 'Status': 'dead', 'Chain': None,
+                  'Retry In (min)': round((expires_at - now) / 60, 1)}
+                 for symbol, expires_at in sorted(state['dead'].items()) if expires_at > now]
+        rows += [{'Symbol': symbol, 'Status': 'retry', 'Chain': None,
+                  'Retry In (min)': round((retry_at - now) / 60, 1)}
+                 for symbol, retry_at in sorted(_retry.items()) if retry_at > now]
+    return pd.DataFrame(rows, columns=['Symbol', 'Status', 'Chain', 'Retry In (min)'])
+
+
+def clear_symbol_state(chain=None):
+    """기억한 심볼 초기화 (chain 지정 시 해당 체인의 사용 심볼만)"""
+    with _lock:
+        state = _load_state()
+        if chain is None:
+            state['working'].clear()
+            state['dead'].clear()
+            _retry.clear()
+        else:
+            state['working'].pop(chain, None)
+        _save_state()
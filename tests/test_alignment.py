@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alignment import align, normalize, normalize_index
+
+
+def test_daily_index_becomes_local_dates():
+    index = pd.DatetimeIndex(['2024-06-13 00:00', '2024-06-14 00:00'], tz='Asia/Seoul')
+    result = normalize_index(index)
+    assert result.tz is None
+    assert list(result) == list(pd.to_datetime(['2024-06-13', '2024-06-14']))
+
+
+def test_intraday_index_becomes_utc():
+    index = pd.DatetimeIndex(['2024-06-13 09:30', '2024-06-13 10:30'], tz='America/New_York')
+    result = normalize_index(index)
+    assert str(result.tz) == 'UTC'
+    assert result[0] == pd.Timestamp('2024-06-13 13:30', tz='UTC')
+
+
+def test_naive_intraday_index_needs_timezone():
+    index = pd.DatetimeIndex(['2024-06-13 09:30', '2024-06-13 10:30'])
+    with pytest.raises(ValueError):
+        normalize_index(index)
+    assert normalize_index(index, tz='America/New_York')[0] == pd.Timestamp('2024-06-13 13:30', tz='UTC')
+
+
+def test_align_mixed_naive_and_aware_intraday():
+    aware = pd.Series([1.0, 2.0], index=pd.DatetimeIndex(['2024-06-13 13:30', '2024-06-13 14:30'], tz='UTC'))
+    naive = pd.Series([10.0, 20.0], index=pd.DatetimeIndex(['2024-06-13 09:30', '2024-06-13 10:30']))
+    panel = align({'a': aware, 'b': naive}, tz={'b': 'America/New_York'})
+    assert panel.to_dict('list') == {'a': [1.0, 2.0], 'b': [10.0, 20.0]}
+
+
+def test_normalize_sorts_and_keeps_last_duplicate():
+    data = pd.Series([1.0, 2.0, 3.0], index=pd.to_datetime(['2024-01-03', '2024-01-02', '2024-01-03']))
+    result = normalize(data)
+    assert list(result.index) == list(pd.to_datetime(['2024-01-02', '2024-01-03']))
+    assert result.tolist() == [2.0, 3.0]
+
+
+def _series(dates, values):
+    return pd.Series(values, index=pd.to_datetime(dates), dtype=float)
+
+
+def test_align_inner_outer():
+    a = _series(['2024-01-02', '2024-01-03', '2024-01-04'], [1, 2, 3])
+    b = _series(['2024-01-03', '2024-01-05'], [10, 20])
+    inner = align({'a': a, 'b': b})
+    assert list(inner.index) == [pd.Timestamp('2024-01-03')]
+    outer = align({'a': a, 'b': b}, how='outer')
+    assert len(outer) == 4
+    assert np.isnan(outer.loc['2024-01-05', 'a'])
+
+
+def test_align_asof_with_tolerance():
+    a = _series(['2024-01-02', '2024-01-03', '2024-01-10'], [1, 2, 3])
+    b = _series(['2024-01-01'], [10])
+    panel = align({'a': a, 'b': b}, how='asof', tolerance=pd.Timedelta(days=3))
+    assert panel['b'].tolist()[:2] == [10.0, 10.0]
+    assert np.isnan(panel['b'].iloc[2])
+
+
+def test_align_skips_empty_and_rejects_unknown_method():
+    a = _series(['2024-01-02'], [1])
+    assert list(align({'a': a, 'b': None}).columns) == ['a']
+    with pytest.raises(ValueError):
+        align({'a': a}, how='left')
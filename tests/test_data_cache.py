@@ -0,0 +1,107 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_cache
+from data_cache import DataCache, SingleFlight, _estimate_size, cached
+
+
+def test_estimate_size_counts_dict_values():
+    frame = pd.DataFrame({'Close': np.arange(100_000, dtype=float)})
+    bundle = {'candles': frame, 'returns': frame['Close'], 'volatility_drop': None}
+    assert _estimate_size(bundle) >= _estimate_size(frame) + _estimate_size(frame['Close'])
+
+
+def test_estimate_size_counts_nested_tuples():
+    frame = pd.DataFrame({'Close': np.arange(100_000, dtype=float)})
+    assert _estimate_size((frame, [frame])) >= 2 * _estimate_size(frame)
+
+
+@pytest.fixture
+def serving():
+    """페이지 실행처럼 오래된 데이터 반환 허용 (끝나면 해제)"""
+    state = data_cache.begin_stale_serving()
+    yield state
+    data_cache.end_stale_serving()
+
+
+def test_lru_evicts_oldest_over_budget():
+    cache = DataCache(max_bytes=3 * _estimate_size(pd.Series(np.zeros(1000))))
+    for name in 'abcd':
+        cache.put(name, pd.Series(np.zeros(1000)), 'test', ttl=60)
+    assert cache.get('a', 'test') == (False, None)
+    assert cache.get('d', 'test')[0]
+
+
+def test_expired_entry_is_kept_for_stale_reads():
+    cache = DataCache(max_bytes=1 << 20)
+    cache.put('a', 1, 'test', ttl=-1)
+    assert cache.get('a', 'test') == (False, None)
+    assert cache.get_stale('a')[0] == 1
+
+
+def test_cached_returns_copies():
+    @cached('test_copy')
+    def load():
+        return pd.Series([1.0, 2.0])
+
+    data_cache.clear_cache('test_copy')
+    first = load()
+    first.iloc[0] = 100.0
+    assert load().iloc[0] == 1.0
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do(('test', 'k'), slow))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+    assert results == ['value'] * 4
+
+
+def test_values_from_stale_inputs_are_not_cached(serving):
+    release = threading.Event()
+    calls = {'first': 0, 'second': 0}
+
+    def stale_input():
+        # 두 함수가 같은 입력을 읽음 -> 같은 갱신 future를 공유
+        assert data_cache.revalidate(('test', 'shared-input'), 100.0, release.wait, 5)
+        return 1
+
+    @cached('test_stale')
+    def first():
+        calls['first'] += 1
+        return stale_input()
+
+    @cached('test_stale')
+    def second():
+        calls['second'] += 1
+        return stale_input()
+
+    data_cache.clear_cache('test_stale')
+    try:
+        first()
+        second()
+        second()
+        # 갱신 future가 이미 진행 중이어도 오래된 입력으로 계산한 값은 캐시하지 않음
+        assert calls == {'first': 1, 'second': 2}
+        assert len(serving.pending) == 1
+    finally:
+        release.set()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from date_buckets import aggregate, candle_freq, period_end, resample_ohlcv
+
+
+def test_period_end():
+    index = pd.DatetimeIndex(['2024-01-03', '2024-02-29', '2024-05-15', '2024-12-31'])
+    assert list(period_end(index, 'W')) == list(pd.to_datetime(['2024-01-05', '2024-03-01', '2024-05-17', '2025-01-03']))
+    assert list(period_end(index, 'M')) == list(pd.to_datetime(['2024-01-31', '2024-02-29', '2024-05-31', '2024-12-31']))
+    assert list(period_end(index, 'Q')) == list(pd.to_datetime(['2024-03-31', '2024-03-31', '2024-06-30', '2024-12-31']))
+    assert list(period_end(index, 'A')) == list(pd.to_datetime(['2024-12-31'] * 4))
+
+
+def test_period_end_fiscal_year_and_timezone():
+    index = pd.DatetimeIndex(['2024-01-03 00:00', '2024-07-01 00:00'], tz='America/New_York')
+    # 회계연도가 6월에 끝나면 분기 말은 9/12/3/6월
+    assert list(period_end(index, 'Q', fiscal_year_end=6)) == list(pd.to_datetime(['2024-03-31', '2024-09-30']))
+    assert list(period_end(index, 'A', fiscal_year_end=6)) == list(pd.to_datetime(['2024-06-30', '2025-06-30']))
+
+
+def test_period_end_custom_calendar():
+    ends = pd.to_datetime(['2024-01-27', '2024-02-24', '2024-03-30'])
+    index = pd.DatetimeIndex(['2024-01-27', '2024-01-28', '2024-03-01'])
+    assert list(period_end(index, ends)) == list(pd.to_datetime(['2024-01-27', '2024-02-24', '2024-03-30']))
+    with pytest.raises(ValueError):
+        period_end(pd.DatetimeIndex(['2024-04-01']), ends)
+
+
+def test_aggregate_labels_by_period_end():
+    data = pd.Series([1.0, 2.0, 3.0], index=pd.to_datetime(['2024-01-02', '2024-01-31', '2024-02-01']))
+    result = aggregate(data, 'M', 'sum')
+    assert list(result.index) == list(pd.to_datetime(['2024-01-31', '2024-02-29']))
+    assert result.tolist() == [3.0, 3.0]
+
+
+def _daily(start, end):
+    index = pd.bdate_range(start, end)
+    close = np.arange(len(index), dtype=float) + 100
+    return pd.DataFrame({'Open': close - 1, 'High': close + 2, 'Low': close - 2, 'Close': close, 'Volume': 1.0},
+                        index=index)
+
+
+def test_resample_ohlcv():
+    data = _daily('2024-01-01', '2024-01-12')
+    weekly = resample_ohlcv(data, 'W')
+    assert list(weekly.index) == list(pd.to_datetime(['2024-01-05', '2024-01-12']))
+    first_week = data.iloc[:5]
+    assert weekly.iloc[0].to_dict() == {
+        'Open': first_week['Open'].iloc[0], 'High': first_week['High'].max(), 'Low': first_week['Low'].min(),
+        'Close': first_week['Close'].iloc[-1], 'Volume': 5.0,
+    }
+    assert resample_ohlcv(data, 'D') is data
+
+
+@pytest.mark.parametrize('start, expected', [
+    ('2025-01-01', 'D'),    # 1년
+    ('2023-01-01', 'W'),    # 3년
+    ('2010-01-01', 'M'),    # 약 16년
+    ('1990-01-01', 'Q'),    # 약 36년
+    ('1927-12-30', 'A'),    # ^GSPC MAX
+])
+def test_candle_freq_stays_within_budget(start, expected):
+    data = _daily(start, '2025-12-31')
+    freq = candle_freq(data.index, 300)
+    assert freq == expected
+    assert len(resample_ohlcv(data, freq)) <= 300
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import downsample
+
+
+def _random_walk(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('1950-01-03', periods=n, freq='B')
+    return pd.Series(1000 + rng.standard_normal(n).cumsum(), index=index)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_default_keeps_extremes(seed):
+    series = _random_walk(seed=seed)
+    reduced = downsample.downsample(series, points=1500)
+
+    assert len(reduced) <= 1500 + 2
+    assert reduced.max() == series.max()
+    assert reduced.min() == series.min()
+    assert reduced.index[0] == series.index[0]
+    assert reduced.index[-1] == series.index[-1]
+
+
+def test_short_series_unchanged():
+    series = _random_walk(n=100)
+    assert downsample.downsample(series, points=1500) is series
+
+
+def test_drops_nan():
+    series = _random_walk(n=5000)
+    series.iloc[::7] = np.nan
+    assert not downsample.downsample(series, points=500).isna().any()
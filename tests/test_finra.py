@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from finra import parse_margin_table
+
+
+def _html(rows):
+    cells = ''.join(f'<tr><td>{date}</td><td>{value}</td></tr>' for date, value in rows)
+    return f'<html><body><table><tr><th>Month/Year</th><th>Debit Balances</th></tr>{cells}</table></body></html>'
+
+
+@pytest.mark.parametrize('rows, expected', [
+    # M/YYYY
+    ([('2/2025', '1,100'), ('1/2025', '1,000')], ['2025-01-01', '2025-02-01']),
+    # M/D/YYYY
+    ([('1/31/2025', '1,000')], ['2025-01-31']),
+    # '/'가 없는 월-연도 형식
+    ([('Jan-25', '1,000'), ('Feb-25', '1,100')], ['2025-01-01', '2025-02-01']),
+    ([('Jan-2025', '1,000')], ['2025-01-01']),
+    # 형식이 섞인 표
+    ([('Jan-25', '1,000'), ('2/2025', '1,100'), ('3/31/2025', '1,200')],
+     ['2025-01-01', '2025-02-01', '2025-03-31']),
+])
+def test_parse_margin_table_dates(rows, expected):
+    table = parse_margin_table(_html(rows))
+    assert list(table.index) == list(pd.to_datetime(expected))
+    assert table.index.name == 'Date'
+
+
+def test_parse_margin_table_values():
+    table = parse_margin_table(_html([('Jan-25', '$1,234,567'), ('Feb-25', 'n/a')]))
+    assert table['Margin_Debt'].tolist() == [1234567.0]
+
+
+def test_parse_margin_table_empty():
+    assert parse_margin_table('<html><body><p>no table</p></body></html>').empty
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+import fred_mirror
+from fred_mirror import SeriesNotFound, get_fred_series, sync_series
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status_code=200, text=''):
+        self.payload = payload
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return self.payload
+
+
+class FakeFRED:
+    """FRED REST API 대역 (series / series/observations)"""
+
+    def __init__(self, observations, last_updated='2024-01-05 07:00:00-06'):
+        self.observations = observations  # [(date, value)]
+        self.last_updated = last_updated
+        self.requests = []
+
+    def get(self, host, url, params=None, **kwargs):
+        assert host == 'fred'
+        path = url.rsplit('/fred/', 1)[1]
+        self.requests.append((path, params.get('observation_start')))
+        if params['series_id'] == 'MISSING':
+            return FakeResponse(status_code=400, text='Bad Request.  The series does not exist.')
+        if path == 'series':
+            return FakeResponse({'seriess': [{'last_updated': self.last_updated, 'frequency_short': 'D'}]})
+        start = params.get('observation_start')
+        rows = [{'date': date, 'value': value} for date, value in self.observations if start is None or date >= start]
+        return FakeResponse({'observations': rows})
+
+
+@pytest.fixture
+def fred(tmp_path, monkeypatch):
+    fake = FakeFRED([('2024-01-02', '4.0'), ('2024-01-03', '.'), ('2024-01-04', '4.2')])
+    monkeypatch.setattr(fred_mirror, 'MIRROR_DIR', str(tmp_path))
+    monkeypatch.setattr(fred_mirror, 'OFFLINE', False)
+    monkeypatch.setattr(fred_mirror.http_client, 'get', fake.get)
+    return fake
+
+
+def test_full_sync_converts_missing_values(fred):
+    series = sync_series('DGS10')
+    assert list(series.index) == list(pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04']))
+    assert series.iloc[0] == 4.0 and pd.isna(series.iloc[1])
+    assert fred.requests == [('series', None), ('series/observations', None)]
+    assert fred_mirror.load_meta('DGS10')['last_updated'] == fred.last_updated
+    pd.testing.assert_series_equal(fred_mirror.load_series('DGS10'), series, check_freq=False)
+
+
+def test_unchanged_series_skips_observations(fred):
+    sync_series('DGS10')
+    fred.requests.clear()
+    sync_series('DGS10')
+    assert fred.requests == [('series', None)]
+
+
+def test_revised_series_fetches_recent_window(fred):
+    sync_series('DGS10')
+    fred.requests.clear()
+    fred.last_updated = '2024-01-06 07:00:00-06'
+    fred.observations = [('2024-01-02', '4.0'), ('2024-01-03', '4.1'), ('2024-01-04', '4.3'), ('2024-01-05', '4.4')]
+    series = sync_series('DGS10')
+    # 마지막 관측치(2024-01-04)에서 일별 수정 구간(30일)만큼 앞에서부터 다시 받음
+    assert fred.requests == [('series', None), ('series/observations', '2023-12-05')]
+    assert series.tolist() == [4.0, 4.1, 4.3, 4.4]
+
+
+def test_get_fred_series_slices_inclusive_and_uses_mirror(fred):
+    series = get_fred_series('DGS10', start='2024-01-03', end='2024-01-04')
+    assert list(series.index) == list(pd.to_datetime(['2024-01-03', '2024-01-04']))
+    fred.requests.clear()
+    get_fred_series('DGS10')
+    assert fred.requests == []
+
+
+def test_sync_failure_falls_back_to_mirror(fred, monkeypatch):
+    sync_series('DGS10')
+
+    def fail(*args, **kwargs):
+        raise ConnectionError('down')
+
+    monkeypatch.setattr(fred_mirror.http_client, 'get', fail)
+    assert len(get_fred_series('DGS10', max_age=0)) == 3
+
+
+def test_missing_series(fred, monkeypatch):
+    with pytest.raises(SeriesNotFound):
+        get_fred_series('MISSING')
+    assert get_fred_series('MISSING', missing_ok=True).empty
+
+    monkeypatch.setattr(fred_mirror, 'OFFLINE', True)
+    with pytest.raises(ValueError):
+        get_fred_series('DGS10')
+    assert fred.requests == [('series', None), ('series', None)]
@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+import http_client
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """응답(또는 예외)을 차례로 돌려주는 세션"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url, timeout, kwargs))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def client(monkeypatch):
+    sleeps = []
+    throttled = []
+    monkeypatch.setattr(http_client, 'HTTP2', False)
+    monkeypatch.setattr(http_client, '_TRANSIENT_ERRORS', (requests.ConnectionError, requests.Timeout))
+    monkeypatch.setattr(http_client, 'throttle', throttled.append)
+    monkeypatch.setattr(http_client.time, 'sleep', sleeps.append)
+
+    def use(results):
+        session = FakeSession(results)
+        monkeypatch.setattr(http_client, 'get_session', lambda host: session)
+        return session
+
+    use.sleeps = sleeps
+    use.throttled = throttled
+    return use
+
+
+def test_passes_arguments_and_default_timeout(client):
+    session = client([FakeResponse(200)])
+    response = http_client.get('fred', 'https://example.com', params={'a': 1})
+    assert response.status_code == 200
+    assert session.calls == [('GET', 'https://example.com',
+                              (http_client.CONNECT_TIMEOUT, http_client.READ_TIMEOUT), {'params': {'a': 1}})]
+    assert client.throttled == ['fred']
+    assert client.sleeps == []
+
+
+def test_retries_transient_errors_and_status(client):
+    session = client([requests.ConnectionError('reset'), FakeResponse(503), FakeResponse(200)])
+    response = http_client.get('krx', 'https://example.com', retries=3)
+    assert response.status_code == 200
+    assert len(session.calls) == 3
+    # 재시도마다 속도 제한 적용
+    assert client.throttled == ['krx'] * 3
+    assert len(client.sleeps) == 2
+    assert all(0 <= wait <= http_client.BACKOFF_MAX for wait in client.sleeps)
+
+
+def test_returns_last_response_or_raises_after_retries(client):
+    client([FakeResponse(503), FakeResponse(502)])
+    assert http_client.get('finra', 'https://example.com', retries=1).status_code == 502
+
+    client([requests.Timeout('slow'), requests.Timeout('slow')])
+    with pytest.raises(requests.Timeout):
+        http_client.get('finra', 'https://example.com', retries=1)
+
+
+def test_does_not_retry_client_errors(client):
+    session = client([FakeResponse(404), FakeResponse(200)])
+    assert http_client.get('fred', 'https://example.com').status_code == 404
+    assert len(session.calls) == 1
+
+
+def test_backoff_prefers_retry_after(monkeypatch):
+    assert http_client._backoff(0, FakeResponse(429, {'Retry-After': '3'})) == 3.0
+    assert http_client._backoff(0, FakeResponse(429, {'Retry-After': '120'})) == http_client.BACKOFF_MAX
+    monkeypatch.setattr(http_client.random, 'uniform', lambda low, high: high)
+    assert http_client._backoff(0) == http_client.BACKOFF_BASE
+    assert http_client._backoff(2) == http_client.BACKOFF_BASE * 4
+    assert http_client._backoff(10) == http_client.BACKOFF_MAX
+
+
+def test_session_is_shared_per_host():
+    assert http_client.get_session('test-a') is http_client.get_session('test-a')
+    assert http_client.get_session('test-a') is not http_client.get_session('test-b')
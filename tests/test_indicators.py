@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators import evaluate, indicator, parse_formula
+
+
+def _series(values, start='2024-01-02'):
+    return pd.Series(values, index=pd.bdate_range(start, periods=len(values)), dtype=float)
+
+
+def test_parse_formula_names():
+    _, names = parse_formula('pct_change(HYG / TLT) * 10000')
+    assert names == ('HYG', 'TLT')
+
+
+@pytest.mark.parametrize('formula', [
+    '__import__("os")',
+    'VIX.real',
+    'VIX[0]',
+    'max(VIX)',
+    'pct_change(VIX, 2)',
+])
+def test_rejects_unsafe_formulas(formula):
+    with pytest.raises(ValueError):
+        parse_formula(formula)
+
+
+def test_evaluate_aligns_inputs():
+    vvix = _series([100, 110, 120, 130])
+    vix = _series([20, 22, 24], start='2024-01-03')
+    result = indicator('VVIX/VIX', {'VVIX': vvix, 'VIX': vix})
+    assert result.name == 'VVIX/VIX'
+    assert list(result.index) == list(vix.index)
+    assert result.tolist() == [110 / 20, 120 / 22, 130 / 24]
+
+
+def test_evaluate_functions_and_constants():
+    hyg = _series([100, 101, 99])
+    tlt = _series([100, 100, 100])
+    result = indicator('HYG/TLT', {'HYG': hyg, 'TLT': tlt})
+    assert np.isnan(result.iloc[0])
+    assert result.iloc[1:].tolist() == pytest.approx([100.0, -198.0198], rel=1e-4)
+    assert evaluate('-abs(VIX) + 1', {'VIX': _series([-2, 3])}).tolist() == [-1.0, -2.0]
+
+
+def test_missing_input():
+    with pytest.raises(KeyError):
+        evaluate('BAA10Y - DGS10', {'BAA10Y': _series([1, 2])})
+
+
+def test_results_are_cached_by_input_content():
+    a = _series([1, 2, 3])
+    b = _series([1, 1, 1])
+    first = evaluate('A + B', {'A': a, 'B': b})
+    first.iloc[0] = 100.0
+    # 캐시에서 꺼낸 값은 복사본 (호출자가 수정해도 캐시는 그대로)
+    assert evaluate('A + B', {'A': a.copy(), 'B': b.copy()}).tolist() == [2.0, 3.0, 4.0]
+    assert evaluate('A + B', {'A': a * 2, 'B': b}).tolist() == [3.0, 5.0, 7.0]
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(indicators, 'CACHE_MAX_ENTRIES', 2)
+    for i in range(5):
+        evaluate('A * 2', {'A': _series([i, i + 1])})
+    assert len(indicators._cache) <= 2
@@ -0,0 +1,58 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import krx
+
+
+class FakeKRX:
+    """KRXOptionAPI 대체: 요청한 날짜를 기록하고, empty_days는 빈 결과 반환"""
+
+    def __init__(self, empty_days=()):
+        self.empty_days = set(empty_days)
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def get_put_call_ratio(self, date):
+        with self._lock:
+            self.requested.append(date)
+        if date in self.empty_days:
+            return pd.DataFrame()
+        return pd.DataFrame({'PC_RATIO': [float(date[-2:])]})
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(krx, 'KRX_DIR', str(tmp_path))
+
+
+def test_past_days_are_requested_once():
+    api = FakeKRX(empty_days={'20240610'})
+    first = krx.get_put_call_ratio_days(api, '2024-06-03', '2024-06-14')
+
+    # 6/6 현충일은 요청하지 않고, 데이터가 없던 6/10은 결과에서 제외
+    assert len(api.requested) == 9
+    assert '20240606' not in api.requested
+    assert pd.Timestamp('2024-06-10') not in set(first['Date'])
+    assert len(first) == 8
+
+    api.requested.clear()
+    second = krx.get_put_call_ratio_days(api, '2024-06-03', '2024-06-14')
+    assert api.requested == []
+    assert second.equals(first)
+
+
+def test_failed_days_are_retried():
+    class FailingKRX(FakeKRX):
+        def get_put_call_ratio(self, date):
+            super().get_put_call_ratio(date)
+            if date == '20240612':
+                raise TimeoutError('read timed out')
+            return pd.DataFrame({'PC_RATIO': [1.0]})
+
+    api = FailingKRX()
+    krx.get_put_call_ratio_days(api, '2024-06-10', '2024-06-14')
+    api.requested.clear()
+    krx.get_put_call_ratio_days(api, '2024-06-10', '2024-06-14')
+    assert api.requested == ['20240612']
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+import pytz
+
+from market_calendar import (filter_trading_days, in_session, is_trading_day, last_closed_session, market_of,
+                             session_close, session_range, trading_days)
+
+NEW_YORK = pytz.timezone('America/New_York')
+SEOUL = pytz.timezone('Asia/Seoul')
+
+
+def _at(tz, text):
+    return tz.localize(datetime.strptime(text, '%Y-%m-%d %H:%M'))
+
+
+def test_is_trading_day():
+    dates = pd.to_datetime(['2024-07-04', '2024-07-05', '2024-07-06', '2024-06-06'])
+    assert is_trading_day(dates, 'NYSE').tolist() == [False, True, False, True]
+    assert is_trading_day(dates, 'KRX').tolist() == [True, True, False, False]
+    assert is_trading_day(pd.to_datetime(['2024-12-25', '2024-12-26']), 'FX').tolist() == [False, True]
+    with pytest.raises(ValueError):
+        is_trading_day(dates, 'LSE')
+
+
+def test_trading_days_and_filter():
+    days = trading_days('2024-11-25', '2024-12-01', 'NYSE')
+    assert [day.day for day in days] == [25, 26, 27, 29]
+
+    data = pd.Series(1.0, index=pd.date_range('2024-11-25', '2024-12-01', tz='America/New_York'))
+    assert len(filter_trading_days(data, 'NYSE')) == 4
+
+
+def test_session_range_and_close():
+    sessions = session_range('2024-06-13', '2024-06-14', 'NYSE')
+    assert sessions['Open'].iloc[0] == pd.Timestamp('2024-06-13 13:30', tz='UTC')
+    assert sessions['Close'].iloc[0] == pd.Timestamp('2024-06-13 20:00', tz='UTC')
+    assert session_close('2024-06-13', 'KRX') == _at(SEOUL, '2024-06-13 15:30')
+
+
+@pytest.mark.parametrize('market, tz, now, expected', [
+    ('NYSE', NEW_YORK, '2024-06-13 15:59', '2024-06-12'),
+    ('NYSE', NEW_YORK, '2024-06-13 16:00', '2024-06-13'),
+    ('NYSE', NEW_YORK, '2024-06-16 12:00', '2024-06-14'),    # 일요일
+    ('NYSE', NEW_YORK, '2024-07-05 08:00', '2024-07-03'),    # 7/4 휴장
+    ('KRX', SEOUL, '2024-06-07 10:00', '2024-06-05'),        # 6/6 현충일
+])
+def test_last_closed_session(market, tz, now, expected):
+    assert last_closed_session(market, _at(tz, now)) == pd.Timestamp(expected)
+
+
+@pytest.mark.parametrize('market, tz, now, expected', [
+    ('NYSE', NEW_YORK, '2024-06-13 09:29', False),
+    ('NYSE', NEW_YORK, '2024-06-13 09:30', True),
+    ('NYSE', NEW_YORK, '2024-06-13 16:00', False),
+    ('NYSE', NEW_YORK, '2024-07-04 12:00', False),
+    ('FX', NEW_YORK, '2024-06-16 16:59', False),    # 일요일 17:00 전
+    ('FX', NEW_YORK, '2024-06-16 17:00', True),
+    ('FX', NEW_YORK, '2024-06-14 17:00', False),    # 금요일 17:00 이후
+])
+def test_in_session(market, tz, now, expected):
+    assert in_session(market, _at(tz, now)) is expected
+
+
+def test_market_of():
+    assert market_of('^KS11') == 'KRX'
+    assert market_of('005930.KS') == 'KRX'
+    assert market_of('AUDUSD=X') == 'FX'
+    assert market_of('^GSPC') == 'NYSE'
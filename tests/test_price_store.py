@@ -0,0 +1,191 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import price_store
+
+NEW_YORK = 'America/New_York'
+
+# store 픽스처에서 바꾸기 전의 _up_to_date
+_original_up_to_date = price_store._up_to_date
+
+
+def _bars(end):
+    """2024-01-02부터 end까지의 일봉 (타임존 없는 날짜)"""
+    index = pd.bdate_range('2024-01-02', end, name='Date')
+    close = np.linspace(100.0, 200.0, len(index))
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': 1000.0, 'Dividends': 0.0, 'Stock Splits': 0.0,
+    }, index=index)
+
+
+class FakeYahoo:
+    """yfinance 대체: download()는 타임존 없는 인덱스, Ticker().history()는 타임존 있는 인덱스 반환"""
+
+    def __init__(self, bars):
+        self.bars = bars
+
+    def _range(self, start=None):
+        bars = self.bars
+        return bars if start is None else bars[bars.index >= pd.Timestamp(start).tz_localize(None)]
+
+    def download(self, tickers, interval='1d', start=None, period=None, **kwargs):
+        frames = {ticker: self._range(start) for ticker in tickers}
+        return pd.concat(frames, axis=1)
+
+    def Ticker(self, ticker):
+        fake = self
+
+        class _Ticker:
+            def history(self, period=None, start=None, interval='1d'):
+                bars = fake._range(start).copy()
+                bars.index = bars.index.tz_localize(NEW_YORK)
+                return bars
+
+        return _Ticker()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(price_store, 'STORE_DIR', str(tmp_path))
+    monkeypatch.setattr(price_store, 'throttle', lambda *args, **kwargs: 0)
+    monkeypatch.setattr(price_store, '_up_to_date', lambda *args: False)
+    today = pd.Timestamp.today().normalize()
+    return today
+
+
+def _expire(ticker):
+    old = time.time() - 10 * 24 * 60 * 60
+    os.utime(price_store._store_path(ticker, '1d'), (old, old))
+
+
+def test_batch_then_single_refresh(store, monkeypatch):
+    monkeypatch.setattr(price_store, 'yf', FakeYahoo(_bars(store - pd.Timedelta(days=10))))
+    price_store.get_histories(['^GSPC', '^VIX'], period='max')
+    _expire('^GSPC')
+
+    latest = _bars(store)
+    monkeypatch.setattr(price_store, 'yf', FakeYahoo(latest))
+    history = price_store.get_history('^GSPC', period='max', max_age=60)
+
+    assert history.index.tz is None
+    assert history.index[-1] == latest.index[-1]
+    assert price_store.history_age('^GSPC') < 60
+    assert not history.index.duplicated().any()
+
+
+def test_single_then_batch_refresh(store, monkeypatch):
+    monkeypatch.setattr(price_store, 'yf', FakeYahoo(_bars(store - pd.Timedelta(days=10))))
+    price_store.get_history('^GSPC', period='max')
+    _expire('^GSPC')
+
+    latest = _bars(store)
+    monkeypatch.setattr(price_store, 'yf', FakeYahoo(latest))
+    panel = price_store.get_histories(['^GSPC'], period='max', max_age=60)
+    stored = price_store.load_history('^GSPC')
+
+    assert stored.index.tz is None
+    assert stored.index[-1] == latest.index[-1]
+    assert len(price_store.panel_frame(panel, '^GSPC')) == len(latest)
+
+
+def _stored_at(ticker, history, fetched_at):
+    """history를 저장하고 저장(받은) 시각을 fetched_at으로 설정"""
+    price_store.save_history(ticker, history)
+    fetched = fetched_at.timestamp()
+    os.utime(price_store._store_path(ticker, '1d'), (fetched, fetched))
+
+
+@pytest.mark.parametrize('fetched_at, now, expected', [
+    # 장중(14:00)에 받은 당일 봉은 마감 이후에도 미완성 봉
+    ('2024-06-13 14:00', '2024-06-13 16:35', False),
+    ('2024-06-14 14:00', '2024-06-15 12:00', False),
+    # 마감 + 확정 여유 시간 이후에 받은 봉은 다음 세션 마감까지 그대로 사용
+    ('2024-06-13 16:20', '2024-06-13 16:35', True),
+    ('2024-06-14 16:30', '2024-06-16 12:00', True),
+])
+def test_up_to_date_requires_fetch_after_close(tmp_path, monkeypatch, fetched_at, now, expected):
+    monkeypatch.setattr(price_store, 'STORE_DIR', str(tmp_path))
+    fetched_at = pd.Timestamp(fetched_at, tz=NEW_YORK)
+    stored = _bars(fetched_at.tz_localize(None).normalize())
+    _stored_at('^GSPC', stored, fetched_at)
+
+    up_to_date = _original_up_to_date('^GSPC', '1d', stored, now=pd.Timestamp(now, tz=NEW_YORK).to_pydatetime())
+    assert up_to_date is expected
+
+
+@pytest.mark.parametrize('now, expected', [
+    ('2024-06-13 14:00', False),    # 장중
+    ('2024-06-13 16:05', False),    # 마감 직후 (확정 여유 시간 전)
+    ('2024-06-13 16:20', True),
+    ('2024-06-15 12:00', True),     # 주말
+])
+def test_past_settle(now, expected):
+    now = pd.Timestamp(now, tz=NEW_YORK).to_pydatetime()
+    assert price_store._past_settle('^GSPC', '1d', now=now) is expected
+
+
+def test_failed_fetch_does_not_mark_checked(tmp_path, monkeypatch):
+    monkeypatch.setattr(price_store, 'STORE_DIR', str(tmp_path))
+    stored = _bars('2024-06-13')
+    fetched_at = pd.Timestamp('2024-06-13 14:00', tz=NEW_YORK)
+    _stored_at('^GSPC', stored, fetched_at)
+
+    # 받지 못한 경우(None)와 확정 여유 시간 전의 빈 결과는 확인 시각을 기록하지 않음
+    monkeypatch.setattr(price_store, '_past_settle', lambda *args: False)
+    price_store._apply_delta('^GSPC', '1d', stored, None)
+    price_store._apply_delta('^GSPC', '1d', stored, stored.iloc[:0])
+    assert os.path.getmtime(price_store._store_path('^GSPC', '1d')) == fetched_at.timestamp()
+
+    monkeypatch.setattr(price_store, '_past_settle', lambda *args: True)
+    price_store._apply_delta('^GSPC', '1d', stored, None)
+    assert os.path.getmtime(price_store._store_path('^GSPC', '1d')) == fetched_at.timestamp()
+    price_store._apply_delta('^GSPC', '1d', stored, stored.iloc[:0])
+    assert os.path.getmtime(price_store._store_path('^GSPC', '1d')) > fetched_at.timestamp()
+
+
+class FakeIntradayYahoo:
+    """분봉 yfinance 대체: download()는 UTC 시각(ignore_tz=False), Ticker().history()는 거래소 현지 시각 반환"""
+
+    def __init__(self, end):
+        self.bars = _bars(end)
+        self.bars.index = (self.bars.index + pd.Timedelta(hours=10)).tz_localize(NEW_YORK)
+
+    def _range(self, start=None):
+        bars = self.bars
+        return bars if start is None else bars[bars.index >= pd.Timestamp(start).tz_convert(NEW_YORK)]
+
+    def download(self, tickers, interval='1d', start=None, period=None, ignore_tz=False, **kwargs):
+        assert not ignore_tz
+        frames = {ticker: self._range(pd.Timestamp(start, tz='UTC') if start else None) for ticker in tickers}
+        panel = pd.concat(frames, axis=1)
+        panel.index = panel.index.tz_convert('UTC')
+        return panel
+
+    def Ticker(self, ticker):
+        fake = self
+
+        class _Ticker:
+            def history(self, period=None, start=None, interval='1d'):
+                return fake._range(start)
+
+        return _Ticker()
+
+
+def test_intraday_batch_then_single_refresh(store, monkeypatch):
+    monkeypatch.setattr(price_store, 'yf', FakeIntradayYahoo(store - pd.Timedelta(days=10)))
+    price_store.get_histories(['^GSPC', '^VIX'], interval='60m')
+    old = time.time() - 10 * 24 * 60 * 60
+    os.utime(price_store._store_path('^GSPC', '60m'), (old, old))
+
+    latest = FakeIntradayYahoo(store)
+    monkeypatch.setattr(price_store, 'yf', latest)
+    history = price_store.get_history('^GSPC', interval='60m', max_age=60)
+
+    assert str(history.index.tz) == 'UTC'
+    assert history.index[-1] == latest.bars.index[-1]
+    assert not history.index.duplicated().any()
@@ -0,0 +1,45 @@
+import pytest
+
+import rate_limit
+from rate_limit import TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr(rate_limit.time, 'sleep', waited.append)
+    return waited
+
+
+def test_burst_does_not_wait(sleeps):
+    bucket = TokenBucket(rate=2.0, capacity=5)
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    assert sleeps == []
+
+
+def test_waits_when_burst_is_used(sleeps):
+    bucket = TokenBucket(rate=2.0, capacity=5)
+    for _ in range(5):
+        bucket.acquire()
+    assert bucket.acquire() == pytest.approx(0.5, abs=0.01)
+
+
+def test_bulk_request_charges_every_token(sleeps):
+    bucket = TokenBucket(rate=2.0, capacity=5)
+    # 30개 티커 일괄 다운로드: 버킷이 가득 차 있으면 바로 보내고 초과분 25개는 부채
+    assert bucket.acquire(30) == 0.0
+    assert bucket.tokens == pytest.approx(-25, abs=0.01)
+    # 다음 요청은 부채와 자기 몫까지 기다림 (26 토큰 / 초당 2)
+    assert bucket.acquire() == pytest.approx(13.0, abs=0.01)
+
+
+def test_bulk_request_waits_for_prior_debt(sleeps):
+    bucket = TokenBucket(rate=2.0, capacity=5)
+    bucket.acquire(10)
+    assert bucket.acquire(10) == pytest.approx(5.0, abs=0.01)
+
+
+def test_host_limit_env_override(monkeypatch):
+    monkeypatch.setenv('RATE_LIMIT_YAHOO', '0.5')
+    assert rate_limit._host_limit('yahoo') == (0.5, rate_limit.HOST_LIMITS['yahoo'][1])
+    assert rate_limit._host_limit('unknown') == rate_limit.DEFAULT_LIMIT
@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+import symbol_resolver
+
+DATA = pd.Series([1.0, 2.0])
+
+
+@pytest.fixture(autouse=True)
+def state(tmp_path, monkeypatch):
+    monkeypatch.setattr(symbol_resolver, 'STATE_PATH', str(tmp_path / 'symbols.json'))
+    monkeypatch.setattr(symbol_resolver, '_state', None)
+    monkeypatch.setattr(symbol_resolver, '_retry', {})
+
+
+def _timeout():
+    raise TimeoutError('read timed out')
+
+
+def test_empty_symbol_is_dead():
+    symbol, _ = symbol_resolver.resolve_symbol('VVIX', [('^VVIX', lambda: pd.Series(dtype=float)), ('VVIX', lambda: DATA)])
+    assert symbol == 'VVIX'
+    assert '^VVIX' in symbol_resolver._load_state()['dead']
+
+
+def test_error_on_working_symbol_keeps_it():
+    symbol_resolver.resolve_symbol('MOVE', [('^MOVE', lambda: DATA)])
+    symbol, data = symbol_resolver.resolve_symbol('MOVE', [('^MOVE', _timeout)])
+
+    assert (symbol, data) == (None, None)
+    state = symbol_resolver._load_state()
+    assert state['working']['MOVE'] == '^MOVE'
+    assert '^MOVE' not in state['dead']
+    assert '^MOVE' in symbol_resolver._retry
+
+
+def test_empty_working_symbol_retries_soon(monkeypatch):
+    symbol_resolver.resolve_symbol('SDEX', [('^SDEX', lambda: DATA)])
+    symbol_resolver.resolve_symbol('SDEX', [('^SDEX', lambda: pd.Series(dtype=float))])
+    assert symbol_resolver._load_state()['working']['SDEX'] == '^SDEX'
+    assert '^SDEX' not in symbol_resolver._load_state()['dead']
+
+    # 재시도 대기 시간이 지나면 다시 사용
+    monkeypatch.setattr(symbol_resolver, '_retry', {})
+    symbol, data = symbol_resolver.resolve_symbol('SDEX', [('^SDEX', lambda: DATA)])
+    assert symbol == '^SDEX'
+
+
+class _Response:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+def test_missing_candidates_are_dead_and_saved(tmp_path, monkeypatch):
+    import json
+
+    import fred_mirror
+    import http_client
+
+    # FRED에 없는 시리즈: 400 "The series does not exist."
+    monkeypatch.setattr(fred_mirror, 'MIRROR_DIR', str(tmp_path / 'fred'))
+    monkeypatch.setattr(fred_mirror, 'OFFLINE', False)
+    monkeypatch.setattr(http_client, 'get', lambda *args, **kwargs: _Response(
+        400, '{"error_code":400,"error_message":"Bad Request.  The series does not exist."}'))
+
+    candidates = [
+        # 상장 폐지된 Yahoo 티커: 컬럼 없는 빈 DataFrame
+        ('^MOVE', lambda: pd.DataFrame().get('Close')),
+        ('FRED:BAMLEMOVE', lambda: fred_mirror.get_fred_series('BAMLEMOVE', missing_ok=True)),
+    ]
+    assert symbol_resolver.resolve_symbol('move', candidates) == (None, None)
+
+    assert symbol_resolver._retry == {}
+    with open(symbol_resolver.STATE_PATH, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert set(saved['dead']) == {'^MOVE', 'FRED:BAMLEMOVE'}
+
+
+def test_fred_missing_series_raises_without_missing_ok(tmp_path, monkeypatch):
+    import fred_mirror
+    import http_client
+
+    monkeypatch.setattr(fred_mirror, 'MIRROR_DIR', str(tmp_path / 'fred'))
+    monkeypatch.setattr(fred_mirror, 'OFFLINE', False)
+    monkeypatch.setattr(http_client, 'get', lambda *args, **kwargs: _Response(
+        400, 'Bad Request.  The series does not exist.'))
+
+    with pytest.raises(fred_mirror.SeriesNotFound):
+        fred_mirror.get_fred_series('NOSUCHSERIES')
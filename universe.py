@@ -0,0 +1,66 @@
+# 대시보드가 조회하는 종목/시리즈 목록
+# 페이지와 백그라운드 미리 받기(prefetch.py)가 같은 목록을 사용한다.
+
+# 주요 지수 (Market Risk Dashboard I/II)
+MARKET_INDICES = ['^GSPC', '^DJI', '^IXIC', '^VIX', '^TNX', '^TYX']
+MARKET_INDEX_NAMES = ['S&P 500', 'Dow Jones', 'NASDAQ', 'VIX', '10Y Treasury', '30Y Treasury']
+
+# 소비재 ETF들
+CONSUMER_ETFS = {
+    'XLY': 'Consumer Discretionary Select Sector SPDR Fund',
+    'XLP': 'Consumer Staples Select Sector SPDR Fund',
+    'VCR': 'Vanguard Consumer Discretionary ETF',
+    'VDC': 'Vanguard Consumer Staples ETF',
+    'IYC': 'iShares U.S. Consumer Discretionary ETF',
+    'IYK': 'iShares U.S. Consumer Staples ETF'
+}
+
+# IT 하드웨어/소프트웨어 관련 ETF들
+IT_ETFS = {
+    'SOXX': 'iShares PHLX Semiconductor ETF',
+    'SOXL': 'Direxion Daily Semiconductor Bull 3X Shares',
+    'SOXS': 'Direxion Daily Semiconductor Bear 3X Shares',
+    'IGV': 'iShares Expanded Tech-Software Sector ETF',
+    'PSJ': 'Invesco Dynamic Software ETF',
+    'XLK': 'Technology Select Sector SPDR Fund',
+    'VGT': 'Vanguard Information Technology ETF',
+    'SMH': 'VanEck Vectors Semiconductor ETF'
+}
+
+# 상품 관련 ETF들
+COMMODITY_ETFS = {
+    'GLD': 'SPDR Gold Shares',
+    'IAU': 'iShares Gold Trust',
+    'FGDL': 'Franklin Responsibly Sourced Gold ETF',
+    'SLV': 'iShares Silver Trust',
+    'SIVR': 'abrdn Physical Silver Shares ETF',
+    'SIL': 'Global X Silver Miners ETF',
+    'COPX': 'Global X Copper Miners ETF',
+    'CPER': 'United States Copper Index Fund'
+}
+
+# 그 외 미국 시장 종목 (하이일드/국채 ETF, VVIX)
+US_EXTRA_TICKERS = ['HYG', 'TLT', 'JNK', 'HYEM', '^VVIX']
+
+# 한국 시장
+KRX_TICKERS = ['^KS11']
+
+# 환율
+FX_TICKERS = ['AUDUSD=X']
+
+# FRED 시리즈
+FRED_SERIES = [
+    'BAMLH0A0HYM2',  # ICE BofA US High Yield Index Option-Adjusted Spread
+    'BAA10Y',        # Moody's Baa - 10Y Treasury
+    'DGS10',         # US 10-Year Treasury
+    'DFF',           # Federal Funds Effective Rate
+    'SOFR',          # Secured Overnight Financing Rate
+    'T10YIE',        # 10-Year Breakeven Inflation Rate
+    'T5YIE',         # 5-Year Breakeven Inflation Rate
+    'CPROFIT',       # Corporate Profits After Tax
+    'MDTOTNS',       # FINRA Margin Debt Total
+]
+
+US_TICKERS = (MARKET_INDICES + list(CONSUMER_ETFS) + list(IT_ETFS) + list(COMMODITY_ETFS)
+              + US_EXTRA_TICKERS)
+ALL_TICKERS = US_TICKERS + KRX_TICKERS + FX_TICKERS